@@ -1,8 +1,20 @@
 import streamlit as st
-import asyncio
-from datetime import datetime
-import pandas as pd
-from query_action import DatabaseSearch, ResponseGeneration, ResponseReview, NewsChatbot
+from query_action import (
+    DatabaseSearch,
+    ResponseGeneration,
+    ResponseReview,
+    NewsChatbot,
+    format_health_status,
+    format_query_service_stats,
+    format_resilience_stats,
+    format_stats,
+)
+from async_runtime import BackgroundEventLoop
+from query_service import QueryRejected
+from refresh_daemon import format_refresh_status, load_refresh_status, refresh_warnings
+from chat_session import ChatSession
+from resilience import metrics
+from tracing import span_rows, tracer
 
 # 페이지 설정
 st.set_page_config(
@@ -40,17 +52,30 @@ st.markdown(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def get_runtime():
+    """모든 세션이 공유하는 백그라운드 이벤트 루프"""
+    return BackgroundEventLoop()
+
+
+@st.cache_resource(show_spinner="챗봇을 준비하는 중...")
+def get_chatbot():
+    """DB/검색/LLM 클라이언트를 가진 챗봇을 프로세스당 한 번만 생성하여 모든 세션이 공유
+
+    연결 확인과 SDK 로딩은 첫 화면을 막지 않도록 백그라운드 상태 점검에서 진행
+    """
+    chatbot = NewsChatbot()
+    chatbot.health.start()
+    return chatbot
+
+
 class StreamlitChatbot:
     def __init__(self):
-        # 세션 상태 초기화
-        if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
-        if "chatbot" not in st.session_state:
-            st.session_state.chatbot = NewsChatbot()
-        if "article_history" not in st.session_state:
-            st.session_state.article_history = []
-        if "search_history" not in st.session_state:
-            st.session_state.search_history = set()
+        # 세션에는 대화 기록 등 가벼운 사용자별 상태만 보관
+        self.chatbot = get_chatbot()
+        if "chat_session" not in st.session_state:
+            st.session_state.chat_session = ChatSession()
+        self.session = st.session_state.chat_session
 
     def setup_sidebar(self):
         """사이드바 설정"""
@@ -59,15 +84,48 @@ class StreamlitChatbot:
             st.write("연결된 데이터베이스:")
             st.info("MongoDB: 뉴스 기사 저장소\nElasticsearch: 검색 엔진")
 
+            st.header("🔎 기사 바로 찾기")
+            title_prefix = st.text_input(
+                "기사 제목으로 찾기",
+                placeholder="제목의 앞부분을 입력하세요",
+                label_visibility="collapsed",
+            )
+            if title_prefix:
+                suggestions = self.chatbot.db_search.suggest(title_prefix)
+                if suggestions:
+                    for suggestion in suggestions:
+                        st.markdown(f"• [{suggestion['title']}]({suggestion['url']})")
+                else:
+                    st.caption("일치하는 기사가 없습니다.")
+
             st.header("🔍 검색 히스토리")
-            if st.session_state.search_history:
-                for query in list(st.session_state.search_history)[-5:]:
-                    st.text(f"• {query}")
+            for query in self.session.recent_queries():
+                st.text(f"• {query}")
+
+            review_stats = self.chatbot.review_policy.stats()
+            st.caption(
+                f"답변 검토 모드(전체 사용자): {review_stats['mode']} · "
+                f"실행 {review_stats['reviewed']}회 / 생략 {review_stats['skipped']}회"
+            )
+            st.caption(f"상위 서비스: {format_resilience_stats(metrics.stats())}")
+            st.caption(
+                "질의 처리: "
+                f"{format_query_service_stats(self.chatbot.query_service.stats())}"
+            )
+            health_status = self.chatbot.health.status()
+            st.caption(f"연결 상태: {format_health_status(health_status)}")
+            for name, result in health_status.items():
+                if not result["ok"]:
+                    st.warning(f"{name} 연결 실패: {result['error']}")
+            refresh_status = load_refresh_status()
+            st.caption(f"검색 색인: {format_refresh_status(refresh_status)}")
+            for warning in refresh_warnings(refresh_status):
+                st.warning(warning)
 
             st.header("⚙️ 설정")
+            st.checkbox("🔬 단계별 처리 시간 보기 (디버그)", key="debug_trace")
             if st.button("대화 내용 초기화"):
-                st.session_state.chat_history = []
-                st.session_state.article_history = []
+                self.session.clear()
                 st.rerun()
 
     def display_article_info(self, article, score=None):
@@ -78,9 +136,10 @@ class StreamlitChatbot:
                 <div class="article-card">
                     <h4>📰 {article['title']}</h4>
                     <p><b>발행일:</b> {article.get('published_date', '날짜 정보 없음')}</p>
-                    {f'<p><b>관련도:</b> {score:.2f}%</p>' if score else ''}
+                    {f'<p><b>관련도:</b> {score:.0%}</p>' if score else ''}
                     <p><b>🔗 기사 링크:</b> <a href="{article['url']}" target="_blank">{article['url']}</a></p>
                     <p><b>카테고리:</b> {', '.join(article.get('categories', ['미분류']))}</p>
+                    {f"<p><b>요약:</b> {article['summary']}</p>" if article.get('summary') else ''}
                 </div>
                 """,
                 unsafe_allow_html=True,
@@ -92,169 +151,211 @@ class StreamlitChatbot:
             st.markdown(content)
 
             if articles and role == "assistant" and isinstance(articles, list):
-                st.markdown("### 📚 관련 기사")
-
-                # 기본 정보 표시
-                for i in range(0, min(len(articles), 4), 2):
-                    col1, col2 = st.columns(2)
-
-                    # 첫 번째 열
-                    with col1:
-                        if i < len(articles) and isinstance(articles[i], dict):
-                            article = articles[i]
-                            st.markdown(
-                                f"""
+                self.display_related_articles(articles)
+
+    def display_chat_history(self):
+        """최근 대화만 펼쳐 표시하고 이전 대화는 접어서 페이지 단위로 표시"""
+        if self.session.hidden_count:
+            with st.expander(f"이전 대화 {self.session.hidden_count}개 보기"):
+                page = st.number_input(
+                    "페이지 (1이 가장 최근)",
+                    min_value=1,
+                    max_value=self.session.page_count(),
+                    value=1,
+                )
+                # 이전 대화는 기사 카드 없이 텍스트만 표시
+                for message in self.session.older_messages(page):
+                    speaker = "🙋 사용자" if message["role"] == "user" else "🤖 챗봇"
+                    st.markdown(f"**{speaker}**: {message['content']}")
+
+        for message in self.session.recent_messages():
+            self.display_chat_message(
+                message["role"], message["content"], message.get("articles")
+            )
+
+    def display_related_articles(self, articles):
+        """관련 기사 목록 표시"""
+        st.markdown("### 📚 관련 기사")
+
+        # 기본 정보 표시
+        for i in range(0, min(len(articles), 4), 2):
+            col1, col2 = st.columns(2)
+
+            # 첫 번째 열
+            with col1:
+                if i < len(articles) and isinstance(articles[i], dict):
+                    article = articles[i]
+                    st.markdown(
+                        f"""
                         #### {i+1}. {article.get('title', '제목 없음')}
                         - 📅 발행일: {article.get('published_date', '날짜 정보 없음')}
                         - 🔗 [기사 링크]({article.get('url', '#')})
                         - 📊 카테고리: {', '.join(article.get('categories', ['미분류']))}
+                        {self._relevance_line(article)}
+                        {self._summary_line(article)}
+                        {self._keyphrase_line(article)}
                         """
-                            )
-
-                    # 두 번째 열
-                    with col2:
-                        if i + 1 < len(articles) and isinstance(articles[i + 1], dict):
-                            article = articles[i + 1]
-                            st.markdown(
-                                f"""
+                    )
+
+            # 두 번째 열
+            with col2:
+                if i + 1 < len(articles) and isinstance(articles[i + 1], dict):
+                    article = articles[i + 1]
+                    st.markdown(
+                        f"""
                         #### {i+2}. {article.get('title', '제목 없음')}
                         - 📅 발행일: {article.get('published_date', '날짜 정보 없음')}
                         - 🔗 [기사 링크]({article.get('url', '#')})
                         - 📊 카테고리: {', '.join(article.get('categories', ['미분류']))}
+                        {self._relevance_line(article)}
+                        {self._summary_line(article)}
+                        {self._keyphrase_line(article)}
                         """
-                            )
+                    )
 
-    async def process_user_input(self, user_input):
-        """사용자 입력 처리"""
+    @staticmethod
+    def _relevance_line(article):
+        """재순위 관련도(0~1)를 백분율로 표시 (캐시된 답변 등 값이 없으면 생략)"""
+        if "relevance" not in article:
+            return ""
+        return f"- 🎯 관련도: {article['relevance']:.0%}"
+
+    @staticmethod
+    def _summary_line(article):
+        """미리 계산된 요약 (없으면 생략)"""
+        if not article.get("summary"):
+            return ""
+        return f"- 📝 요약: {article['summary']}"
+
+    @staticmethod
+    def _keyphrase_line(article):
+        """미리 계산된 핵심어 (없으면 생략)"""
+        if not article.get("keyphrases"):
+            return ""
+        return f"- 🏷️ 핵심어: {', '.join(article['keyphrases'][:5])}"
+
+    def process_user_input(self, user_input):
+        """사용자 입력 처리 (답변은 생성되는 대로 스트리밍 표시)"""
         if not user_input:
             return
 
         # 사용자 메시지 표시
         self.display_chat_message("user", user_input)
-        st.session_state.chat_history.append(("user", user_input))
-        st.session_state.search_history.add(user_input)
-
-        # 처리 중 표시
-        with st.status("AI가 답변을 생성하고 있습니다...") as status:
-            try:
-                # 챗봇 응답 생성
-                status.update(label="관련 기사를 검색중입니다...")
-                main_article, related_articles, score, response = (
-                    await st.session_state.chatbot.process_query(user_input)
+        self.session.add_user_message(user_input)
+
+        # 검색과 스트리밍 생성은 모든 세션이 공유하는 백그라운드 이벤트 루프에서 실행
+        runtime = get_runtime()
+        try:
+            # 처리 중 표시
+            with st.status("관련 기사를 검색중입니다...") as status:
+                stats = {}
+                main_article, related_articles, score, chunks = runtime.run(
+                    self.chatbot.stream_query(user_input, stats)
                 )
-
-                status.update(label="답변을 생성하고 있습니다...")
-                # 응답 저장 및 표시
-                st.session_state.chat_history.append(
-                    (
-                        "assistant",
-                        response,
-                        [main_article] + related_articles if main_article else [],
-                    )
-                )
-                self.display_chat_message(
-                    "assistant",
-                    response,
-                    [main_article] + related_articles if main_article else None,
-                )
-
-                # 기사 히스토리 업데이트
-                if main_article:
-                    st.session_state.article_history.append(main_article)
-
-                status.update(label="완료!", state="complete")
-
-            except Exception as e:
-                st.error(f"오류가 발생했습니다: {str(e)}")
-                status.update(label="오류 발생", state="error")
+                status.update(label="기사 검색 완료", state="complete")
+
+            articles = [main_article] + related_articles if main_article else []
+            with st.chat_message("assistant"):
+                # 답변 조각을 받는 즉시 화면에 표시
+                response = st.write_stream(runtime.iterate(chunks))
+                if articles:
+                    self.display_related_articles(articles)
+                st.caption(format_stats(stats))
+                if st.session_state.get("debug_trace"):
+                    self.display_trace(stats.get("trace_id"))
+
+            # 응답 저장 (기사는 ID와 미리보기 필드만 보관)
+            self.session.add_assistant_message(response, articles)
+
+        except QueryRejected as e:
+            st.warning(str(e))
+        except Exception as e:
+            st.error(f"오류가 발생했습니다: {str(e)}")
+
+    def display_trace(self, trace_id):
+        """요청 처리 스팬을 단계별 표로 표시 (디버그용)"""
+        spans = tracer.find(trace_id) if trace_id else None
+        with st.expander("🔬 처리 과정 추적"):
+            if not spans:
+                st.caption("추적 정보가 없습니다.")
+                return
+            st.caption(f"trace_id: {trace_id}")
+            st.dataframe(span_rows(spans), hide_index=True, use_container_width=True)
 
     def show_analytics(self):
         """분석 정보 표시"""
-        if st.session_state.article_history:  # 기사 히스토리가 있는 경우만 표시
-            st.header("📊 검색 분석")
-
-            # 1. 카테고리 분포 분석
-            categories = []
-            for article in st.session_state.article_history:
-                categories.extend(article.get("categories", ["미분류"]))
-
-            df_categories = pd.DataFrame(categories, columns=["카테고리"])
-            category_counts = df_categories["카테고리"].value_counts()
-
-            # 2. 시간별 기사 분포 분석
-            dates = [
-                datetime.fromisoformat(
-                    art.get("published_date", datetime.now().isoformat())
-                )
-                for art in st.session_state.article_history
-            ]
-            df_dates = pd.DataFrame(dates, columns=["발행일"])
-            date_counts = df_dates["발행일"].dt.date.value_counts()
-
-            # 분석 결과 표시
-            col1, col2 = st.columns(2)
+        # pandas는 불러오는 데 0.5초 넘게 걸리므로 분석을 볼 때만 불러옴
+        import pandas as pd
 
-            with col1:
-                st.subheader("📈 카테고리별 기사 분포")
-                if not category_counts.empty:
-                    st.bar_chart(category_counts)
-                    # 카테고리별 비율 표시
-                    st.markdown("**카테고리별 비율:**")
-                    for cat, count in category_counts.items():
-                        percentage = (count / len(categories)) * 100
-                        st.write(f"- {cat}: {percentage:.1f}% ({count}건)")
-                else:
-                    st.info("아직 카테고리 데이터가 없습니다.")
+        analytics = load_corpus_analytics(self.chatbot.db_search)
+        if not analytics or not analytics["total_articles"]:
+            st.info("아직 색인된 기사가 없습니다.")
+            return
 
-            with col2:
-                st.subheader("📅 일자별 기사 분포")
-                if not date_counts.empty:
-                    st.line_chart(date_counts)
-                    # 최신순으로 날짜별 기사 수 표시
-                    st.markdown("**날짜별 기사 수:**")
-                    for date, count in date_counts.sort_index(ascending=False).items():
-                        st.write(f"- {date.strftime('%Y-%m-%d')}: {count}건")
-                else:
-                    st.info("아직 날짜 데이터가 없습니다.")
+        st.header("📊 전체 기사 분석")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📈 카테고리별 기사 분포")
+            category_counts = pd.Series(analytics["categories"], dtype="int64")
+            if not category_counts.empty:
+                st.bar_chart(category_counts)
+                # 카테고리별 비율 표시 (기사 하나가 여러 카테고리에 속할 수 있음)
+                st.markdown("**카테고리별 비율:**")
+                total_tags = category_counts.sum()
+                for cat, count in category_counts.items():
+                    percentage = (count / total_tags) * 100
+                    st.write(f"- {cat}: {percentage:.1f}% ({count}건)")
+            else:
+                st.info("아직 카테고리 데이터가 없습니다.")
+
+        with col2:
+            st.subheader("📅 일자별 기사 분포")
+            date_counts = pd.Series(analytics["published_per_day"], dtype="int64")
+            if not date_counts.empty:
+                st.line_chart(date_counts)
+                # 최신순으로 날짜별 기사 수 표시
+                st.markdown("**최근 날짜별 기사 수:**")
+                for date, count in date_counts.sort_index(ascending=False)[:7].items():
+                    st.write(f"- {date}: {count}건")
+            else:
+                st.info("아직 날짜 데이터가 없습니다.")
+
+        # 코퍼스 및 검색 통계
+        st.subheader("🔍 코퍼스 및 검색 통계")
+        col3, col4, col5, col6 = st.columns(4)
+
+        with col3:
+            st.metric(label="전체 기사 수", value=analytics["total_articles"])
+
+        with col4:
+            st.metric(
+                label="평균 단어 수",
+                value=f"{analytics['word_count']['avg'] or 0:.0f}",
+            )
 
-            # 3. 검색 통계
-            st.subheader("🔍 검색 통계")
-            col3, col4, col5 = st.columns(3)
+        with col5:
+            st.metric(
+                label="최신 기사 날짜",
+                value=analytics["latest_published_date"] or "날짜 정보 없음",
+            )
 
-            with col3:
-                st.metric(
-                    label="총 검색 수", value=len(st.session_state.search_history)
-                )
+        with col6:
+            st.metric(label="총 검색 수", value=self.session.query_count)
 
-            with col4:
-                st.metric(
-                    label="검색된 총 기사 수",
-                    value=len(st.session_state.article_history),
-                )
+        # 최근 검색어 히스토리
+        recent_searches = self.session.recent_queries()
+        if recent_searches:
+            st.subheader("🕒 최근 검색어")
+            for query in recent_searches:
+                st.text(f"• {query}")
 
-            with col5:
-                if st.session_state.article_history:
-                    latest_article = max(
-                        st.session_state.article_history,
-                        key=lambda x: x.get("published_date", ""),
-                    )
-                    st.metric(
-                        label="최신 기사 날짜",
-                        value=datetime.fromisoformat(
-                            latest_article.get(
-                                "published_date", datetime.now().isoformat()
-                            )
-                        ).strftime("%Y-%m-%d"),
-                    )
 
-            # 4. 최근 검색어 히스토리
-            if st.session_state.search_history:
-                st.subheader("🕒 최근 검색어")
-                recent_searches = list(st.session_state.search_history)[-5:]  # 최근 5개
-                for query in reversed(recent_searches):
-                    st.text(f"• {query}")
-        else:
-            st.info("아직 검색 결과가 없습니다. 질문을 입력해주세요!")
+@st.cache_data(ttl=60, show_spinner=False)
+def load_corpus_analytics(_db_search):
+    """전체 코퍼스 통계 조회 (모든 세션이 60초 동안 결과를 공유)"""
+    return _db_search.get_corpus_analytics()
 
 
 def main():
@@ -277,19 +378,16 @@ def main():
     )
 
     # 채팅 히스토리 표시
-    for message in st.session_state.chat_history:
-        if len(message) == 3:  # 챗봇 응답 (관련 기사 포함)
-            app.display_chat_message(message[0], message[1], message[2])
-        else:  # 사용자 메시지
-            app.display_chat_message(message[0], message[1])
+    app.display_chat_history()
 
-    # # 분석 정보 표시
-    # app.show_analytics()
+    # 분석 정보 표시 (집계 질의와 차트 준비가 첫 화면을 늦추지 않도록 요청 시에만 실행)
+    if st.toggle("📊 전체 기사 분석 보기"):
+        app.show_analytics()
 
     # 사용자 입력
     user_input = st.chat_input("질문을 입력하세요...")
     if user_input:
-        asyncio.run(app.process_user_input(user_input))
+        app.process_user_input(user_input)
 
 
 if __name__ == "__main__":
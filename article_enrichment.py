@@ -0,0 +1,302 @@
+import argparse
+import json
+import math
+import os
+import re
+from collections import Counter
+
+from context_builder import JOSA_SUFFIXES, split_sentences
+
+# 요약/핵심어 계산 방식이 바뀌면 올려서 기존 기사를 다시 처리
+ENRICHMENT_VERSION = 1
+# 문서 빈도 파일 없이(IDF 없이) 계산한 결과. 일괄 작업이 다음 실행에서 다시 계산
+UNCALIBRATED_VERSION = 0
+
+# 뉴스 기사에 흔히 나오지만 내용을 나타내지 않는 단어 (조사를 뗀 형태)
+STOPWORDS = {
+    "있다",
+    "했다",
+    "한다",
+    "된다",
+    "밝혔다",
+    "말했다",
+    "전했다",
+    "설명했다",
+    "있는",
+    "하는",
+    "위해",
+    "통해",
+    "대한",
+    "이번",
+    "지난",
+    "올해",
+    "현재",
+    "관련",
+    "것으",
+    "것이",
+    "이라고",
+    "라고",
+    "이다",
+    "따르면",
+    "기자",
+}
+
+# 뉴스는 첫 문장에 핵심을 담는 경우가 많아 앞쪽 문장을 우대
+LEAD_BONUS = 0.5
+
+
+def words(text):
+    """(비교용 소문자 단어, 원래 표기) 목록
+
+    "오픈AI"처럼 한글과 영문이 붙은 단어는 나누지 않고, 끝의 조사는 뗌
+    """
+    result = []
+    for word in re.findall(r"[가-힣A-Za-z0-9]+", text):
+        for suffix in JOSA_SUFFIXES:
+            if len(word) > len(suffix) + 1 and word.endswith(suffix):
+                word = word[: -len(suffix)]
+                break
+        result.append((word.lower(), word))
+    return result
+
+
+def is_content_word(term):
+    return len(term) >= 2 and not term.isdigit() and term not in STOPWORDS
+
+
+class ArticleEnricher:
+    """기사 본문에서 추출 요약과 핵심어를 계산 (외부 호출 없이 로컬에서 처리)
+
+    - 단어 가중치는 기사 안 빈도와 전체 기사 기준 IDF를 곱한 값
+    - 요약: 가중치 합이 큰 문장을 max_chars 안에서 골라 원래 순서로 연결
+    - 핵심어: 가중치가 큰 단어와 두 번 이상 나온 두 단어 구
+    - IDF용 문서 빈도는 add_document()로 모으고 save()/load()로 파일에 보관하여
+      크롤러가 새 기사 하나만 처리할 때도 같은 기준을 사용
+    """
+
+    def __init__(self, max_sentences=3, max_chars=200, max_keyphrases=8):
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+        self.max_keyphrases = max_keyphrases
+        self.documents = 0
+        self.document_frequency = Counter()
+
+    @staticmethod
+    def stats_path():
+        return os.getenv(
+            "ENRICHMENT_STATS_PATH", os.path.join(".cache", "enrichment_stats.json")
+        )
+
+    @classmethod
+    def load(cls, path=None, **kwargs):
+        """저장된 문서 빈도로 생성 (파일이 없으면 IDF 없이 빈도만 사용)"""
+        enricher = cls(**kwargs)
+        try:
+            with open(path or cls.stats_path(), encoding="utf-8") as f:
+                stats = json.load(f)
+            enricher.documents = stats["documents"]
+            enricher.document_frequency = Counter(stats["document_frequency"])
+        except (OSError, ValueError, KeyError):
+            pass
+        return enricher
+
+    def save(self, path=None):
+        """문서 빈도 저장 (한 기사에만 나온 단어는 파일 크기를 줄이기 위해 제외)"""
+        path = path or self.stats_path()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        document_frequency = {
+            term: count for term, count in self.document_frequency.items() if count > 1
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"documents": self.documents, "document_frequency": document_frequency},
+                f,
+                ensure_ascii=False,
+            )
+
+    def add_document(self, text):
+        self.documents += 1
+        self.document_frequency.update({term for term, _ in words(text)})
+
+    def idf(self, term):
+        if not self.documents:
+            return 1.0
+        df = self.document_frequency.get(term, 0)
+        return math.log(1 + (self.documents - df + 0.5) / (df + 0.5))
+
+    def enrich(self, title, content):
+        """{"summary", "keyphrases", "enrichment_version"} 반환
+
+        문서 빈도가 없으면 enrichment_version을 UNCALIBRATED_VERSION으로 표시
+        """
+        title_terms = {term for term, _ in words(title)}
+        counts = Counter(term for term, _ in words(content))
+        weights = {
+            term: count * self.idf(term) * (2 if term in title_terms else 1)
+            for term, count in counts.items()
+            if is_content_word(term)
+        }
+        return {
+            "summary": self.summarize(content, weights),
+            "keyphrases": self.keyphrases(content, weights),
+            "enrichment_version": (
+                ENRICHMENT_VERSION if self.documents else UNCALIBRATED_VERSION
+            ),
+        }
+
+    def summarize(self, content, weights):
+        sentences = split_sentences(content)
+        if len(" ".join(sentences)) <= self.max_chars:
+            return " ".join(sentences)
+
+        scored = []
+        for position, sentence in enumerate(sentences):
+            terms = {term for term, _ in words(sentence) if term in weights}
+            if not terms:
+                continue
+            # 긴 문장이 유리하지 않도록 단어 수의 제곱근으로 나눔
+            score = sum(weights[term] for term in terms) / math.sqrt(len(terms))
+            scored.append((score * (1 + LEAD_BONUS / (position + 1)), position))
+
+        chosen = []
+        length = 0
+        for _, position in sorted(scored, reverse=True):
+            sentence = sentences[position]
+            if length + len(sentence) > self.max_chars and chosen:
+                continue
+            # 같은 문장이 반복된 기사에서 요약에 중복으로 넣지 않음
+            if any(sentences[other] == sentence for other in chosen):
+                continue
+            chosen.append(position)
+            length += len(sentence) + 1
+            if len(chosen) >= self.max_sentences:
+                break
+        summary = " ".join(sentences[position] for position in sorted(chosen))
+        if len(summary) > self.max_chars:
+            summary = summary[: self.max_chars - 3].rstrip() + "..."
+        return summary
+
+    def keyphrases(self, content, weights):
+        surface = {}
+        phrase_counts = Counter()
+        for sentence in split_sentences(content):
+            sentence_words = words(sentence)
+            for term, word in sentence_words:
+                surface.setdefault(term, word)
+            for (first, first_word), (second, second_word) in zip(
+                sentence_words, sentence_words[1:]
+            ):
+                if first in weights and second in weights:
+                    phrase_counts[(first, second)] += 1
+                    surface.setdefault((first, second), f"{first_word} {second_word}")
+
+        candidates = dict(weights)
+        for (first, second), count in phrase_counts.items():
+            if count >= 2:
+                candidates[(first, second)] = (
+                    count * (self.idf(first) + self.idf(second)) / 2 * 1.5
+                )
+
+        chosen = []
+        covered = set()
+        for key, _ in sorted(candidates.items(), key=lambda item: -item[1]):
+            parts = set(key) if isinstance(key, tuple) else {key}
+            # 이미 고른 구에 포함된 단어나, 고른 단어를 포함하는 구는 중복으로 보고 생략
+            if parts & covered:
+                continue
+            chosen.append(surface[key])
+            covered |= parts
+            if len(chosen) >= self.max_keyphrases:
+                break
+        return chosen
+
+
+def enrich_collection(db_search, batch_size=500, refresh_all=False, index=True):
+    """MongoDB 기사 전체로 문서 빈도를 계산한 뒤 요약/핵심어가 없거나 오래된 기사를
+    처리하여 MongoDB에 저장하고, index가 True면 Elasticsearch에도 반영
+
+    (처리한 기사 수, 평균 본문 글자 수, 평균 요약 글자 수)를 반환
+    """
+    from pymongo import UpdateOne
+
+    collection = db_search.mongo_collection
+    enricher = ArticleEnricher()
+    for doc in collection.find({}, {"_id": 0, "cleaned_content": 1}):
+        enricher.add_document(doc.get("cleaned_content", ""))
+    enricher.save()
+    print(f"기사 {enricher.documents}건으로 단어 문서 빈도를 계산했습니다.")
+
+    if index:
+        db_search.create_es_index(recreate=False)
+    query = {} if refresh_all else {"enrichment_version": {"$ne": ENRICHMENT_VERSION}}
+    processed = 0
+    content_chars = 0
+    summary_chars = 0
+    updates = []
+    docs = []
+
+    def flush():
+        if updates:
+            collection.bulk_write(updates, ordered=False)
+            if index:
+                _, errors = db_search.index_documents(docs, refresh=False)
+                if errors:
+                    print(f"Elasticsearch 반영 실패 {len(errors)}건")
+            updates.clear()
+            docs.clear()
+            print(f"{processed}건 처리")
+
+    for doc in collection.find(query):
+        content = doc.get("cleaned_content", "")
+        enrichment = enricher.enrich(doc.get("title", ""), content)
+        updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": enrichment}))
+        docs.append({**doc, **enrichment})
+        processed += 1
+        content_chars += len(content)
+        summary_chars += len(enrichment["summary"])
+        if len(updates) >= batch_size:
+            flush()
+    flush()
+    if index and processed:
+        db_search.es.indices.refresh(index=db_search.index_name)
+    return (
+        processed,
+        content_chars / processed if processed else 0,
+        summary_chars / processed if processed else 0,
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="기사별 추출 요약과 핵심어를 미리 계산하여 저장"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--all", action="store_true", help="이미 처리한 기사도 다시 계산"
+    )
+    parser.add_argument(
+        "--skip-es", action="store_true", help="MongoDB에만 저장하고 색인은 생략"
+    )
+    return parser.parse_args()
+
+
+def main():
+    from query_action import DatabaseSearch
+
+    args = parse_args()
+    db_search = DatabaseSearch()
+    processed, content_chars, summary_chars = enrich_collection(
+        db_search, args.batch_size, args.all, index=not args.skip_es
+    )
+    print(f"\n요약/핵심어 계산 완료: {processed}건")
+    if processed:
+        print(
+            f"평균 본문 {content_chars:.0f}자 → 요약 {summary_chars:.0f}자 "
+            f"({summary_chars / max(content_chars, 1):.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
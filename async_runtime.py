@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+
+class BackgroundEventLoop:
+    """백그라운드 스레드에서 계속 도는 이벤트 루프
+
+    Streamlit 스크립트처럼 동기 코드에서 코루틴을 제출하고 결과를 기다릴 수 있으며,
+    여러 세션이 하나의 루프를 공유하므로 비동기 클라이언트와 세마포어, 진행 중인
+    작업이 메시지나 재실행 사이에 유지됨
+    """
+
+    def __init__(self, name="newsbot-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """코루틴을 루프에 제출하고 concurrent.futures.Future 반환 (스레드 안전)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """코루틴을 루프에서 실행하고 결과를 기다려 반환
+
+        기다리는 쪽이 시간 초과나 예외로 빠져나가면 작업도 취소
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, async_iterator, timeout=None):
+        """비동기 제너레이터를 루프에서 돌려 동기 제너레이터로 변환
+
+        소비를 중간에 멈추면(예: Streamlit 재실행) 비동기 제너레이터도 닫음
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(async_iterator.__anext__(), timeout)
+                except StopAsyncIteration:
+                    break
+        finally:
+            self.submit(async_iterator.aclose())
+
+    def stop(self):
+        """루프를 멈추고 스레드 종료를 기다림"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
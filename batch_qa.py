@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import csv
+import json
+import os
+import time
+
+from latency_stats import percentile
+
+# 질문으로 사용할 열 이름 (앞에 있는 것 우선)
+QUERY_FIELDS = ("query", "question")
+# 대기열이 가득 차 거절되었을 때 다시 시도하는 횟수와 대기 시간(초)
+MAX_REJECTED_RETRIES = 5
+REJECTED_RETRY_SECONDS = 0.5
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="파일의 질문들을 챗봇으로 일괄 처리 (평가 세트 실행, 답변 캐시 예열)"
+    )
+    parser.add_argument("input", help="질문 파일 (.jsonl 또는 .csv)")
+    parser.add_argument("--output", required=True, help="결과 JSONL 저장 경로")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("BATCH_CONCURRENCY", "8")),
+        help="동시에 처리할 질문 수",
+    )
+    parser.add_argument("--limit", type=int, help="앞에서부터 N개 질문만 처리")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="결과 파일에서 성공한 질문은 건너뛰고 이어서 기록",
+    )
+    return parser.parse_args()
+
+
+def read_questions(path):
+    """질문 파일에서 {id, query, metadata}를 차례로 읽음
+
+    JSONL은 한 줄에 객체 하나, CSV는 첫 줄이 열 이름. 질문은 query 또는 question
+    필드에서 읽고, id가 없으면 줄 번호를 사용하며 나머지 필드는 metadata로 전달
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for number, row in enumerate(rows, 1):
+            field = next((name for name in QUERY_FIELDS if row.get(name)), None)
+            if field is None:
+                print(f"{number}번째 항목에 질문이 없어 건너뜁니다.")
+                continue
+            metadata = {
+                key: value
+                for key, value in row.items()
+                if key not in (field, "id") and value not in (None, "")
+            }
+            yield {
+                "id": str(row.get("id") or number),
+                "query": row[field].strip(),
+                "metadata": metadata,
+            }
+
+
+def load_completed(path):
+    """이전 결과 파일에서 성공한 질문 id 목록"""
+    completed = set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 중단된 실행의 마지막 줄이 잘렸을 수 있음
+                if record.get("ok"):
+                    completed.add(record["id"])
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+def article_summary(article):
+    return {
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "published_date": article.get("published_date"),
+        "categories": article.get("categories", []),
+    }
+
+
+async def process_with_retry(chatbot, query, stats):
+    """질의 서비스 대기열이 가득 차 거절되면 잠시 기다렸다가 다시 요청"""
+    from query_service import QueryRejected
+
+    for attempt in range(MAX_REJECTED_RETRIES + 1):
+        try:
+            return await chatbot.process_query(query, stats)
+        except QueryRejected:
+            if attempt == MAX_REJECTED_RETRIES:
+                raise
+            await asyncio.sleep(REJECTED_RETRY_SECONDS * (attempt + 1))
+
+
+async def answer(chatbot, item):
+    """질문 하나를 처리하여 결과 기록용 dict 반환 (실패도 결과로 기록)"""
+    record = {"id": item["id"], "query": item["query"], "metadata": item["metadata"]}
+    stats = {}
+    started = time.perf_counter()
+    try:
+        main_article, related_articles, score, response = await process_with_retry(
+            chatbot, item["query"], stats
+        )
+    except Exception as e:
+        record.update(ok=False, error=f"{type(e).__name__}: {e}")
+    else:
+        articles = [main_article] + related_articles if main_article else []
+        record.update(
+            ok=True,
+            answer=response,
+            relevance=round(score, 3),
+            articles=[article_summary(article) for article in articles],
+        )
+    record.update(
+        total_ms=round((time.perf_counter() - started) * 1000, 1),
+        timings=stats.get("timings", {}),
+        cache_hit=bool(stats.get("cache_hit")),
+        coalesced=bool(stats.get("coalesced")),
+        degraded=stats.get("degraded"),
+        trace_id=stats.get("trace_id"),
+    )
+    return record
+
+
+async def run_batch(chatbot, questions, output, concurrency):
+    """작업자 concurrency개가 질문을 나눠 처리하고, 끝나는 대로 결과를 한 줄씩 기록
+
+    질문은 필요할 때 읽으므로 큰 파일도 메모리에 모두 올리지 않음. 답변과 기사는
+    파일에만 기록하고, 요약(summarize)에 필요한 필드만 모은 목록을 반환
+    """
+    results = []
+    questions = iter(questions)
+
+    async def worker():
+        for item in questions:
+            record = await answer(chatbot, item)
+            output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            output.flush()
+            results.append(
+                {
+                    "ok": record["ok"],
+                    "total_ms": record["total_ms"],
+                    "cache_hit": record["cache_hit"],
+                    "degraded": bool(record["degraded"]),
+                }
+            )
+            status = "완료" if record["ok"] else f"실패 ({record['error']})"
+            print(f"[{len(results)}] {item['id']}: {status} {record['total_ms']}ms")
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+def summarize(results, duration):
+    totals = [record["total_ms"] for record in results if record["ok"]]
+    return {
+        "questions": len(results),
+        "ok": len(totals),
+        "failed": len(results) - len(totals),
+        "cache_hits": sum(1 for record in results if record["cache_hit"]),
+        "degraded": sum(1 for record in results if record["degraded"]),
+        "duration_s": round(duration, 2),
+        "throughput_qps": round(len(results) / duration, 2) if duration else 0.0,
+        "p50_ms": round(percentile(totals, 50), 1),
+        "p95_ms": round(percentile(totals, 95), 1),
+    }
+
+
+async def main_async(args):
+    from query_action import NewsChatbot, format_query_service_stats
+
+    chatbot = NewsChatbot()
+    service = chatbot.query_service
+    # 질의 서비스가 받아 줄 수 있는 수(실행 + 대기열)를 넘기면 거절되므로 그 안으로 제한
+    concurrency = max(1, min(args.concurrency, service.max_workers + service.max_queue))
+    if concurrency < args.concurrency:
+        print(f"동시 처리 수를 질의 서비스 한도에 맞춰 {concurrency}로 줄였습니다.")
+
+    questions = read_questions(args.input)
+    if args.resume:
+        completed = load_completed(args.output)
+        questions = (item for item in questions if item["id"] not in completed)
+        print(f"이전 실행에서 완료한 질문 {len(completed)}개를 건너뜁니다.")
+    if args.limit:
+        questions = (item for _, item in zip(range(args.limit), questions))
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    chatbot.health.start()
+    started = time.perf_counter()
+    try:
+        with open(args.output, "a" if args.resume else "w", encoding="utf-8") as f:
+            results = await run_batch(chatbot, questions, f, concurrency)
+    finally:
+        chatbot.health.stop()
+    summary = summarize(results, time.perf_counter() - started)
+
+    print(
+        f"\n질문 {summary['questions']}개 처리: 성공 {summary['ok']}개, "
+        f"실패 {summary['failed']}개, 캐시 적중 {summary['cache_hits']}개, "
+        f"대체 답변 {summary['degraded']}개"
+    )
+    print(
+        f"소요 {summary['duration_s']}초 ({summary['throughput_qps']} 질문/초), "
+        f"p50 {summary['p50_ms']}ms, p95 {summary['p95_ms']}ms"
+    )
+    print(f"질의 처리 통계: {format_query_service_stats(service.stats())}")
+    return summary
+
+
+def main():
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import os
+from collections import deque
+
+# 대화 기록에 남기는 기사 필드 (본문 등 큰 필드는 저장하지 않음)
+ARTICLE_PREVIEW_FIELDS = (
+    "id",
+    "title",
+    "url",
+    "published_date",
+    "categories",
+    "summary",
+    "keyphrases",
+    "relevance",
+)
+
+
+def compact_article(article):
+    """카드 표시에 필요한 필드만 남긴 기사 사본"""
+    return {
+        field: article[field] for field in ARTICLE_PREVIEW_FIELDS if field in article
+    }
+
+
+class ChatSession:
+    """세션별 대화 상태
+
+    - 메시지는 최대 max_messages개까지만 보관하고 오래된 것부터 버림
+    - 답변에 딸린 기사는 ID와 미리보기 필드만 저장
+    - 화면에는 최근 window개만 펼쳐 그리고, 나머지는 페이지 단위로 조회
+    """
+
+    def __init__(self, max_messages=None, window=None, max_queries=50):
+        self.max_messages = max_messages or int(
+            os.getenv("CHAT_HISTORY_MAX_MESSAGES", "200")
+        )
+        self.window = window or int(os.getenv("CHAT_HISTORY_WINDOW", "20"))
+        self.messages = deque(maxlen=self.max_messages)
+        self.recent_articles = deque(maxlen=self.max_messages)
+        self.queries = deque(maxlen=max_queries)
+        self.query_count = 0
+
+    def add_user_message(self, text):
+        self.messages.append({"role": "user", "content": text})
+        # 같은 검색어는 가장 최근 위치로 옮겨 중복 없이 보관
+        if text in self.queries:
+            self.queries.remove(text)
+        self.queries.append(text)
+        self.query_count += 1
+
+    def add_assistant_message(self, text, articles=None):
+        articles = [compact_article(article) for article in articles or []]
+        self.messages.append(
+            {"role": "assistant", "content": text, "articles": articles}
+        )
+        if articles:
+            self.recent_articles.append(articles[0])
+
+    def recent_messages(self):
+        """화면에 펼쳐 보여줄 최근 메시지"""
+        start = max(0, len(self.messages) - self.window)
+        return [self.messages[i] for i in range(start, len(self.messages))]
+
+    @property
+    def hidden_count(self):
+        """최근 창 밖으로 밀려 접혀 있는 메시지 수"""
+        return max(0, len(self.messages) - self.window)
+
+    def page_count(self, page_size=None):
+        page_size = page_size or self.window
+        return -(-self.hidden_count // page_size)
+
+    def older_messages(self, page, page_size=None):
+        """접힌 메시지를 최신 페이지가 1이 되도록 페이지 단위로 반환"""
+        page_size = page_size or self.window
+        end = self.hidden_count - (page - 1) * page_size
+        start = max(0, end - page_size)
+        return [self.messages[i] for i in range(start, max(start, end))]
+
+    def recent_queries(self, count=5):
+        """최근 검색어 (최신순)"""
+        return list(self.queries)[-count:][::-1]
+
+    def clear(self):
+        self.messages.clear()
+        self.recent_articles.clear()
+        self.queries.clear()
+        self.query_count = 0
@@ -4,6 +4,9 @@ import time
 from pymongo import MongoClient
 import re
 from datetime import datetime
+from article_enrichment import ArticleEnricher
+from crawler_metrics import CrawlerMetrics, print_summary
+from mongo_indexes import ensure_article_indexes, now_kst
 
 
 def get_full_article_content(article_url):
@@ -35,7 +38,7 @@ def get_full_article_content(article_url):
 
 
 def get_article_date(soup):
-    """기사의 실제 발행일을 추출하는 함수"""
+    """기사의 실제 발행일을 추출하는 함수 (MongoDB에 날짜 타입으로 저장하도록 datetime 반환)"""
     try:
         # 1. 기사 목록에서 날짜 찾기
         date_text = None
@@ -60,11 +63,11 @@ def get_article_date(soup):
                     break
 
         if date_text:
-            current_year_prefix = str(datetime.now().year)[:2]
+            current_year_prefix = str(now_kst().year)[:2]
             parsed_date = datetime.strptime(
                 f"{current_year_prefix}{date_text}", "%Y.%m.%d %H:%M"
             )
-            return parsed_date.isoformat()
+            return parsed_date
 
         return None
 
@@ -72,107 +75,6 @@ def get_article_date(soup):
         return None
 
 
-def get_latest_article_info():
-    """MongoDB에서 가장 최근에 크롤링된 기사의 정보를 가져오는 함수"""
-    try:
-        # 가장 최근 크롤링된 기사 찾기
-        latest_article = mongo_collection.find_one({}, sort=[("crawled_date", -1)])
-        return latest_article
-    except Exception as e:
-        print(f"최근 기사 정보 조회 중 오류 발생: {e}")
-        return None
-
-
-def check_article_exists(url):
-    """특정 URL의 기사가 이미 DB에 존재하는지 확인하는 함수"""
-    try:
-        return mongo_collection.find_one({"url": url}) is not None
-    except Exception as e:
-        print(f"기사 존재 여부 확인 중 오류 발생: {e}")
-        return False
-
-
-def crawl_page(page_number):
-    """페이지별 기사를 크롤링하는 함수"""
-    url = f"https://www.newstheai.com/news/articleList.html?view_type=sm&page={page_number}"
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        articles = soup.select(".view-cont")
-
-        if articles:
-            print(f"\n=== 페이지 {page_number} ===")
-            new_articles_found = False
-
-            for idx, article in enumerate(articles, start=1):
-                title = article.select_one(".titles")
-                link_elem = article.select_one("a[href*='articleView.html']")
-
-                if title and link_elem:
-                    title_text = title.get_text(strip=True)
-                    article_url = "https://www.newstheai.com" + link_elem["href"]
-
-                    # 이미 크롤링된 기사인지 확인
-                    if check_article_exists(article_url):
-                        print(f"기사 {idx}: 이미 크롤링됨 - {title_text}")
-                        continue
-
-                    print(f"\n기사 {idx} 내용 가져오는 중...")
-
-                    # 기사 내용과 날짜를 가져오기 위한 요청
-                    article_response = requests.get(article_url, headers=headers)
-                    article_response.raise_for_status()
-                    article_soup = BeautifulSoup(article_response.text, "html.parser")
-
-                    # 본문 내용 가져오기
-                    article_content = article_soup.find(
-                        attrs={"itemprop": "articleBody"}
-                    )
-                    if article_content:
-                        all_text = article_content.stripped_strings
-                        full_content = " ".join(
-                            text
-                            for text in all_text
-                            if text and not text.startswith("//")
-                        )
-                    else:
-                        full_content = "본문 내용을 찾을 수 없습니다."
-
-                    # 발행일 가져오기
-                    published_date = get_article_date(article_soup)
-
-                    # MongoDB에 저장
-                    save_to_mongodb(
-                        page_number,
-                        idx,
-                        title_text,
-                        article_url,
-                        full_content,
-                        published_date,
-                    )
-                    new_articles_found = True
-                    time.sleep(1)
-
-            print(
-                f"\n페이지 {page_number}에서 {'새로운 기사를 찾았습니다.' if new_articles_found else '새로운 기사를 찾지 못했습니다.'}"
-            )
-            return new_articles_found
-
-        print(f"\n페이지 {page_number}에서 기사를 찾을 수 없습니다.")
-        return False
-
-    except requests.exceptions.RequestException as e:
-        print(f"페이지 {page_number} 크롤링 중 오류 발생: {e}")
-        return False
-
-
 def clean_text(text):
     """텍스트 정제 함수"""
     if not text:
@@ -239,47 +141,248 @@ def categorize_content(content):
     return categories
 
 
-def save_to_mongodb(
-    page_number, article_number, title, url, content, published_date=None
-):
-    """크롤링한 내용을 전처리하여 MongoDB에 저장하는 함수"""
-    # 텍스트 정제
-    cleaned_content = clean_text(content)
-
-    # 콘텐츠 분석
-    content_analysis = analyze_content(cleaned_content)
-
-    # 카테고리 분류
-    categories = categorize_content(cleaned_content)
-
-    article_data = {
-        "page_number": page_number,
-        "article_number": article_number,
-        "title": clean_text(title),
-        "url": url,
-        "original_content": content,
-        "cleaned_content": cleaned_content,
-        "metadata": content_analysis,
-        "categories": categories,
-        "published_date": published_date,  # 실제 발행일
-        "crawled_date": datetime.now().isoformat(),
-    }
+class ArticleCrawler:
+    """목록 페이지를 돌며 새 기사를 크롤링하여 collection에 저장
+
+    실행마다 새로 만들어 단계별 통계(metrics)를 그 실행에서만 집계하고,
+    요약/핵심어 계산기(enricher)도 그때의 문서 빈도 파일로 다시 읽음
+    """
+
+    def __init__(self, collection, metrics=None, enricher=None):
+        self.collection = collection
+        # 단계별 소요 시간과 처리 건수 (실행이 끝나면 JSON/Prometheus 파일로 기록)
+        self.metrics = metrics or CrawlerMetrics()
+        # 요약/핵심어 계산기 (article_enrichment 일괄 작업이 저장한 문서 빈도 사용)
+        self.enricher = enricher or ArticleEnricher.load()
+
+    def get_latest_article_info(self):
+        """MongoDB에서 가장 최근에 크롤링된 기사의 정보를 가져오는 함수"""
+        try:
+            # 가장 최근 크롤링된 기사 찾기
+            latest_article = self.collection.find_one({}, sort=[("crawled_date", -1)])
+            return latest_article
+        except Exception as e:
+            print(f"최근 기사 정보 조회 중 오류 발생: {e}")
+            return None
+
+    def check_article_exists(self, url):
+        """특정 URL의 기사가 이미 DB에 존재하는지 확인하는 함수"""
+        try:
+            # url만 조회하여 문서를 읽지 않고 url 인덱스만으로 확인
+            return (
+                self.collection.find_one({"url": url}, {"_id": 0, "url": 1}) is not None
+            )
+        except Exception as e:
+            print(f"기사 존재 여부 확인 중 오류 발생: {e}")
+            return False
+
+    def crawl_page(self, page_number):
+        """페이지별 기사를 크롤링하는 함수"""
+        url = f"https://www.newstheai.com/news/articleList.html?view_type=sm&page={page_number}"
+
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        }
+
+        try:
+            with self.metrics.time("fetch_list"):
+                response = requests.get(url, headers=headers)
+                response.raise_for_status()
+
+            with self.metrics.time("parse_list"):
+                soup = BeautifulSoup(response.text, "html.parser")
+                articles = soup.select(".view-cont")
+            self.metrics.inc("pages")
+
+            if articles:
+                print(f"\n=== 페이지 {page_number} ===")
+                new_articles_found = False
+
+                for idx, article in enumerate(articles, start=1):
+                    title = article.select_one(".titles")
+                    link_elem = article.select_one("a[href*='articleView.html']")
+
+                    if title and link_elem:
+                        title_text = title.get_text(strip=True)
+                        article_url = "https://www.newstheai.com" + link_elem["href"]
+
+                        # 이미 크롤링된 기사인지 확인
+                        self.metrics.inc("articles_seen")
+                        with self.metrics.time("check_exists"):
+                            exists = self.check_article_exists(article_url)
+                        if exists:
+                            self.metrics.inc("articles_skipped_existing")
+                            print(f"기사 {idx}: 이미 크롤링됨 - {title_text}")
+                            continue
+
+                        print(f"\n기사 {idx} 내용 가져오는 중...")
+
+                        # 기사 내용과 날짜를 가져오기 위한 요청
+                        # (기사 하나를 가져오지 못해도 페이지의 나머지 기사는 계속 처리)
+                        try:
+                            with self.metrics.time("fetch_article"):
+                                article_response = requests.get(
+                                    article_url, headers=headers
+                                )
+                                article_response.raise_for_status()
+                        except requests.exceptions.RequestException as e:
+                            self.metrics.inc("article_errors")
+                            print(f"기사 {idx} 가져오기 중 오류 발생: {e}")
+                            continue
+                        self.metrics.inc("articles_fetched")
+
+                        # 본문 내용 가져오기
+                        with self.metrics.time("parse_article"):
+                            article_soup = BeautifulSoup(
+                                article_response.text, "html.parser"
+                            )
+                            article_content = article_soup.find(
+                                attrs={"itemprop": "articleBody"}
+                            )
+                        if article_content:
+                            all_text = article_content.stripped_strings
+                            full_content = " ".join(
+                                text
+                                for text in all_text
+                                if text and not text.startswith("//")
+                            )
+                        else:
+                            self.metrics.inc("articles_missing_body")
+                            full_content = "본문 내용을 찾을 수 없습니다."
+
+                        # 발행일 가져오기
+                        with self.metrics.time("extract_date"):
+                            published_date = get_article_date(article_soup)
+                        if published_date is None:
+                            self.metrics.inc("articles_missing_date")
+
+                        # MongoDB에 저장
+                        self.save_to_mongodb(
+                            page_number,
+                            idx,
+                            title_text,
+                            article_url,
+                            full_content,
+                            published_date,
+                        )
+                        new_articles_found = True
+                        time.sleep(1)
+
+                print(
+                    f"\n페이지 {page_number}에서 {'새로운 기사를 찾았습니다.' if new_articles_found else '새로운 기사를 찾지 못했습니다.'}"
+                )
+                return new_articles_found
+
+            self.metrics.inc("pages_empty")
+            print(f"\n페이지 {page_number}에서 기사를 찾을 수 없습니다.")
+            return False
+
+        except requests.exceptions.RequestException as e:
+            self.metrics.inc("page_errors")
+            print(f"페이지 {page_number} 크롤링 중 오류 발생: {e}")
+            return False
+
+    def save_to_mongodb(
+        self, page_number, article_number, title, url, content, published_date=None
+    ):
+        """크롤링한 내용을 전처리하여 MongoDB에 저장하는 함수"""
+        # 텍스트 정제
+        with self.metrics.time("clean"):
+            cleaned_content = clean_text(content)
+
+        # 콘텐츠 분석
+        with self.metrics.time("analyze"):
+            content_analysis = analyze_content(cleaned_content)
+
+        # 카테고리 분류
+        with self.metrics.time("categorize"):
+            categories = categorize_content(cleaned_content)
+
+        # 추출 요약과 핵심어 (답변 프롬프트와 기사 카드에서 사용)
+        with self.metrics.time("enrich"):
+            enrichment = self.enricher.enrich(title, cleaned_content)
+
+        article_data = {
+            "page_number": page_number,
+            "article_number": article_number,
+            "title": clean_text(title),
+            "url": url,
+            "original_content": content,
+            "cleaned_content": cleaned_content,
+            "metadata": content_analysis,
+            "categories": categories,
+            "published_date": published_date,  # 실제 발행일
+            "crawled_date": now_kst(),
+            **enrichment,
+        }
+
+        try:
+            with self.metrics.time("mongo_save"):
+                existing_article = self.collection.find_one({"url": url})
+
+                if existing_article:
+                    self.collection.update_one({"url": url}, {"$set": article_data})
+                else:
+                    self.collection.insert_one(article_data)
+
+            if existing_article:
+                self.metrics.inc("articles_updated")
+                print(f"MongoDB에서 업데이트 완료: {title}")
+            else:
+                self.metrics.inc("articles_saved")
+                print(f"MongoDB에 새로 저장 완료: {title}")
+                print(f"카테고리: {categories}")
+                print(f"발행일: {published_date or '날짜 정보 없음'}")
+                print(f"단어 수: {content_analysis['word_count']}")
 
-    try:
-        existing_article = mongo_collection.find_one({"url": url})
-
-        if existing_article:
-            mongo_collection.update_one({"url": url}, {"$set": article_data})
-            print(f"MongoDB에서 업데이트 완료: {title}")
-        else:
-            mongo_collection.insert_one(article_data)
-            print(f"MongoDB에 새로 저장 완료: {title}")
-            print(f"카테고리: {categories}")
-            print(f"발행일: {published_date or '날짜 정보 없음'}")
-            print(f"단어 수: {content_analysis['word_count']}")
+        except Exception as e:
+            print(f"MongoDB 저장 중 오류 발생: {e}")
 
-    except Exception as e:
-        print(f"MongoDB 저장 중 오류 발생: {e}")
+    def run(self, max_pages=75, max_consecutive_no_new=3):
+        """목록 1페이지부터 새 기사를 크롤링하고 실행 요약 반환
+
+        max_consecutive_no_new 페이지 연속으로 새 기사가 없으면 중단.
+        페이지마다 통계 파일을 갱신
+        """
+        # 최근 크롤링된 기사 정보 확인
+        latest_article = self.get_latest_article_info()
+        if latest_article:
+            print(f"\n최근 크롤링된 기사 정보:")
+            print(f"제목: {latest_article.get('title', 'N/A')}")
+            print(f"크롤링 일자: {latest_article.get('crawled_date', 'N/A')}")
+
+        # 크롤링 시작
+        page_number = 1
+        consecutive_no_new = 0  # 연속으로 새로운 기사가 없는 페이지 수
+
+        try:
+            while page_number <= max_pages:
+                print(f"\n페이지 {page_number} 처리 중...")
+                found_new_articles = self.crawl_page(page_number)
+
+                if not found_new_articles:
+                    consecutive_no_new += 1
+                    print(f"페이지 {page_number}에서 새로운 기사를 찾지 못했습니다.")
+
+                    if consecutive_no_new >= max_consecutive_no_new:
+                        print(
+                            f"\n{max_consecutive_no_new}페이지 연속으로 새로운 기사가 없어 크롤링을 종료합니다."
+                        )
+                        break
+                else:
+                    consecutive_no_new = 0  # 새로운 기사를 찾으면 카운터 리셋
+
+                page_number += 1
+                # 긴 실행 중에도 진행 상황을 볼 수 있도록 페이지마다 갱신
+                self.metrics.write()
+        finally:
+            summary = self.metrics.write()
+        return summary
+
+
+def crawl(collection, max_pages=75, max_consecutive_no_new=3):
+    """새 ArticleCrawler로 collection에 새 기사를 크롤링하고 실행 요약 반환"""
+    return ArticleCrawler(collection).run(max_pages, max_consecutive_no_new)
 
 
 if __name__ == "__main__":
@@ -292,47 +395,16 @@ if __name__ == "__main__":
         db = mongo_client["crawlingdb"]
         mongo_collection = db["articles"]
 
-        # MongoDB 인덱스 생성
-        mongo_collection.create_index([("url", 1)], unique=True)
-        mongo_collection.create_index([("categories", 1)])  # 카테고리 검색 최적화
-        mongo_collection.create_index([("crawled_date", 1)])  # 날짜 검색 최적화
+        # MongoDB 인덱스 생성 (DatabaseSearch와 같은 정의 사용)
+        ensure_article_indexes(mongo_collection)
     except Exception as e:
         print(f"MongoDB 연결 실패: {e}")
         exit(1)
 
+    crawler = ArticleCrawler(mongo_collection)
+    summary = None
     try:
-        # 최근 크롤링된 기사 정보 확인
-        latest_article = get_latest_article_info()
-        if latest_article:
-            print(f"\n최근 크롤링된 기사 정보:")
-            print(f"제목: {latest_article.get('title', 'N/A')}")
-            print(f"크롤링 일자: {latest_article.get('crawled_date', 'N/A')}")
-
-        # 크롤링 시작
-        page_number = 1
-        max_pages = 75
-        consecutive_no_new = 0  # 연속으로 새로운 기사가 없는 페이지 수
-        max_consecutive_no_new = (
-            3  # 이 값 이상 연속으로 새로운 기사가 없으면 크롤링 중단
-        )
-
-        while page_number <= max_pages:
-            print(f"\n페이지 {page_number} 처리 중...")
-            found_new_articles = crawl_page(page_number)
-
-            if not found_new_articles:
-                consecutive_no_new += 1
-                print(f"페이지 {page_number}에서 새로운 기사를 찾지 못했습니다.")
-
-                if consecutive_no_new >= max_consecutive_no_new:
-                    print(
-                        f"\n{max_consecutive_no_new}페이지 연속으로 새로운 기사가 없어 크롤링을 종료합니다."
-                    )
-                    break
-            else:
-                consecutive_no_new = 0  # 새로운 기사를 찾으면 카운터 리셋
-
-            page_number += 1
+        summary = crawler.run()
 
         print("\n크롤링 및 데이터 전처리가 완료되었습니다.")
         print("결과가 MongoDB에 저장되었습니다.")
@@ -343,3 +415,4 @@ if __name__ == "__main__":
     finally:
         mongo_client.close()
         print("MongoDB 연결이 종료되었습니다.")
+        print_summary(summary or crawler.metrics.write())
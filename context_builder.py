@@ -0,0 +1,237 @@
+import math
+import os
+import re
+from collections import Counter
+
+# 한국어 조사/어미를 떼어 내 "기술이", "기술을"이 같은 단어로 매칭되도록 함
+JOSA_SUFFIXES = (
+    "에서는",
+    "으로는",
+    "에는",
+    "에도",
+    "에서",
+    "으로",
+    "에게",
+    "까지",
+    "부터",
+    "은",
+    "는",
+    "이",
+    "가",
+    "을",
+    "를",
+    "의",
+    "에",
+    "로",
+    "와",
+    "과",
+    "도",
+    "만",
+)
+
+
+def tokenize(text):
+    """검색용 토큰 목록 (소문자 영문/숫자 단어와 조사를 뗀 한글 단어)"""
+    tokens = []
+    for word in re.findall(r"[가-힣]+|[a-z0-9]+", text.lower()):
+        for suffix in JOSA_SUFFIXES:
+            if len(word) > len(suffix) + 1 and word.endswith(suffix):
+                word = word[: -len(suffix)]
+                break
+        tokens.append(word)
+    return tokens
+
+
+def estimate_tokens(text):
+    """LLM 토큰 수 근사치 (한글은 글자당 1토큰, 그 외는 4글자당 1토큰으로 가정)"""
+    hangul = len(re.findall(r"[가-힣]", text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def split_sentences(text):
+    """문장부호 뒤 공백을 기준으로 문장 목록 분할"""
+    return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+
+
+def split_passages(text, max_chars=300):
+    """문장 경계를 기준으로 max_chars 이하의 패시지로 분할"""
+    sentences = split_sentences(text)
+    passages = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            passages.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        passages.append(current)
+    return passages
+
+
+class ContextBuilder:
+    """검색된 기사들을 패시지로 나누고 질문과의 BM25 점수로 골라
+    토큰 예산 안에서 생성 프롬프트용 컨텍스트를 구성하는 클래스
+
+    미리 계산된 요약(summary)이 있는 기사는 머리글에 요약을 붙여 본문 대신 사용하고,
+    그런 기사들의 본문 패시지는 질문어가 들어 있는 것 중 관련도 순으로 전체
+    max_passages_with_summary개만 근거로 추가
+    """
+
+    def __init__(
+        self,
+        token_budget=None,
+        passage_chars=300,
+        max_passages_per_article=3,
+        max_passages_with_summary=1,
+        k1=1.2,
+        b=0.75,
+    ):
+        self.token_budget = token_budget or int(
+            os.getenv("CONTEXT_TOKEN_BUDGET", "1500")
+        )
+        self.passage_chars = passage_chars
+        self.max_passages_per_article = max_passages_per_article
+        self.max_passages_with_summary = max_passages_with_summary
+        self.k1 = k1
+        self.b = b
+
+    def rank_passages(self, query, articles):
+        """모든 기사의 패시지를 질문과의 관련도 순으로 정렬하여 반환"""
+        query_terms = set(tokenize(query))
+        passages = []
+        for article_index, article in enumerate(articles):
+            highlights = [
+                re.sub(r"</?strong>", "", fragment)
+                for fragment in article.get("highlights", {}).get("cleaned_content", [])
+            ]
+            for position, text in enumerate(
+                split_passages(article.get("content", ""), self.passage_chars)
+            ):
+                passages.append(
+                    {
+                        "article_index": article_index,
+                        "position": position,
+                        "text": text,
+                        "term_counts": Counter(tokenize(text)),
+                        "highlighted": any(
+                            fragment[:40] in text for fragment in highlights
+                        ),
+                    }
+                )
+
+        if not passages:
+            return []
+
+        # 패시지 단위 BM25
+        avg_length = sum(sum(p["term_counts"].values()) for p in passages) / len(
+            passages
+        )
+        document_frequency = {
+            term: sum(1 for p in passages if term in p["term_counts"])
+            for term in query_terms
+        }
+        for passage in passages:
+            length = sum(passage["term_counts"].values()) or 1
+            score = 0.0
+            passage["matched"] = False
+            for term in query_terms:
+                tf = passage["term_counts"].get(term, 0)
+                if not tf:
+                    continue
+                passage["matched"] = True
+                df = document_frequency[term]
+                idf = math.log(1 + (len(passages) - df + 0.5) / (df + 0.5))
+                score += idf * (
+                    tf
+                    * (self.k1 + 1)
+                    / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                )
+            # ES 하이라이트와 겹치는 패시지와 상위 기사의 패시지를 약간 우대
+            if passage["highlighted"]:
+                score += 0.5
+            score += 0.1 / (1 + passage["article_index"])
+            passage["score"] = score
+
+        return sorted(passages, key=lambda p: p["score"], reverse=True)
+
+    def build(self, query, articles):
+        """토큰 예산 안에 들어가는 요약과 관련 패시지로 컨텍스트 텍스트 구성
+
+        {"text", "tokens", "passages", "articles"} 형태로 반환
+        """
+        selected = []
+        used_tokens = 0
+        per_article = Counter()
+        included = set()
+        summary_passages = 0
+
+        def header_cost(article_index):
+            # 기사 머리글(요약 포함)이 새로 붙는 경우 그 비용도 예산에 포함
+            if article_index in included:
+                return 0
+            return estimate_tokens(self._format_header(articles[article_index]))
+
+        for passage in self.rank_passages(query, articles):
+            article_index = passage["article_index"]
+            summary = articles[article_index].get("summary")
+            if summary:
+                # 요약이 기사 전체를 대신하므로 질문어가 없거나 요약에 이미 들어간
+                # 패시지는 생략
+                if (
+                    not passage["matched"]
+                    or passage["text"] in summary
+                    or summary_passages >= self.max_passages_with_summary
+                ):
+                    continue
+            elif per_article[article_index] >= self.max_passages_per_article:
+                continue
+            passage_tokens = estimate_tokens(f"- {passage['text']}") + header_cost(
+                article_index
+            )
+            if used_tokens + passage_tokens > self.token_budget:
+                continue
+            selected.append(passage)
+            summary_passages += 1 if summary else 0
+            per_article[article_index] += 1
+            included.add(article_index)
+            used_tokens += passage_tokens
+
+        # 패시지가 뽑히지 않은 기사도 요약이 있으면 순위 순으로 예산 안에서 포함
+        for article_index, article in enumerate(articles):
+            if article_index in included or not article.get("summary"):
+                continue
+            cost = header_cost(article_index)
+            if used_tokens + cost <= self.token_budget:
+                included.add(article_index)
+                used_tokens += cost
+
+        # 기사 순서, 기사 내 원래 위치 순서로 다시 정렬하여 읽기 자연스럽게 구성
+        selected.sort(key=lambda p: (p["article_index"], p["position"]))
+        sections = []
+        for article_index in sorted(included):
+            lines = [self._format_header(articles[article_index])]
+            lines.extend(
+                f"- {p['text']}"
+                for p in selected
+                if p["article_index"] == article_index
+            )
+            sections.append("\n".join(lines))
+
+        text = "\n\n".join(sections)
+        return {
+            "text": text,
+            "tokens": estimate_tokens(text),
+            "passages": len(selected),
+            "articles": len(included),
+        }
+
+    @staticmethod
+    def _format_header(article):
+        header = (
+            f"[{article.get('title', '제목 없음')}] "
+            f"({article.get('published_date', '날짜 정보 없음')})"
+        )
+        if article.get("summary"):
+            header += f"\n요약: {article['summary']}"
+        return header
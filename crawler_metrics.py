@@ -0,0 +1,239 @@
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from latency_stats import percentile
+
+# 단계별 지연 히스토그램 구간(초). 기사 요청은 수백 ms~수 초, 파싱/분석은 수 ms 단위
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 이전 실행보다 이 배수 이상 느려지면 경고
+SLOWDOWN_RATIO = 1.5
+# 본문/발행일을 찾지 못한 기사 비율이 이보다 높으면 사이트 구조 변경 의심
+MISSING_FIELD_RATIO = 0.2
+
+
+class Histogram:
+    """Prometheus 방식의 누적 구간 히스토그램 (요약용 원본 값도 함께 보관)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.values = []
+
+    def observe(self, seconds):
+        self.values.append(seconds)
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                self.bucket_counts[i] += 1
+
+    def summary(self):
+        values_ms = [value * 1000 for value in self.values]
+        return {
+            "count": len(values_ms),
+            "total_s": round(sum(self.values), 3),
+            "p50_ms": round(percentile(values_ms, 50), 1),
+            "p95_ms": round(percentile(values_ms, 95), 1),
+            "max_ms": round(max(values_ms, default=0.0), 1),
+        }
+
+
+class CrawlerMetrics:
+    """크롤러 단계별 카운터와 지연 히스토그램
+
+    - time(stage): with 블록의 소요 시간을 기록하고, 예외가 나면 단계별 오류로 집계
+    - inc(event): 처리한 페이지/기사 수 등 이벤트 집계
+    - write(): 실행 요약 JSON과 Prometheus 텍스트 형식 파일을 기록
+      (node_exporter textfile collector가 읽을 수 있도록 임시 파일로 쓴 뒤 교체)
+    """
+
+    def __init__(self, json_path=None, prometheus_path=None):
+        self.json_path = json_path or os.getenv(
+            "CRAWLER_METRICS_PATH", os.path.join(".cache", "crawler_metrics.json")
+        )
+        self.prometheus_path = prometheus_path or os.getenv(
+            "CRAWLER_PROMETHEUS_PATH", os.path.join(".cache", "crawler_metrics.prom")
+        )
+        self.started_at = time.time()
+        self.counters = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self.previous = self._load_previous()
+
+    def _load_previous(self):
+        """비교용 이전 실행 요약 (없으면 None)"""
+        try:
+            with open(self.json_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def inc(self, event, amount=1):
+        self.counters[event] += amount
+
+    @contextmanager
+    def time(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[stage] += 1
+            raise
+        finally:
+            self.histograms[stage].observe(time.perf_counter() - started)
+
+    def summary(self):
+        """실행 요약 (처리량, 단계별 지연/오류, 이벤트 수, 이전 실행 대비 경고)"""
+        duration = time.time() - self.started_at
+        summary = {
+            "started_at": self.started_at,
+            "duration_s": round(duration, 2),
+            "pages_per_second": round(self.counters["pages"] / duration, 3),
+            "articles_per_second": round(self.counters["articles_saved"] / duration, 3),
+            "counters": dict(self.counters),
+            "stages": {
+                stage: {**histogram.summary(), "errors": self.errors[stage]}
+                for stage, histogram in self.histograms.items()
+            },
+        }
+        summary["warnings"] = self.warnings(summary)
+        return summary
+
+    def warnings(self, summary):
+        """사이트 구조 변경이나 이전 실행 대비 속도 저하 징후"""
+        warnings = []
+        fetched = self.counters["articles_fetched"]
+        for event, label in (
+            ("articles_missing_body", "본문"),
+            ("articles_missing_date", "발행일"),
+        ):
+            if fetched and self.counters[event] / fetched > MISSING_FIELD_RATIO:
+                warnings.append(
+                    f"기사 {fetched}건 중 {self.counters[event]}건에서 {label}을 찾지 "
+                    "못했습니다. 사이트 구조가 바뀌었는지 확인하세요."
+                )
+        if self.counters["pages_empty"]:
+            warnings.append(
+                f"기사 목록이 비어 있는 페이지가 {self.counters['pages_empty']}개 있습니다."
+            )
+        for stage, errors in self.errors.items():
+            count = len(self.histograms[stage].values)
+            if count and errors / count > MISSING_FIELD_RATIO:
+                warnings.append(f"{stage} 단계 오류율이 {errors / count:.0%}입니다.")
+
+        previous_stages = (self.previous or {}).get("stages", {})
+        for stage, current in summary["stages"].items():
+            previous = previous_stages.get(stage)
+            if (
+                previous
+                and previous["p95_ms"] > 0
+                and current["p95_ms"] > previous["p95_ms"] * SLOWDOWN_RATIO
+            ):
+                warnings.append(
+                    f"{stage} 단계 p95가 이전 실행 {previous['p95_ms']}ms에서 "
+                    f"{current['p95_ms']}ms로 느려졌습니다."
+                )
+        return warnings
+
+    def to_prometheus(self, summary=None):
+        """Prometheus 텍스트 노출 형식"""
+        summary = summary or self.summary()
+        lines = [
+            "# HELP newsbot_crawler_stage_duration_seconds 크롤러 단계별 소요 시간",
+            "# TYPE newsbot_crawler_stage_duration_seconds histogram",
+        ]
+        for stage, histogram in sorted(self.histograms.items()):
+            for upper, count in zip(histogram.buckets, histogram.bucket_counts):
+                lines.append(
+                    f'newsbot_crawler_stage_duration_seconds_bucket{{stage="{stage}",'
+                    f'le="{upper}"}} {count}'
+                )
+            lines.append(
+                f'newsbot_crawler_stage_duration_seconds_bucket{{stage="{stage}",'
+                f'le="+Inf"}} {len(histogram.values)}'
+            )
+            lines.append(
+                f'newsbot_crawler_stage_duration_seconds_sum{{stage="{stage}"}} '
+                f"{sum(histogram.values):.6f}"
+            )
+            lines.append(
+                f'newsbot_crawler_stage_duration_seconds_count{{stage="{stage}"}} '
+                f"{len(histogram.values)}"
+            )
+
+        lines += [
+            "# HELP newsbot_crawler_stage_errors_total 크롤러 단계별 오류 수",
+            "# TYPE newsbot_crawler_stage_errors_total counter",
+        ]
+        for stage in sorted(self.histograms):
+            lines.append(
+                f'newsbot_crawler_stage_errors_total{{stage="{stage}"}} '
+                f"{self.errors[stage]}"
+            )
+
+        lines += [
+            "# HELP newsbot_crawler_events_total 크롤러 처리 건수",
+            "# TYPE newsbot_crawler_events_total counter",
+        ]
+        for event, count in sorted(self.counters.items()):
+            lines.append(f'newsbot_crawler_events_total{{event="{event}"}} {count}')
+
+        lines += [
+            "# HELP newsbot_crawler_run_duration_seconds 마지막 크롤링 실행 시간",
+            "# TYPE newsbot_crawler_run_duration_seconds gauge",
+            f"newsbot_crawler_run_duration_seconds {summary['duration_s']}",
+            "# HELP newsbot_crawler_articles_per_second 마지막 실행의 기사 저장 속도",
+            "# TYPE newsbot_crawler_articles_per_second gauge",
+            f"newsbot_crawler_articles_per_second {summary['articles_per_second']}",
+            "# HELP newsbot_crawler_warnings 마지막 실행의 경고 수",
+            "# TYPE newsbot_crawler_warnings gauge",
+            f"newsbot_crawler_warnings {len(summary['warnings'])}",
+            "# HELP newsbot_crawler_last_run_timestamp_seconds 마지막 실행 시작 시각",
+            "# TYPE newsbot_crawler_last_run_timestamp_seconds gauge",
+            f"newsbot_crawler_last_run_timestamp_seconds {self.started_at:.0f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """요약 JSON과 Prometheus 파일을 기록하고 요약 반환"""
+        summary = self.summary()
+        try:
+            _write_atomic(
+                self.json_path, json.dumps(summary, ensure_ascii=False, indent=2)
+            )
+            _write_atomic(self.prometheus_path, self.to_prometheus(summary))
+        except OSError as e:
+            print(f"크롤러 통계 기록 실패: {e}")
+        return summary
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def print_summary(summary):
+    """실행 요약을 사람이 읽기 쉬운 형태로 출력"""
+    counters = summary["counters"]
+    print(
+        f"\n크롤링 통계: {summary['duration_s']}초 동안 페이지 {counters.get('pages', 0)}개, "
+        f"새 기사 {counters.get('articles_saved', 0)}건 "
+        f"({summary['pages_per_second']} 페이지/초, "
+        f"{summary['articles_per_second']} 기사/초)"
+    )
+    for stage, stats in sorted(
+        summary["stages"].items(), key=lambda item: -item[1]["total_s"]
+    ):
+        print(
+            f"- {stage}: {stats['count']}회, 합계 {stats['total_s']}초, "
+            f"p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, 오류 {stats['errors']}회"
+        )
+    for warning in summary["warnings"]:
+        print(f"경고: {warning}")
@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+import json
+import time
+
+from context_builder import tokenize
+from intent_classifier import QUESTION_TYPES, IntentClassifier, parse_intent_analysis
+
+
+def load_queries(path):
+    """질의 목록 로드 (질의 세트 JSON 또는 query 필드를 가진 JSONL)"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return [item["query"] for item in json.load(f)["queries"]]
+        return [json.loads(line)["query"] for line in f if line.strip()]
+
+
+def load_labels(path):
+    """LLM이 라벨링한 샘플 로드"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def label_with_llm(queries, output_path, concurrency):
+    """LLM 의도 분석으로 질의를 라벨링하여 JSONL로 저장"""
+    from query_action import ResponseGeneration
+
+    response_gen = ResponseGeneration()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def label(query):
+        async with semaphore:
+            raw = await response_gen.analyze_intent_with_llm(query)
+        parsed = parse_intent_analysis(raw)
+        return {"query": query, **parsed, "raw": raw}
+
+    samples = await asyncio.gather(*(label(query) for query in queries))
+    with open(output_path, "w", encoding="utf-8") as f:
+        for sample in samples:
+            f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+    print(f"{len(samples)}개의 질의를 라벨링하여 {output_path}에 저장했습니다.")
+
+
+def keyword_overlap(predicted, expected):
+    """토큰 단위 키워드 자카드 유사도"""
+    predicted_tokens = set(tokenize(" ".join(predicted)))
+    expected_tokens = set(tokenize(" ".join(expected)))
+    if not predicted_tokens and not expected_tokens:
+        return 1.0
+    return len(predicted_tokens & expected_tokens) / len(
+        predicted_tokens | expected_tokens
+    )
+
+
+def evaluate(samples, classifier):
+    """로컬 분류기와 LLM 라벨의 일치도, 로컬 처리 비율, 분류 시간 측정"""
+    samples = [sample for sample in samples if sample.get("question_type")]
+    confusion = {
+        expected: {predicted: 0 for predicted in QUESTION_TYPES}
+        for expected in QUESTION_TYPES
+    }
+    agree = confident = confident_agree = 0
+    overlaps = []
+    elapsed = 0.0
+
+    for sample in samples:
+        started = time.perf_counter()
+        result = classifier.classify(sample["query"])
+        elapsed += time.perf_counter() - started
+
+        matched = result["question_type"] == sample["question_type"]
+        confusion[sample["question_type"]][result["question_type"]] += 1
+        agree += matched
+        overlaps.append(keyword_overlap(result["keywords"], sample["keywords"]))
+        if classifier.is_confident(result):
+            confident += 1
+            confident_agree += matched
+
+    count = len(samples) or 1
+    return {
+        "samples": len(samples),
+        "threshold": classifier.confidence_threshold,
+        "agreement": round(agree / count, 4),
+        "local_coverage": round(confident / count, 4),
+        "confident_agreement": (
+            round(confident_agree / confident, 4) if confident else None
+        ),
+        "keyword_jaccard": round(sum(overlaps) / count, 4),
+        "mean_classify_us": round(elapsed / count * 1e6, 2),
+        "confusion": confusion,
+    }
+
+
+def print_report(report):
+    print(f"샘플 수: {report['samples']}")
+    print(f"전체 일치도: {report['agreement']:.1%}")
+    print(
+        f"로컬 처리 비율 (신뢰도 >= {report['threshold']}): "
+        f"{report['local_coverage']:.1%}"
+    )
+    if report["confident_agreement"] is not None:
+        print(f"로컬 처리분 일치도: {report['confident_agreement']:.1%}")
+    print(f"키워드 자카드 유사도: {report['keyword_jaccard']:.3f}")
+    print(f"평균 분류 시간: {report['mean_classify_us']}µs")
+
+    print("\n혼동 행렬 (행: LLM 라벨, 열: 로컬 분류)")
+    print("\t" + "\t".join(QUESTION_TYPES))
+    for expected, row in report["confusion"].items():
+        print(expected + "\t" + "\t".join(str(row[p]) for p in QUESTION_TYPES))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="로컬 의도 분류기 평가")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    label_parser = subparsers.add_parser("label", help="LLM으로 평가용 샘플 라벨링")
+    label_parser.add_argument("--input", required=True, help="질의 세트 JSON/JSONL")
+    label_parser.add_argument("--output", required=True, help="라벨 JSONL 저장 경로")
+    label_parser.add_argument("--concurrency", type=int, default=4)
+
+    eval_parser = subparsers.add_parser("evaluate", help="LLM 라벨과의 일치도 측정")
+    eval_parser.add_argument("--labels", required=True, help="라벨 JSONL 경로")
+    eval_parser.add_argument("--threshold", type=float, help="신뢰도 기준값")
+    eval_parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "label":
+        asyncio.run(
+            label_with_llm(load_queries(args.input), args.output, args.concurrency)
+        )
+        return
+
+    report = evaluate(load_labels(args.labels), IntentClassifier(args.threshold))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
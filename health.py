@@ -0,0 +1,68 @@
+import os
+import threading
+import time
+
+
+class HealthMonitor:
+    """외부 서비스 연결 상태를 백그라운드 스레드에서 주기적으로 점검하고 결과를 보관
+
+    - checks: {이름: 점검 함수} (정상이면 반환, 실패하면 예외 발생)
+    - warm_up: 첫 점검 전에 한 번 실행할 준비 작업 (SDK 로딩, 연결 생성 등)
+    - status()는 점검을 기다리지 않고 마지막 결과만 반환하므로 화면 표시에 사용
+    """
+
+    def __init__(self, checks, warm_up=None, interval=None):
+        self.checks = checks
+        self.warm_up = warm_up
+        self.interval = interval or float(
+            os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "30")
+        )
+        self._status = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 점검 시작 (이미 시작했으면 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="newsbot-health-monitor", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        if self.warm_up is not None:
+            try:
+                self.warm_up()
+            except Exception as e:
+                print(f"연결 준비 중 오류 발생: {e}")
+        while not self._stop.is_set():
+            self.check_now()
+            self._stop.wait(self.interval)
+
+    def check_now(self):
+        """모든 점검을 바로 실행하고 결과를 갱신하여 반환"""
+        for name, check in self.checks.items():
+            started = time.perf_counter()
+            try:
+                check()
+                result = {"ok": True, "error": None}
+            except Exception as e:
+                result = {"ok": False, "error": str(e)[:200]}
+            result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            result["checked_at"] = time.time()
+            with self._lock:
+                self._status[name] = result
+        return self.status()
+
+    def status(self):
+        """마지막 점검 결과 {이름: {ok, error, latency_ms, checked_at}} (점검 전이면 빈 dict)"""
+        with self._lock:
+            return {name: dict(result) for name, result in self._status.items()}
@@ -0,0 +1,166 @@
+import os
+import re
+
+from context_builder import tokenize
+
+QUESTION_TYPES = ("사실 확인", "날짜 확인", "방법 설명", "의견 요청", "비교 분석")
+
+# 질문 유형별 (정규식, 가중치) 패턴
+INTENT_PATTERNS = {
+    "날짜 확인": [
+        (r"언제", 2.0),
+        (r"날짜|일정|시기|시점|몇\s*(년|월|일|시)|기간", 1.5),
+        (r"출시일|발표일|개최일|마감|연도", 1.0),
+    ],
+    "방법 설명": [
+        (r"어떻게\s*(하|해|사용|쓰|만들|설치|적용|시작|신청)", 2.0),
+        (r"방법|하는\s*법|절차|과정|사용법|가이드|단계", 1.5),
+        (r"어떻게", 0.6),
+    ],
+    "비교 분석": [
+        (r"비교|차이|다른\s*점|다른가|vs|대비", 2.0),
+        (r"장단점|우위|어느\s*(쪽|것)|뭐가\s*더|보다\s*(나은|좋은|빠른)", 1.5),
+    ],
+    "의견 요청": [
+        (r"생각|의견|평가|추천|어떨까|괜찮을까|어때", 2.0),
+        (r"전망|향후|앞으로|미래|가능성|영향", 1.0),
+    ],
+    "사실 확인": [
+        (r"무엇|뭐|누가|어디|있나요|인가요|했나요|됐나요|맞나요|알려", 1.0),
+        (r"현황|동향|소식|근황|발표|공개|출시", 0.8),
+        (r"궁금", 0.5),
+    ],
+}
+
+# 질문 표현일 뿐 검색 키워드로는 쓸모없는 단어
+QUESTION_STOP_WORDS = {
+    "언제",
+    "어디",
+    "어떻게",
+    "무엇",
+    "무엇을",
+    "누가",
+    "왜",
+    "뭐",
+    "알려",
+    "알려주세요",
+    "궁금",
+    "궁금해요",
+    "있나요",
+    "있어요",
+    "인가요",
+    "했나요",
+    "됐나요",
+    "대해",
+    "관련",
+    "어떤",
+    "있",
+    "주세요",
+    "것",
+    "것들",
+}
+
+# 질문을 끝맺는 용언 (예: "마련되나요", "만들어요")
+QUESTION_ENDING = re.compile(r"(나요|가요|까요|어요|아요|해요|세요|니다|니까|는지|해)$")
+
+INFO_TEMPLATES = {
+    "사실 확인": "{keywords}에 대한 사실 정보와 주요 내용",
+    "날짜 확인": "{keywords}와 관련된 날짜 및 시간 정보",
+    "방법 설명": "{keywords}의 방법, 절차와 단계",
+    "의견 요청": "{keywords}에 대한 전망과 평가의 근거",
+    "비교 분석": "{keywords} 사이의 차이점과 비교 근거",
+}
+
+
+class IntentClassifier:
+    """규칙/패턴 기반 질문 의도 분류기
+
+    LLM 의도 분석과 같은 구조(질문 유형, 핵심 키워드, 찾아야 할 정보)를
+    로컬에서 계산하며, 신뢰도가 낮으면 호출 측에서 LLM으로 대체하도록 함
+    """
+
+    def __init__(self, confidence_threshold=None):
+        self.confidence_threshold = confidence_threshold or float(
+            os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.6")
+        )
+        self._patterns = {
+            question_type: [(re.compile(pattern), weight) for pattern, weight in rules]
+            for question_type, rules in INTENT_PATTERNS.items()
+        }
+
+    def classify(self, query):
+        """질문을 분류하여 유형, 키워드, 찾아야 할 정보, 신뢰도를 반환"""
+        text = query.lower()
+        scores = {
+            question_type: sum(
+                weight for pattern, weight in rules if pattern.search(text)
+            )
+            for question_type, rules in self._patterns.items()
+        }
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (top_type, top_score), (_, second_score) = ranked[0], ranked[1]
+
+        if top_score == 0:
+            # 아무 패턴도 맞지 않으면 사실 확인으로 보되 신뢰도는 낮게
+            question_type, confidence = "사실 확인", 0.4
+        else:
+            question_type = top_type
+            margin = top_score / (top_score + second_score)
+            confidence = round(margin * min(1.0, top_score / 1.5), 3)
+
+        keywords = self.extract_keywords(query)
+        return {
+            "question_type": question_type,
+            "keywords": keywords,
+            "info_needed": INFO_TEMPLATES[question_type].format(
+                keywords=", ".join(keywords) or "질문 주제"
+            ),
+            "confidence": confidence,
+            "scores": scores,
+        }
+
+    def is_confident(self, result):
+        return result["confidence"] >= self.confidence_threshold
+
+    @staticmethod
+    def extract_keywords(query):
+        """질문 표현을 제외한 핵심 키워드 (등장 순서 유지, 중복 제거)"""
+        keywords = []
+        for token in tokenize(query):
+            if token in QUESTION_STOP_WORDS or QUESTION_ENDING.search(token):
+                continue
+            if len(token) < 2 and not token.isdigit():
+                continue
+            if token not in keywords:
+                keywords.append(token)
+        return keywords
+
+
+def format_intent_analysis(result):
+    """분류 결과를 LLM 의도 분석과 같은 형식의 텍스트로 변환"""
+    return (
+        f"1. 질문 유형: {result['question_type']}\n"
+        f"2. 핵심 키워드: {', '.join(result['keywords'])}\n"
+        f"3. 찾아야 할 정보: {result['info_needed']}"
+    )
+
+
+def parse_intent_analysis(text):
+    """LLM 의도 분석 텍스트에서 질문 유형과 핵심 키워드 추출"""
+    question_type = None
+    match = re.search(r"질문 유형\s*[:：]\s*(.+)", text or "")
+    if match:
+        for candidate in QUESTION_TYPES:
+            if candidate in match.group(1):
+                question_type = candidate
+                break
+
+    keywords = []
+    match = re.search(r"핵심 키워드\s*[:：]\s*(.+)", text or "")
+    if match:
+        keywords = [
+            keyword.strip(" *'\"()")
+            for keyword in re.split(r"[,，/]", match.group(1))
+            if keyword.strip(" *'\"()")
+        ]
+    return {"question_type": question_type, "keywords": keywords}
@@ -0,0 +1,13 @@
+# 지연 시간 집계 도구. 보고서/CLI가 검색 백엔드 등 무거운 모듈을 불러오지 않도록
+# 표준 라이브러리 외에는 의존하지 않음
+
+
+def percentile(values, pct):
+    """선형 보간 방식의 백분위수 계산"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from context_builder import estimate_tokens
+from resilience import Upstream, env_seconds
+from tracing import current_span, span
+
+
+class AsyncLLMClient:
+    """LLM 백엔드 호출을 이벤트 루프를 막지 않고 실행하는 비동기 클라이언트
+
+    블로킹 백엔드(llm_providers.LLMProvider) 호출을 프로세스 공용 스레드 풀에서 실행하고,
+    이벤트 루프별 세마포어로 동시 호출 수를 제한하며, 호출 시간 제한, 헤지 재시도와
+    차단기는 resilience.Upstream으로 적용
+
+    - 시간 초과나 취소로 호출 측이 기다림을 그만둬도 스레드의 블로킹 호출은 끝까지
+      실행되므로, 세마포어 슬롯은 스레드가 실제로 끝날 때 반납. 따라서 한 이벤트
+      루프가 점유하는 스레드는 max_concurrency개를 넘지 않음
+    - 스레드 풀은 여러 이벤트 루프(세션 스레드, 일괄 처리)가 공유하므로 동시 호출
+      제한과 따로 크기를 정함. 기본값은 제한의 2배이고, 헤지 재시도를 쓰면 제한만큼
+      더 둠 (LLM_EXECUTOR_WORKERS로 변경). 풀이 제한과 같으면 한 루프의 헤지나
+      끝나지 않은 호출 때문에 다른 루프의 호출이 queue_wait_ms에 잡히지 않고
+      풀 안에서 대기하게 됨
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, provider, max_concurrency=None, timeout=None):
+        self.provider = provider
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("LLM_MAX_CONCURRENCY", "8")
+        )
+        self.timeout = timeout or float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+        self.upstream = Upstream(
+            "llm", self.timeout, hedge_after=env_seconds("LLM_HEDGE_AFTER_SECONDS")
+        )
+        headroom = 3 if self.upstream.hedge_after else 2
+        self.executor_workers = int(
+            os.getenv("LLM_EXECUTOR_WORKERS", str(self.max_concurrency * headroom))
+        )
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls, max_workers):
+        """모든 클라이언트가 공유하는 LLM 호출용 스레드 풀"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="llm-call"
+                )
+            return cls._executor
+
+    def _get_semaphore(self):
+        """현재 이벤트 루프에 묶인 동시 호출 제한 세마포어"""
+        loop = asyncio.get_running_loop()
+        # 여러 세션 스레드가 같은 클라이언트를 공유하므로 등록은 잠금 안에서 처리
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def generate(self, prompt, timeout=None, deadline=None):
+        """프롬프트로 답변을 생성하여 텍스트 반환
+
+        deadline을 넘기면 남은 요청 예산과 timeout 중 짧은 시간만 기다림
+        """
+        with span("llm.generate", prompt_tokens=estimate_tokens(prompt)) as llm_span:
+            text = await self.upstream.call(
+                lambda: self._generate(prompt), deadline=deadline, timeout=timeout
+            )
+            llm_span.set_attribute("response_tokens", estimate_tokens(text))
+            return text
+
+    async def _acquire_slot(self):
+        """동시 호출 슬롯을 얻고 세마포어 반환 (반납은 _release_when_done)"""
+        semaphore = self._get_semaphore()
+        waited = time.perf_counter()
+        await semaphore.acquire()
+        # 동시 호출 제한에 걸려 기다린 시간 (느린 답변이 대기 때문인지 구분)
+        current_span().set_attribute(
+            "queue_wait_ms", round((time.perf_counter() - waited) * 1000, 1)
+        )
+        return semaphore
+
+    @staticmethod
+    def _release_when_done(semaphore, future):
+        """스레드에서 실행 중인 호출이 실제로 끝나면 슬롯 반납"""
+
+        def done(future):
+            semaphore.release()
+            if not future.cancelled():
+                # 기다리던 쪽이 먼저 떠난 뒤의 예외는 여기서 확인 처리
+                future.exception()
+
+        future.add_done_callback(done)
+
+    async def _generate(self, prompt):
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(self.executor_workers)
+        semaphore = await self._acquire_slot()
+        try:
+            future = loop.run_in_executor(executor, self.provider.generate, prompt)
+        except BaseException:
+            semaphore.release()
+            raise
+        self._release_when_done(semaphore, future)
+        # 시간 초과로 취소되어도 스레드의 호출은 취소되지 않으므로 future는 그대로 둠
+        return await asyncio.shield(future)
+
+    def stream(self, prompt, timeout=None, deadline=None):
+        """프롬프트로 답변을 스트리밍 생성하여 텍스트 조각을 차례로 반환하는 비동기
+        제너레이터
+
+        timeout은 조각 사이의 최대 대기 시간으로 적용하며, 첫 조각은 deadline의
+        남은 예산 안에 도착해야 함
+        """
+        timeout = timeout or self.timeout
+        first_timeout = deadline.timeout(timeout) if deadline is not None else timeout
+        return self.upstream.stream(self._stream(prompt, timeout, first_timeout))
+
+    async def _stream(self, prompt, timeout, first_timeout):
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(self.executor_workers)
+        queue = asyncio.Queue()
+        cancelled = threading.Event()
+        finished = object()
+
+        def put(item):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # 소비 측 이벤트 루프가 이미 닫힌 경우
+                cancelled.set()
+
+        def produce():
+            try:
+                for chunk in self.provider.stream(prompt):
+                    if cancelled.is_set():
+                        break
+                    put(chunk)
+            except Exception as e:
+                put(e)
+            finally:
+                put(finished)
+
+        semaphore = await self._acquire_slot()
+        try:
+            future = loop.run_in_executor(executor, produce)
+        except BaseException:
+            semaphore.release()
+            raise
+        # 소비를 멈춰도 생산 스레드는 다음 조각을 받을 때까지 실행되므로 그때 반납
+        self._release_when_done(semaphore, future)
+        try:
+            wait = first_timeout
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), wait)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"LLM 스트리밍 응답이 {wait:.1f}초 동안 없습니다."
+                    )
+                wait = timeout
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
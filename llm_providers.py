@@ -0,0 +1,158 @@
+import hashlib
+import os
+import re
+import threading
+import time
+
+LLM_PROVIDERS = ("gemini", "fake")
+
+
+class LLMProvider:
+    """LLM 백엔드 인터페이스
+
+    generate/stream은 블로킹 호출이며, AsyncLLMClient가 스레드 풀에서 실행함
+    """
+
+    name = "base"
+
+    def generate(self, prompt):
+        """프롬프트에 대한 전체 답변 텍스트 반환"""
+        raise NotImplementedError
+
+    def stream(self, prompt):
+        """프롬프트에 대한 답변을 텍스트 조각 단위로 차례로 반환"""
+        raise NotImplementedError
+
+    def warm_up(self):
+        """첫 요청 전에 SDK 로딩 등 준비 작업 수행 (필요한 백엔드만 구현)"""
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini API 백엔드"""
+
+    name = "gemini"
+
+    def __init__(self, model_name=None, api_key=None):
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
+        self.model_name = model_name or os.getenv(
+            "GEMINI_MODEL", "gemini-2.0-flash-exp"
+        )
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        # SDK는 불러오는 데 1초 가까이 걸리므로 시작 시점이 아니라 처음 쓸 때 불러오며,
+        # 오프라인 실행 시 SDK가 없어도 되도록 Gemini를 쓸 때만 불러옴
+        with self._model_lock:
+            if self._model is None:
+                from google.generativeai import configure, GenerativeModel
+
+                configure(api_key=self.api_key)
+                self._model = GenerativeModel(self.model_name)
+            return self._model
+
+    def warm_up(self):
+        self.model
+
+    def generate(self, prompt):
+        return self.model.generate_content(prompt).text
+
+    def stream(self, prompt):
+        for chunk in self.model.generate_content(prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeProvider(LLMProvider):
+    """네트워크 없이 파이프라인을 실행/측정하기 위한 결정적 가짜 백엔드
+
+    - 같은 프롬프트에는 항상 같은 답변을 반환
+    - 첫 조각까지 latency초, 이후 chars_per_second 속도로 답변을 내보냄
+    - 프롬프트의 답변 형식 항목을 채워 검토 정책이 실제와 비슷하게 동작하도록 함
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency=None,
+        chars_per_second=None,
+        chunk_chars=None,
+        response_chars=None,
+    ):
+        self.latency = (
+            latency
+            if latency is not None
+            else float(os.getenv("FAKE_LLM_LATENCY_SECONDS", "0.5"))
+        )
+        self.chars_per_second = chars_per_second or float(
+            os.getenv("FAKE_LLM_CHARS_PER_SECOND", "400")
+        )
+        self.chunk_chars = chunk_chars or int(os.getenv("FAKE_LLM_CHUNK_CHARS", "20"))
+        self.response_chars = response_chars or int(
+            os.getenv("FAKE_LLM_RESPONSE_CHARS", "600")
+        )
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate(self, prompt):
+        response = self._respond(prompt)
+        time.sleep(self.latency + len(response) / self.chars_per_second)
+        return response
+
+    def stream(self, prompt):
+        response = self._respond(prompt)
+        time.sleep(self.latency)
+        for start in range(0, len(response), self.chunk_chars):
+            chunk = response[start : start + self.chunk_chars]
+            time.sleep(len(chunk) / self.chars_per_second)
+            yield chunk
+
+    def _respond(self, prompt):
+        """프롬프트 종류에 맞는 결정적 답변 구성"""
+        with self._lock:
+            self.calls += 1
+
+        if "원본 답변 사용" in prompt:
+            return "원본 답변 사용"
+
+        question = re.search(r"^질문: (.+)$", prompt, re.MULTILINE)
+        question = question.group(1).strip() if question else ""
+        if "핵심 키워드: (" in prompt:
+            return (
+                "1. 질문 유형: 사실 확인\n"
+                f"2. 핵심 키워드: {', '.join(question.split()[:4])}\n"
+                f"3. 찾아야 할 정보: {question}에 대한 기사 내용"
+            )
+
+        title = re.search(r"^제목: (.+)$", prompt, re.MULTILINE)
+        title = title.group(1).strip() if title else "관련 기사 없음"
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+        # 마지막 "형식:" 블록의 "1. 항목: (설명)" 줄에서 항목 이름만 사용
+        format_block = re.split(r"형식:\n", prompt)[-1]
+        sections = re.findall(r"^\d+\. ([^:\n]+):", format_block, re.MULTILINE) or [
+            "답변"
+        ]
+
+        body_chars = max(40, self.response_chars // len(sections))
+        filler = f"'{title}' 기사 내용을 바탕으로 한 가짜 답변입니다 ({digest}). "
+        lines = []
+        for index, section in enumerate(sections, 1):
+            text = (filler * (body_chars // len(filler) + 1))[:body_chars]
+            lines.append(f"{index}. {section}: {text.strip()}")
+        return "\n".join(lines)
+
+
+def create_provider(name=None):
+    """LLM_PROVIDER 환경 변수(기본 gemini)에 따라 LLM 백엔드 생성"""
+    name = (name or os.getenv("LLM_PROVIDER", "gemini")).lower()
+    if name == "gemini":
+        return GeminiProvider()
+    if name == "fake":
+        return FakeProvider()
+    raise ValueError(
+        f"지원하지 않는 LLM 백엔드입니다: {name} ({', '.join(LLM_PROVIDERS)})"
+    )
@@ -0,0 +1,285 @@
+import argparse
+import json
+import os
+import pickle
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from latency_stats import percentile
+from search_benchmark import load_query_set
+
+
+def current_rss_mb():
+    """현재 프로세스의 RSS (MB). /proc이 없는 환경에서는 최대 RSS로 대신함"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위는 Linux에서 KB, macOS에서 바이트
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def configure_environment(args):
+    """로컬 대역(메모리 검색, 가짜 LLM)과 지연 시간 설정
+
+    챗봇 모듈이 환경 변수를 읽기 전에 호출해야 함
+    """
+    os.environ["NEWSBOT_BACKEND"] = "local"
+    os.environ["LLM_PROVIDER"] = "fake"
+    os.environ["LOCAL_SEARCH_LATENCY_SECONDS"] = str(args.search_latency)
+    os.environ["FAKE_LLM_LATENCY_SECONDS"] = str(args.llm_latency)
+    os.environ["FAKE_LLM_CHARS_PER_SECOND"] = str(args.llm_chars_per_second)
+    # 이전 실행의 캐시가 결과에 섞이지 않도록 매번 새 캐시 사용
+    os.environ["RESPONSE_CACHE_PATH"] = os.path.join(
+        tempfile.mkdtemp(prefix="newsbot-load-"), "response_cache.sqlite3"
+    )
+
+
+def session_queries(queries, user, messages, unique):
+    """사용자마다 질의 세트를 다른 위치부터 돌며 사용 (unique면 캐시 적중 방지)"""
+    selected = []
+    for i in range(messages):
+        query = queries[(user * messages + i) % len(queries)]
+        selected.append(f"{query} ({user}-{i})" if unique else query)
+    return selected
+
+
+def run_headless(queries, args):
+    """사용자별 스레드에서 StreamlitChatbot.process_user_input과 같은 흐름을 실행
+
+    공유 챗봇과 공유 백그라운드 이벤트 루프를 쓰고, 세션 상태는 ChatSession으로 보관.
+    (결과 목록, 세션 목록, 준비 후 RSS, 소요 시간)을 반환
+    """
+    from async_runtime import BackgroundEventLoop
+    from chat_session import ChatSession
+    from query_action import NewsChatbot
+
+    chatbot = NewsChatbot()
+    runtime = BackgroundEventLoop()
+    results = []
+    sessions = []
+    lock = threading.Lock()
+
+    def simulate_user(user):
+        session = ChatSession()
+        for query in session_queries(queries, user, args.messages, args.unique):
+            session.add_user_message(query)
+            started = time.perf_counter()
+            first_token = None
+            try:
+                main_article, related_articles, _, chunks = runtime.run(
+                    chatbot.stream_query(query, {})
+                )
+                parts = []
+                for chunk in runtime.iterate(chunks):
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+                    parts.append(chunk)
+                articles = [main_article] + related_articles if main_article else []
+                session.add_assistant_message("".join(parts), articles)
+                ok = True
+            except Exception as e:
+                print(f"사용자 {user} 요청 실패: {e}")
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                results.append(
+                    {"ok": ok, "latency": elapsed, "first_token": first_token}
+                )
+            time.sleep(args.think_time)
+        with lock:
+            sessions.append(session)
+
+    threads = [
+        threading.Thread(target=simulate_user, args=(user,))
+        for user in range(args.users)
+    ]
+    baseline_rss = current_rss_mb()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+    runtime.stop()
+    return results, sessions, baseline_rss, duration
+
+
+def run_apptest(queries, args):
+    """Streamlit AppTest로 app.py 스크립트 전체(렌더링 포함)를 실행
+
+    AppTest는 여러 스레드에서 동시에 실행할 수 없으므로 세션들을 번갈아 실행하며,
+    재실행 한 번의 비용과 세션 상태 크기를 측정하는 용도.
+    (결과 목록, 세션 목록, 준비 후 RSS, 소요 시간)을 반환
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    apps = []
+    for _ in range(args.users):
+        app = AppTest.from_file(app_path, default_timeout=args.timeout)
+        app.run()
+        apps.append(app)
+
+    user_queries = [
+        session_queries(queries, user, args.messages, args.unique)
+        for user in range(args.users)
+    ]
+    results = []
+    baseline_rss = current_rss_mb()
+    started = time.perf_counter()
+    for i in range(args.messages):
+        for user, app in enumerate(apps):
+            request_started = time.perf_counter()
+            app.chat_input[0].set_value(user_queries[user][i]).run()
+            results.append(
+                {
+                    "ok": not app.exception,
+                    "latency": time.perf_counter() - request_started,
+                    "first_token": None,
+                }
+            )
+            time.sleep(args.think_time)
+    duration = time.perf_counter() - started
+    sessions = [app.session_state["chat_session"] for app in apps]
+    return results, sessions, baseline_rss, duration
+
+
+def summarize(results, sessions, duration, baseline_rss, args):
+    latencies = [r["latency"] * 1000 for r in results if r["ok"]]
+    first_tokens = [
+        r["first_token"] * 1000
+        for r in results
+        if r["ok"] and r["first_token"] is not None
+    ]
+    session_bytes = [len(pickle.dumps(session)) for session in sessions]
+    # 세션 객체가 아직 살아 있을 때의 RSS로 세션당 메모리를 추정
+    final_rss = current_rss_mb()
+    # 두 값은 집계 방식이 달라 종료 시점 RSS가 조금 더 크게 나올 수 있음
+    peak_rss = max(peak_rss_mb(), final_rss)
+
+    def distribution(values):
+        return {
+            "p50": round(percentile(values, 50), 1),
+            "p95": round(percentile(values, 95), 1),
+            "p99": round(percentile(values, 99), 1),
+            "max": round(max(values, default=0.0), 1),
+        }
+
+    return {
+        "driver": args.driver,
+        "users": args.users,
+        "messages_per_user": args.messages,
+        "requests": len(results),
+        "errors": sum(1 for r in results if not r["ok"]),
+        "duration_s": round(duration, 2),
+        "throughput_rps": round(len(latencies) / duration, 2) if duration else 0.0,
+        "latency_ms": distribution(latencies),
+        "first_token_ms": distribution(first_tokens) if first_tokens else None,
+        "memory": {
+            "baseline_rss_mb": round(baseline_rss, 1),
+            "final_rss_mb": round(final_rss, 1),
+            "peak_rss_mb": round(peak_rss, 1),
+            "rss_per_session_kb": round(
+                (final_rss - baseline_rss) * 1024 / max(args.users, 1), 1
+            ),
+            "session_state_bytes": (
+                round(sum(session_bytes) / len(session_bytes)) if session_bytes else 0
+            ),
+        },
+        "config": {
+            "search_latency_s": args.search_latency,
+            "llm_latency_s": args.llm_latency,
+            "llm_chars_per_second": args.llm_chars_per_second,
+            "think_time_s": args.think_time,
+            "unique_queries": args.unique,
+        },
+    }
+
+
+def print_report(report):
+    print(
+        f"[{report['driver']}] 사용자 {report['users']}명 × "
+        f"{report['messages_per_user']}회 = {report['requests']}건 "
+        f"(실패 {report['errors']}건), {report['duration_s']}초"
+    )
+    print(f"처리량: {report['throughput_rps']} 요청/초")
+    latency = report["latency_ms"]
+    print(
+        f"전체 지연: p50 {latency['p50']}ms, p95 {latency['p95']}ms, "
+        f"p99 {latency['p99']}ms, 최대 {latency['max']}ms"
+    )
+    if report["first_token_ms"]:
+        first = report["first_token_ms"]
+        print(
+            f"첫 응답: p50 {first['p50']}ms, p95 {first['p95']}ms, p99 {first['p99']}ms"
+        )
+    memory = report["memory"]
+    print(
+        f"메모리: RSS 시작 {memory['baseline_rss_mb']}MB → 종료 "
+        f"{memory['final_rss_mb']}MB (최대 {memory['peak_rss_mb']}MB, "
+        f"세션당 약 {memory['rss_per_session_kb']}KB), "
+        f"세션 상태 평균 {memory['session_state_bytes']}바이트"
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="로컬 대역을 사용한 챗봇 다중 사용자 부하 테스트"
+    )
+    parser.add_argument(
+        "--driver",
+        choices=("headless", "apptest"),
+        default="headless",
+        help="headless: 스레드로 동시 세션 실행, apptest: AppTest로 스크립트 전체 실행",
+    )
+    parser.add_argument("--users", type=int, default=10, help="동시 사용자 수")
+    parser.add_argument("--messages", type=int, default=5, help="사용자당 질문 수")
+    parser.add_argument(
+        "--queries", default="benchmark/queries_v1.json", help="질의 세트 경로"
+    )
+    parser.add_argument("--search-latency", type=float, default=0.02)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-chars-per-second", type=float, default=400)
+    parser.add_argument(
+        "--think-time", type=float, default=0.0, help="질문 사이 대기 시간(초)"
+    )
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="질문마다 꼬리표를 붙여 답변 캐시 적중을 막음",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="AppTest 실행 제한 시간(초)"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+    queries = [item["query"] for item in load_query_set(args.queries)["queries"]]
+
+    driver = run_headless if args.driver == "headless" else run_apptest
+    results, sessions, baseline_rss, duration = driver(queries, args)
+
+    report = summarize(results, sessions, duration, baseline_rss, args)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import os
+from collections import Counter
+
+from article_enrichment import ArticleEnricher
+from context_builder import tokenize
+from tracing import current_span
+
+DEFAULT_CORPUS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark", "corpus_v1.jsonl"
+)
+
+
+class InMemoryCollection:
+    """MongoDB 컬렉션 대신 쓰는 메모리 컬렉션 (동기화 경로에서 쓰는 기능만 지원)"""
+
+    def __init__(self, documents=None):
+        self.documents = list(documents or [])
+
+    def find(self, filter=None):
+        filter = filter or {}
+        return [
+            dict(doc)
+            for doc in self.documents
+            if all(doc.get(key) == value for key, value in filter.items())
+        ]
+
+    def count_documents(self, filter=None):
+        return len(self.find(filter))
+
+    def insert_many(self, documents):
+        self.documents.extend(dict(doc) for doc in documents)
+
+
+def enrich_documents(documents):
+    """요약/핵심어가 없는 픽스처 기사에 크롤러와 같은 방식으로 계산하여 추가"""
+    enricher = ArticleEnricher()
+    for doc in documents:
+        enricher.add_document(doc["cleaned_content"])
+    for doc in documents:
+        if "summary" not in doc:
+            doc.update(enricher.enrich(doc["title"], doc["cleaned_content"]))
+
+
+class LocalSearch:
+    """DatabaseSearch와 같은 인터페이스로 픽스처 코퍼스를 메모리에서 검색하는 클래스
+
+    Elasticsearch/MongoDB 없이 챗봇을 실행하거나 부하 테스트할 때 사용하며,
+    검색마다 latency초를 기다려 네트워크 왕복을 흉내 냄
+    """
+
+    def __init__(self, corpus_path=None, latency=None):
+        self.index_name = "local"
+        self.latency = (
+            latency
+            if latency is not None
+            else float(os.getenv("LOCAL_SEARCH_LATENCY_SECONDS", "0.02"))
+        )
+        corpus_path = corpus_path or os.getenv("LOCAL_CORPUS_PATH", DEFAULT_CORPUS_PATH)
+        with open(corpus_path, encoding="utf-8") as f:
+            documents = [json.loads(line) for line in f if line.strip()]
+        enrich_documents(documents)
+
+        self.mongo_client = None
+        self.mongo_collection = InMemoryCollection(documents)
+        self._index = [
+            (
+                doc,
+                Counter(tokenize(doc["title"])),
+                Counter(tokenize(doc["cleaned_content"])),
+            )
+            for doc in documents
+        ]
+
+    async def semantic_search(self, query, size=7, deadline=None):
+        """제목 가중치를 둔 단순 단어 빈도 검색 (결과 형식은 DatabaseSearch와 동일)"""
+        await asyncio.sleep(self.latency)
+        terms = set(tokenize(query))
+        scored = []
+        for doc, title_terms, content_terms in self._index:
+            score = sum(3 * title_terms[term] + content_terms[term] for term in terms)
+            if score:
+                scored.append((score, doc))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        current_span().set_attribute("hits", min(len(scored), size))
+
+        return [
+            {
+                "id": doc["id"],
+                "title": doc["title"],
+                "content": doc["cleaned_content"],
+                "content_preview": doc["cleaned_content"][:300] + "...",
+                "url": doc["url"],
+                "crawled_date": doc.get("crawled_date", "날짜 정보 없음"),
+                "published_date": doc.get("published_date", "날짜 정보 없음"),
+                "categories": doc.get("categories", []),
+                "summary": doc["summary"],
+                "keyphrases": doc["keyphrases"],
+                "score": float(score),
+                "highlights": {},
+            }
+            for score, doc in scored[:size]
+        ]
+
+    def health_checks(self):
+        """외부 연결이 없으므로 점검할 항목 없음"""
+        return {}
+
+    def suggest(self, prefix, size=5):
+        """제목의 단어가 prefix로 시작하는 기사를 최신순으로 반환"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        matches = [
+            doc
+            for doc, _, _ in self._index
+            if any(word.lower().startswith(prefix) for word in doc["title"].split())
+        ]
+        matches.sort(key=lambda doc: doc.get("published_date") or "", reverse=True)
+        return [
+            {
+                "id": doc["id"],
+                "title": doc["title"],
+                "url": doc["url"],
+                "published_date": doc.get("published_date", "날짜 정보 없음"),
+            }
+            for doc in matches[:size]
+        ]
+
+    def get_corpus_analytics(self, category_size=20):
+        """DatabaseSearch.get_corpus_analytics와 같은 형식의 코퍼스 통계"""
+        documents = [doc for doc, _, _ in self._index]
+        categories = Counter(
+            category
+            for doc in documents
+            for category in (doc.get("categories") or ["미분류"])
+        )
+        published = Counter(
+            doc["published_date"][:10] for doc in documents if doc.get("published_date")
+        )
+        word_counts = [
+            doc["metadata"]["word_count"]
+            for doc in documents
+            if doc.get("metadata", {}).get("word_count") is not None
+        ]
+        return {
+            "total_articles": len(documents),
+            "categories": dict(categories.most_common(category_size)),
+            "published_per_day": dict(sorted(published.items())),
+            "word_count": {
+                "count": len(word_counts),
+                "min": min(word_counts, default=None),
+                "max": max(word_counts, default=None),
+                "avg": sum(word_counts) / len(word_counts) if word_counts else None,
+            },
+            "latest_published_date": max(published, default=None),
+        }
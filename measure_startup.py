@@ -0,0 +1,134 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 새 파이썬 프로세스에서 실행할 측정 스크립트 (단계별 경과 시간을 JSON으로 출력)
+CLI_PROBE = """
+import json, time
+started = time.perf_counter()
+import query_action
+imported = time.perf_counter()
+chatbot = query_action.NewsChatbot()
+ready = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "init": ready - imported,
+    "ready": ready - started,
+}))
+"""
+
+APP_PROBE = """
+import json, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file({app_path!r}, default_timeout={timeout})
+app.run()
+rendered = time.perf_counter()
+print(json.dumps({{
+    "import": imported - started,
+    "first_render": rendered - imported,
+    "ready": rendered - started,
+    "exception": bool(app.exception),
+}}))
+"""
+
+
+def run_probe(code):
+    """측정 스크립트를 새 프로세스에서 실행하고 측정값에 프로세스 전체 시간(process)을 더해 반환"""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+    # 모듈이 출력하는 안내 문구 뒤의 마지막 줄이 측정 결과
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process"] = wall
+    return result
+
+
+def summarize(samples):
+    """측정값별 중앙값과 최댓값(ms)"""
+    keys = [key for key, value in samples[0].items() if isinstance(value, float)]
+    return {
+        key: {
+            "median_ms": round(statistics.median(s[key] for s in samples) * 1000, 1),
+            "max_ms": round(max(s[key] for s in samples) * 1000, 1),
+        }
+        for key in keys
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="CLI 진입점과 Streamlit 앱의 콜드 스타트 시간 측정"
+    )
+    parser.add_argument(
+        "--target",
+        choices=("cli", "app", "all"),
+        default="all",
+        help="cli: 모듈 import와 NewsChatbot 생성, app: app.py 첫 화면 실행(AppTest)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument(
+        "--backend", choices=("local", "elasticsearch"), help="NEWSBOT_BACKEND 지정"
+    )
+    parser.add_argument(
+        "--provider", choices=("gemini", "fake"), help="LLM_PROVIDER 지정"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="AppTest 실행 제한 시간(초)"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # 자식 프로세스가 환경 변수를 물려받음
+    if args.backend:
+        os.environ["NEWSBOT_BACKEND"] = args.backend
+    if args.provider:
+        os.environ["LLM_PROVIDER"] = args.provider
+
+    probes = {
+        "cli": CLI_PROBE,
+        "app": APP_PROBE.format(
+            app_path=os.path.join(PACKAGE_DIR, "app.py"), timeout=args.timeout
+        ),
+    }
+    targets = list(probes) if args.target == "all" else [args.target]
+
+    report = {}
+    for target in targets:
+        samples = [run_probe(probes[target]) for _ in range(args.repeat)]
+        report[target] = summarize(samples)
+        if any(sample.get("exception") for sample in samples):
+            report[target]["exception"] = True
+
+        parts = ", ".join(
+            f"{key} {value['median_ms']}ms"
+            for key, value in report[target].items()
+            if key != "exception"
+        )
+        print(f"[{target}] 중앙값 ({args.repeat}회): {parts}")
+        if report[target].get("exception"):
+            print(f"[{target}] 앱 실행 중 예외가 발생했습니다.")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
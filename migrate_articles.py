@@ -0,0 +1,131 @@
+import argparse
+from datetime import timedelta
+
+from mongo_indexes import DATE_FIELDS, ensure_article_indexes, now_kst, to_datetime
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="articles 컬렉션의 문자열 날짜를 BSON 날짜로 변환하고 인덱스 정리"
+    )
+    parser.add_argument("--mongo-uri", default="mongodb://localhost:27017/")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="변환 대상 수만 확인하고 저장하지 않음"
+    )
+    parser.add_argument(
+        "--explain", action="store_true", help="주요 조회의 실행 계획 확인"
+    )
+    return parser.parse_args()
+
+
+def migrate_dates(collection, batch_size=500, dry_run=False):
+    """문자열로 저장된 발행일/크롤링 일자를 datetime으로 변환
+
+    변환한 문서 수와 해석할 수 없어 그대로 둔 값의 수를 반환
+    """
+    from pymongo import UpdateOne
+
+    query = {"$or": [{field: {"$type": "string"}} for field in DATE_FIELDS]}
+    projection = {field: 1 for field in DATE_FIELDS}
+    converted = 0
+    unparsed = 0
+    batch = []
+
+    def flush():
+        if batch and not dry_run:
+            collection.bulk_write(batch, ordered=False)
+        batch.clear()
+
+    for doc in collection.find(query, projection):
+        updates = {}
+        for field in DATE_FIELDS:
+            value = doc.get(field)
+            if not isinstance(value, str):
+                continue
+            try:
+                updates[field] = to_datetime(value)
+            except ValueError:
+                unparsed += 1
+                print(f"날짜 해석 실패 ({doc['_id']} {field}): {value!r}")
+        if not updates:
+            continue
+        batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": updates}))
+        converted += 1
+        if len(batch) >= batch_size:
+            flush()
+            print(f"{converted}건 변환")
+    flush()
+    return converted, unparsed
+
+
+def _stages(plan):
+    """실행 계획 트리의 단계 이름 목록 (위에서 아래 순)"""
+    stages = [plan.get("stage")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages += _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages += _stages(child)
+    return stages
+
+
+def explain_queries(collection):
+    """증분 처리, 카테고리별 기간 조회, 중복 확인 조회의 실행 계획 출력
+
+    IXSCAN만 있고 FETCH가 없으면 인덱스만 읽는 조회(covered), SORT가 있으면
+    인덱스로 정렬하지 못해 메모리 정렬을 한 것
+    """
+    sample = collection.find_one({}, {"_id": 0, "categories": 1, "url": 1}) or {}
+    category = (sample.get("categories") or [""])[0]
+    since = now_kst() - timedelta(days=30)
+    queries = {
+        "마지막 크롤링 일자": collection.find({}, {"_id": 0, "crawled_date": 1})
+        .sort("crawled_date", -1)
+        .limit(1),
+        "카테고리별 최근 30일 기사": collection.find(
+            {"categories": category, "published_date": {"$gte": since}}
+        )
+        .sort("published_date", -1)
+        .limit(10),
+        "최근 30일 기사 수": collection.find(
+            {"published_date": {"$gte": since}}, {"_id": 0, "published_date": 1}
+        ),
+        "URL 중복 확인": collection.find(
+            {"url": sample.get("url", "")}, {"_id": 0, "url": 1}
+        ).limit(1),
+    }
+    for label, cursor in queries.items():
+        plan = cursor.explain()["queryPlanner"]["winningPlan"]
+        stages = [stage for stage in _stages(plan) if stage]
+        if "COLLSCAN" in stages:
+            verdict = "전체 스캔"
+        elif "FETCH" in stages:
+            verdict = "인덱스 조회 후 문서 읽음"
+        else:
+            verdict = "인덱스만 읽음"
+        if "SORT" in stages:
+            verdict += ", 메모리 정렬"
+        print(f"- {label}: {' <- '.join(stages)} ({verdict})")
+
+
+def main():
+    from pymongo import MongoClient
+
+    args = parse_args()
+    client = MongoClient(args.mongo_uri, serverSelectionTimeoutMS=5000)
+    collection = client["crawlingdb"]["articles"]
+
+    converted, unparsed = migrate_dates(collection, args.batch_size, args.dry_run)
+    action = "변환 대상" if args.dry_run else "변환 완료"
+    print(f"날짜 {action}: {converted}건 (해석 실패 {unparsed}건)")
+
+    if not args.dry_run:
+        created = ensure_article_indexes(collection, drop_legacy=True)
+        print(f"생성한 인덱스: {', '.join(created) or '없음'}")
+    if args.explain:
+        explain_queries(collection)
+
+
+if __name__ == "__main__":
+    main()
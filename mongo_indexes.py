@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+# articles 컬렉션의 인덱스 (크롤러, 동기화, 마이그레이션이 함께 사용)
+# - url: 중복 확인과 upsert (projection을 url로 제한하면 인덱스만 읽음)
+# - categories + published_date: 카테고리별 최신 기사, 카테고리별 기간 조회
+# - published_date: 기간 조회와 최신 N건
+# - crawled_date: 증분 처리 기준 시각(워터마크)과 마지막 크롤링 기사 조회
+#   (단일 필드 인덱스는 역방향으로도 읽으므로 최신순 정렬에도 사용)
+ARTICLE_INDEXES = [
+    ([("url", 1)], {"name": "url_1", "unique": True}),
+    (
+        [("categories", 1), ("published_date", -1)],
+        {"name": "categories_published_date"},
+    ),
+    ([("published_date", -1)], {"name": "published_date_desc"}),
+    ([("crawled_date", 1)], {"name": "crawled_date_1"}),
+]
+
+# categories + published_date 인덱스의 앞부분과 겹쳐 쓰기 비용만 늘리는 예전 인덱스
+LEGACY_INDEXES = ("categories_1",)
+
+DATE_FIELDS = ("published_date", "crawled_date")
+
+# 기사 날짜는 모두 시간대 정보 없는 한국 시간으로 저장 (서버 시간대와 무관)
+KST = timezone(timedelta(hours=9))
+
+
+def ensure_article_indexes(collection, drop_legacy=False):
+    """articles 컬렉션에 필요한 인덱스를 생성 (이미 있으면 그대로 둠)
+
+    drop_legacy면 새 인덱스로 대체되는 예전 인덱스를 삭제하며, 생성된 인덱스 이름 목록을 반환
+    """
+    existing = collection.index_information()
+    if drop_legacy:
+        for name in LEGACY_INDEXES:
+            if name in existing:
+                collection.drop_index(name)
+                print(f"예전 인덱스 삭제: {name}")
+    # 같은 키의 인덱스가 다른 이름으로 있으면 생성이 실패하므로 키가 없는 것만 생성
+    existing_keys = {
+        tuple((field, int(order)) for field, order in info["key"])
+        for name, info in collection.index_information().items()
+    }
+    created = []
+    for keys, options in ARTICLE_INDEXES:
+        if tuple(keys) not in existing_keys:
+            created.append(collection.create_index(keys, **options))
+    return created
+
+
+def to_datetime(value):
+    """ISO 형식 문자열 날짜를 시간대 정보 없는 한국 시간 datetime으로 변환 (없으면 None)
+
+    예전 문서의 날짜는 시간대 정보 없는 한국 시간이므로 그대로 두고, "Z"나 "+00:00"처럼
+    시간대가 있는 값은 한국 시간으로 바꾼 뒤 시간대 정보를 뗌. 이미 datetime인 값에도
+    같은 규칙을 적용하며, 해석할 수 없으면 ValueError 발생
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if not value.strip():
+            return None
+        value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    elif not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(KST).replace(tzinfo=None)
+    return value
+
+
+def now_kst():
+    """현재 시각 (시간대 정보 없는 한국 시간)"""
+    return datetime.now(KST).replace(tzinfo=None)
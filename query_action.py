@@ -1,39 +1,116 @@
-from elasticsearch import Elasticsearch
-from pymongo import MongoClient
 from datetime import datetime
 import asyncio
-from google.generativeai import configure, GenerativeModel
 import os
+import re
+import threading
+import time
 from dotenv import load_dotenv
+from health import HealthMonitor
+from mongo_indexes import KST, ensure_article_indexes, to_datetime
+from llm_client import AsyncLLMClient
+from llm_providers import create_provider
+from resilience import CircuitOpenError, Deadline, Upstream, env_seconds, metrics
+from review_policy import ReviewPolicy, SELF_CHECK_INSTRUCTIONS
+from response_cache import ResponseCache
+from context_builder import ContextBuilder, estimate_tokens
+from intent_classifier import IntentClassifier, format_intent_analysis
+from reranker import Reranker
+from tracing import activate, current_span, span, start_span, tracer
+from query_service import QueryService
 
 
 class DatabaseSearch:
     """데이터베이스 연결 및 검색 기능을 담당하는 클래스"""
 
-    def __init__(self):
-        # MongoDB 연결 설정
-        try:
-            self.mongo_client = MongoClient(
-                "mongodb://localhost:27017/", serverSelectionTimeoutMS=5000
-            )
-            self.mongo_client.server_info()  # 연결 테스트
-            self.db = self.mongo_client["crawlingdb"]
-            self.mongo_collection = self.db["articles"]
-        except Exception as e:
-            print(f"MongoDB 연결 실패: {e}")
-            raise
+    def __init__(
+        self,
+        index_name="news_articles",
+        es_url="http://localhost:9200",
+        use_mongodb=True,
+    ):
+        self.index_name = index_name
+        self.es_url = es_url
+        self.use_mongodb = use_mongodb
+
+        # 시작 속도를 위해 클라이언트는 처음 사용할 때 만들고, 연결 확인은
+        # ensure_connected()나 백그라운드 상태 점검(health_checks)에서 수행.
+        # 클라이언트는 스레드 안전하며 연결 풀을 가지므로 프로세스에서 공유해 사용
+        self._clients_lock = threading.Lock()
+        self._mongo_client = None
+        self._es = None
+
+        # Elasticsearch 검색 호출에는 시간 제한과 차단기 적용
+        self.search_upstream = Upstream(
+            "search",
+            env_seconds("SEARCH_TIMEOUT_SECONDS", 5.0),
+            hedge_after=env_seconds("SEARCH_HEDGE_AFTER_SECONDS"),
+        )
 
-        # Elasticsearch 연결 설정
-        try:
-            self.es = Elasticsearch(["http://localhost:9200"])
-            if not self.es.ping():
-                raise ConnectionError("Elasticsearch 서버에 연결할 수 없습니다.")
-        except Exception as e:
-            print(f"Elasticsearch 연결 실패: {e}")
-            raise
+    @property
+    def mongo_client(self):
+        """MongoDB 클라이언트 (벤치마크처럼 Elasticsearch만 쓰는 경우 None)"""
+        if not self.use_mongodb:
+            return None
+        with self._clients_lock:
+            if self._mongo_client is None:
+                from pymongo import MongoClient
+
+                self._mongo_client = MongoClient(
+                    "mongodb://localhost:27017/",
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", "20")),
+                )
+            return self._mongo_client
+
+    @property
+    def mongo_collection(self):
+        client = self.mongo_client
+        return client["crawlingdb"]["articles"] if client is not None else None
+
+    @property
+    def es(self):
+        with self._clients_lock:
+            if self._es is None:
+                from elasticsearch import Elasticsearch
+
+                self._es = Elasticsearch(
+                    [self.es_url],
+                    connections_per_node=int(
+                        os.getenv("ES_CONNECTIONS_PER_NODE", "16")
+                    ),
+                )
+            return self._es
+
+    def _check_mongodb(self):
+        self.mongo_client.admin.command("ping")
+
+    def _check_elasticsearch(self):
+        if not self.es.ping():
+            raise ConnectionError("Elasticsearch 서버에 연결할 수 없습니다.")
+
+    def health_checks(self):
+        """백그라운드 상태 점검에 쓸 {이름: 점검 함수} (실패 시 예외 발생)"""
+        checks = {"elasticsearch": self._check_elasticsearch}
+        if self.use_mongodb:
+            checks["mongodb"] = self._check_mongodb
+        return checks
+
+    def ensure_indexes(self):
+        """articles 컬렉션 인덱스 생성 (크롤러와 같은 정의)"""
+        if self.mongo_collection is not None:
+            ensure_article_indexes(self.mongo_collection)
+
+    def ensure_connected(self):
+        """모든 저장소에 연결되는지 바로 확인 (동기화/벤치마크처럼 연결이 필수인 경우)"""
+        for name, check in self.health_checks().items():
+            try:
+                check()
+            except Exception as e:
+                print(f"{name} 연결 실패: {e}")
+                raise
 
-    def create_es_index(self):
-        """Elasticsearch 인덱스 생성"""
+    def create_es_index(self, recreate=True):
+        """Elasticsearch 인덱스 생성 (recreate가 False면 이미 있는 인덱스는 그대로 사용)"""
         settings = {
             "settings": {
                 "number_of_shards": 1,
@@ -80,6 +157,11 @@ class DatabaseSearch:
                             "ngram": {"type": "text", "analyzer": "standard"},
                         },
                     },
+                    "title_suggest": {
+                        "type": "completion",
+                        "analyzer": "simple",
+                        "max_input_length": 100,
+                    },
                     "url": {"type": "keyword"},
                     "crawled_date": {
                         "type": "date",
@@ -90,6 +172,9 @@ class DatabaseSearch:
                         "format": "strict_date_optional_time||epoch_millis",
                     },
                     "categories": {"type": "keyword"},
+                    # 색인 전에 계산한 추출 요약과 핵심어 (article_enrichment)
+                    "summary": {"type": "text", "analyzer": "korean"},
+                    "keyphrases": {"type": "keyword"},
                     "metadata": {
                         "type": "object",
                         "properties": {
@@ -103,9 +188,16 @@ class DatabaseSearch:
         }
 
         try:
-            if self.es.indices.exists(index="news_articles"):
-                self.es.indices.delete(index="news_articles")
-            self.es.indices.create(index="news_articles", body=settings)
+            if self.es.indices.exists(index=self.index_name):
+                if not recreate:
+                    # 기존 인덱스에 나중에 추가된 필드(요약, 핵심어 등)만 반영
+                    self.es.indices.put_mapping(
+                        index=self.index_name,
+                        properties=settings["mappings"]["properties"],
+                    )
+                    return
+                self.es.indices.delete(index=self.index_name)
+            self.es.indices.create(index=self.index_name, body=settings)
             print("Elasticsearch 인덱스가 생성되었습니다.")
         except Exception as e:
             print(f"인덱스 생성 중 오류 발생: {e}")
@@ -121,22 +213,8 @@ class DatabaseSearch:
         for doc in mongo_docs:
             try:
                 doc_id = str(doc.pop("_id"))
-                cleaned_doc = {
-                    "title": doc.get("title", ""),
-                    "cleaned_content": doc.get("cleaned_content", ""),
-                    "url": doc.get("url", ""),
-                    "crawled_date": doc.get("crawled_date", ""),
-                    "published_date": doc.get("published_date", ""),
-                    "categories": doc.get("categories", []),
-                    "metadata": {
-                        "word_count": doc.get("metadata", {}).get("word_count", 0),
-                        "sentence_count": doc.get("metadata", {}).get(
-                            "sentence_count", 0
-                        ),
-                        "common_words": doc.get("metadata", {}).get("common_words", {}),
-                    },
-                }
-                self.es.index(index="news_articles", id=doc_id, body=cleaned_doc)
+                cleaned_doc = self._build_es_document(doc)
+                self.es.index(index=self.index_name, id=doc_id, body=cleaned_doc)
                 success_count += 1
 
                 if success_count % 100 == 0:
@@ -151,6 +229,212 @@ class DatabaseSearch:
         print(f"성공: {success_count}개")
         print(f"실패: {error_count}개")
 
+    def sync_changed_articles(self, since=None, batch_size=500):
+        """crawled_date가 since 이후인 기사만 Elasticsearch에 upsert (인덱스는 유지)
+
+        since가 None이면 전체 기사를 upsert. 문서 ID는 전체 동기화와 같은 MongoDB
+        _id를 사용하므로 다시 보내도 중복되지 않음.
+        (성공 수, 실패 수, 다음 실행의 기준 시각)을 반환하며, 기준 시각은 처리한 기사
+        중 가장 늦은 crawled_date (실패가 있으면 since 그대로)
+        """
+        self.create_es_index(recreate=False)
+        query = {"crawled_date": {"$gte": since}} if since is not None else {}
+        # crawled_date 인덱스로 범위 조회와 정렬을 함께 처리
+        cursor = self.mongo_collection.find(query).sort("crawled_date", 1)
+        success_count = 0
+        error_count = 0
+        watermark = since
+        batch = []
+
+        def flush():
+            nonlocal success_count, error_count
+            if batch:
+                indexed, errors = self.index_documents(batch, refresh=False)
+                success_count += indexed
+                error_count += len(errors)
+                batch.clear()
+
+        for doc in cursor:
+            batch.append(doc)
+            if isinstance(doc.get("crawled_date"), datetime):
+                watermark = max(watermark or doc["crawled_date"], doc["crawled_date"])
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        if success_count:
+            self.es.indices.refresh(index=self.index_name)
+        if error_count:
+            # 실패한 기사를 다음 실행에서 다시 보내도록 기준 시각을 옮기지 않음
+            watermark = since
+        return success_count, error_count, watermark
+
+    @staticmethod
+    def _build_title_suggest(title, published_date):
+        """제목 자동완성용 completion 입력 생성
+
+        제목 중간 단어로 입력을 시작해도 찾을 수 있도록 각 단어에서 시작하는
+        접미 구간도 함께 넣고, 최신 기사가 먼저 나오도록 발행일을 가중치로 사용
+        """
+        words = title.split()
+        inputs = [" ".join(words[i:]) for i in range(min(len(words), 6))]
+
+        weight = 1
+        if published_date:
+            try:
+                weight = datetime.fromisoformat(str(published_date)).toordinal()
+            except ValueError:
+                pass
+
+        return {"input": inputs, "weight": weight}
+
+    @staticmethod
+    def _es_date(value):
+        """날짜에 한국 시간 오프셋(+09:00)을 붙여 반환 (해석할 수 없으면 그대로)
+
+        시간대 없는 값은 Elasticsearch가 UTC로 해석하므로, 한국 시간으로 저장된 날짜가
+        실제 시각으로 색인되도록 오프셋을 명시
+        """
+        try:
+            parsed = to_datetime(value)
+        except ValueError:
+            return value
+        return parsed.replace(tzinfo=KST) if parsed else value
+
+    @classmethod
+    def _build_es_document(cls, doc):
+        """MongoDB 문서를 Elasticsearch 색인용 문서로 변환"""
+        return {
+            "title": doc.get("title", ""),
+            "title_suggest": cls._build_title_suggest(
+                doc.get("title", ""), doc.get("published_date")
+            ),
+            "cleaned_content": doc.get("cleaned_content", ""),
+            "url": doc.get("url", ""),
+            "crawled_date": cls._es_date(doc.get("crawled_date", "")),
+            "published_date": cls._es_date(doc.get("published_date", "")),
+            "categories": doc.get("categories", []),
+            "summary": doc.get("summary", ""),
+            "keyphrases": doc.get("keyphrases", []),
+            "metadata": {
+                "word_count": doc.get("metadata", {}).get("word_count", 0),
+                "sentence_count": doc.get("metadata", {}).get("sentence_count", 0),
+                "common_words": doc.get("metadata", {}).get("common_words", {}),
+            },
+        }
+
+    def index_documents(self, docs, refresh=True):
+        """문서 목록을 bulk API로 색인 (문서의 id 또는 url을 문서 ID로 사용)"""
+        actions = [
+            {
+                "_index": self.index_name,
+                "_id": str(doc.get("id") or doc.get("_id") or doc.get("url")),
+                "_source": self._build_es_document(doc),
+            }
+            for doc in docs
+        ]
+        from elasticsearch import helpers
+
+        success_count, errors = helpers.bulk(
+            self.es, actions, raise_on_error=False, refresh=refresh
+        )
+        return success_count, errors
+
+    def get_corpus_analytics(self, category_size=20):
+        """Elasticsearch 집계로 전체 기사 코퍼스 통계 계산
+
+        카테고리 분포, 발행일 일자별 히스토그램, 단어 수 통계를 한 번의 요청으로 조회.
+        일자는 한국 시간 기준으로 나눔
+        """
+        analytics_query = {
+            "size": 0,
+            "track_total_hits": True,
+            "aggs": {
+                "categories": {
+                    "terms": {
+                        "field": "categories",
+                        "size": category_size,
+                        "missing": "미분류",
+                    }
+                },
+                "published_per_day": {
+                    "date_histogram": {
+                        "field": "published_date",
+                        "calendar_interval": "day",
+                        "min_doc_count": 1,
+                        "format": "yyyy-MM-dd",
+                        "time_zone": "+09:00",
+                    }
+                },
+                "word_count": {"stats": {"field": "metadata.word_count"}},
+            },
+        }
+
+        try:
+            result = self.es.search(index=self.index_name, body=analytics_query)
+        except Exception as e:
+            print(f"통계 집계 중 오류 발생: {e}")
+            return None
+
+        aggregations = result["aggregations"]
+        word_count = aggregations["word_count"]
+        # 히스토그램은 날짜 오름차순이므로 마지막 구간이 가장 최근 발행일 (한국 시간 기준)
+        days = aggregations["published_per_day"]["buckets"]
+        return {
+            "total_articles": result["hits"]["total"]["value"],
+            "categories": {
+                bucket["key"]: bucket["doc_count"]
+                for bucket in aggregations["categories"]["buckets"]
+            },
+            "published_per_day": {
+                bucket["key_as_string"]: bucket["doc_count"] for bucket in days
+            },
+            "word_count": {
+                "count": word_count["count"],
+                "min": word_count["min"],
+                "max": word_count["max"],
+                "avg": word_count["avg"],
+            },
+            "latest_published_date": days[-1]["key_as_string"] if days else None,
+        }
+
+    def suggest(self, prefix, size=5):
+        """제목 접두어로 기사 제목 자동완성 (completion suggester 사용)"""
+        prefix = prefix.strip()
+        if not prefix:
+            return []
+
+        suggest_query = {
+            "_source": ["title", "url", "published_date"],
+            "suggest": {
+                "title_suggest": {
+                    "prefix": prefix,
+                    "completion": {
+                        "field": "title_suggest",
+                        "size": size,
+                        "skip_duplicates": True,
+                    },
+                }
+            },
+        }
+
+        try:
+            result = self.es.search(index=self.index_name, body=suggest_query)
+            options = result["suggest"]["title_suggest"][0]["options"]
+            return [
+                {
+                    "id": option["_id"],
+                    "title": option["_source"]["title"],
+                    "url": option["_source"]["url"],
+                    "published_date": option["_source"].get(
+                        "published_date", "날짜 정보 없음"
+                    ),
+                }
+                for option in options
+            ]
+        except Exception as e:
+            print(f"자동완성 검색 중 오류 발생: {e}")
+            return []
+
     @staticmethod
     def extract_keywords_from_query(query):
         """자연어 쿼리에서 핵심 키워드 추출"""
@@ -185,8 +469,13 @@ class DatabaseSearch:
         keywords = [word for word in words if word not in stop_words]
         return keywords
 
-    async def semantic_search(self, query, size=7):
-        """의미 기반 검색 수행"""
+    async def semantic_search(self, query, size=7, deadline=None, raise_errors=False):
+        """의미 기반 검색 수행
+
+        검색이 시간 안에 끝나지 않거나 검색 서비스가 차단된 경우 빈 결과를 반환.
+        raise_errors=True면 빈 결과 대신 예외를 그대로 전달 (벤치마크에서 오류를
+        빈 결과와 구분할 때 사용)
+        """
         try:
             keywords = self.extract_keywords_from_query(query)
             keywords_str = " ".join(keywords)
@@ -240,12 +529,22 @@ class DatabaseSearch:
                     "crawled_date",
                     "published_date",
                     "categories",
+                    "summary",
+                    "keyphrases",
                 ],
                 "size": size,
                 "sort": [{"_score": "desc"}],
             }
 
-            result = self.es.search(index="news_articles", body=search_query)
+            # 블로킹 HTTP 호출을 스레드로 넘겨 의도 분석 등 다른 단계와 동시에 진행
+            es = self.es.options(request_timeout=self.search_upstream.timeout)
+            result = await self.search_upstream.call(
+                lambda: asyncio.to_thread(
+                    es.search, index=self.index_name, body=search_query
+                ),
+                deadline=deadline,
+            )
+            current_span().set_attribute("es_took_ms", result.get("took"))
 
             processed_results = []
             for hit in result["hits"]["hits"]:
@@ -258,6 +557,7 @@ class DatabaseSearch:
 
                 processed_results.append(
                     {
+                        "id": hit["_id"],
                         "title": source["title"],
                         "content": source["cleaned_content"],
                         "content_preview": content_preview,
@@ -267,53 +567,80 @@ class DatabaseSearch:
                             "published_date", "날짜 정보 없음"
                         ),
                         "categories": source.get("categories", []),
+                        "summary": source.get("summary", ""),
+                        "keyphrases": source.get("keyphrases", []),
                         "score": hit["_score"],
                         "highlights": highlights,
                     }
                 )
 
+            current_span().set_attribute("hits", len(processed_results))
             return processed_results
 
         except Exception as e:
             print(f"검색 중 오류 발생: {e}")
+            current_span().set_attributes(hits=0, error=str(e)[:200])
+            if raise_errors:
+                raise
             return []
 
 
-class ResponseGeneration:
-    """초기 답변 생성을 담당하는 클래스"""
-
-    def __init__(self):
-        # API 키 설정
-        load_dotenv()
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
-        configure(api_key=api_key)
-        self.model = GenerativeModel("gemini-2.0-flash-exp")
-
-    async def find_relevant_article(self, query, articles):
-        """관련 기사 찾기"""
-        keywords = set(query.lower().replace("?", " ").replace("!", " ").split())
-        best_article = None
-        max_score = 0
+STREAMING_INTENT_NOTE = """(별도의 의도 분석 없이 답변합니다. 질문 유형(사실 확인/날짜 확인/방법 설명/의견 요청/비교 분석)과 핵심 키워드를 스스로 파악하여 답변 형식에 반영하세요.)"""
 
-        for article in articles:
-            text = (article["title"] + " " + article["content"]).lower()
-            score = sum(1 for keyword in keywords if keyword in text)
 
-            if score > max_score:
-                max_score = score
-                best_article = article
+class ResponseGeneration:
+    """초기 답변 생성을 담당하는 클래스"""
 
-        if not best_article or max_score == 0:
-            return None, 0.0
+    def __init__(self, review_policy=None, provider=None):
+        self.review_policy = review_policy
 
-        relevance = max_score / len(keywords)
-        return best_article, min(relevance, 1.0)
+        # LLM 백엔드 설정 (LLM_PROVIDER=fake면 네트워크 없이 결정적 답변 사용)
+        load_dotenv()
+        self.provider = provider or create_provider()
+        # 모든 모델 호출은 이벤트 루프를 막지 않는 비동기 클라이언트를 거침
+        self.llm = AsyncLLMClient(self.provider)
+        self.context_builder = ContextBuilder()
+        self.reranker = Reranker()
+        # 재순위 관련도(0~1)가 이보다 낮으면 기사와 일반 지식을 함께 쓰는 프롬프트 사용
+        self.min_relevance = 0.3
+        self.intent_classifier = IntentClassifier()
+
+    async def analyze_intent(self, query, stats=None, deadline=None):
+        """질문 의도 분석 (검색 결과와 무관하므로 검색과 동시에 실행 가능)
+
+        로컬 분류기 결과의 신뢰도가 충분하면 그대로 사용하고, 낮을 때만 LLM 호출.
+        LLM 호출이 실패하면 신뢰도가 낮더라도 로컬 분류 결과를 사용
+        """
+        result = self.intent_classifier.classify(query)
+        intent_span = current_span()
+        intent_span.set_attributes(
+            question_type=result["question_type"], confidence=result["confidence"]
+        )
+        if self.intent_classifier.is_confident(result):
+            intent_span.set_attribute("source", "local")
+            if stats is not None:
+                stats["intent"] = {
+                    "source": "local",
+                    "question_type": result["question_type"],
+                    "confidence": result["confidence"],
+                }
+            return format_intent_analysis(result)
 
-    async def generate_initial_response(self, query, articles):
-        """초기 답변 생성"""
-        # 의도 파악
+        intent_span.set_attribute("source", "llm")
+        if stats is not None:
+            stats["intent"] = {"source": "llm", "confidence": result["confidence"]}
+        try:
+            return await self.analyze_intent_with_llm(query, deadline)
+        except (TimeoutError, CircuitOpenError) as e:
+            print(f"의도 분석 대체: {e}")
+            metrics.record("llm", "fallbacks")
+            intent_span.set_attribute("source", "local_fallback")
+            if stats is not None:
+                stats["intent"]["source"] = "local_fallback"
+            return format_intent_analysis(result)
+
+    async def analyze_intent_with_llm(self, query, deadline=None):
+        """LLM으로 질문 의도 분석"""
         intent_prompt = f"""다음 질문의 의도를 파악하여 검색에 사용할 핵심 키워드와 컨텍스트를 추출하세요:
 
 질문: {query}
@@ -323,13 +650,113 @@ class ResponseGeneration:
 2. 핵심 키워드: (검색에 사용할 중요 단어들)
 3. 찾아야 할 정보: (기사에서 찾아야 할 구체적인 정보)"""
 
-        intent_response = self.model.generate_content(intent_prompt)
-        intent_analysis = intent_response.text
+        return await self.llm.generate(
+            intent_prompt,
+            timeout=env_seconds("INTENT_TIMEOUT_SECONDS", 10.0),
+            deadline=deadline,
+        )
+
+    def build_prompt(
+        self, query, articles, intent_analysis, self_check=None, stats=None
+    ):
+        """검색 결과에 따라 답변 생성 프롬프트 구성
+
+        (주요 기사, 관련 기사 목록, 관련도, 프롬프트)를 반환하며, 검토 단계를
+        생략할 수 있는 경우 자기 점검 지침을 프롬프트에 포함.
+        stats에 dict를 넘기면 프롬프트 크기를 기록
+        """
+        if self_check is None:
+            self_check = (
+                self.review_policy is not None and self.review_policy.folds_self_check
+            )
 
+        context = None
         if not articles:
             # 기사가 없는 경우
-            knowledge_prompt = f"""당신은 AI 뉴스 전문 챗봇입니다.
+            best_article, related_articles, score = None, [], 0.0
+            prompt = self._create_knowledge_prompt(query, intent_analysis)
+        else:
+            # 질문과의 관련도로 기사를 다시 정렬하여 주요 기사와 참고 기사 선택
+            articles = self.reranker.rerank(query, articles, stats)
+            best_article = articles[0]
+            related_articles, score = articles[1:9], best_article["relevance"]
+            # 기사 전문 대신 질문과 관련된 패시지를 토큰 예산 안에서 선별
+            context = self.context_builder.build(query, articles)
+            if score < self.min_relevance:
+                # 관련성이 낮은 경우
+                prompt = self._create_hybrid_prompt(
+                    query, intent_analysis, best_article, context["text"]
+                )
+            else:
+                # 기사 내용이 충분한 경우
+                prompt = self._create_full_context_prompt(
+                    query,
+                    intent_analysis,
+                    best_article,
+                    articles[1:] if len(articles) > 1 else [],
+                    context["text"],
+                )
+
+        if self_check:
+            prompt += SELF_CHECK_INSTRUCTIONS
+
+        current_span().set_attributes(
+            prompt_tokens=estimate_tokens(prompt),
+            relevance=score,
+            hybrid=bool(articles) and score < self.min_relevance,
+            passages=context["passages"] if context is not None else 0,
+        )
+        if stats is not None:
+            stats["prompt_tokens"] = estimate_tokens(prompt)
+            if context is not None:
+                stats["context"] = {
+                    "tokens": context["tokens"],
+                    "passages": context["passages"],
+                    "articles": context["articles"],
+                }
+        return best_article, related_articles, score, prompt
+
+    async def generate_initial_response(
+        self, query, articles, intent_analysis=None, stats=None, deadline=None
+    ):
+        """초기 답변 생성"""
+        # 의도 파악 (미리 분석된 결과가 없을 때만)
+        if intent_analysis is None:
+            intent_analysis = await self.analyze_intent(query, deadline=deadline)
+
+        with span("build_prompt"):
+            best_article, related_articles, score, prompt = self.build_prompt(
+                query, articles, intent_analysis, stats=stats
+            )
+        response_text = await self.llm.generate(prompt, deadline=deadline)
+        return best_article, related_articles, score, response_text, intent_analysis
+
+    def stream_initial_response(self, query, articles, stats=None, deadline=None):
+        """스트리밍 답변 준비
+
+        첫 토큰까지의 지연을 줄이기 위해 별도의 의도 분석 호출 없이 질문 유형 판단을
+        생성 프롬프트에 맡기고, (주요 기사, 관련 기사 목록, 관련도, 답변 조각
+        비동기 제너레이터)를 반환
+        """
+        # 로컬 분류 결과를 믿을 수 있으면 사용하고, 아니면 판단을 모델에 맡김
+        intent = self.intent_classifier.classify(query)
+        if self.intent_classifier.is_confident(intent):
+            intent_analysis = format_intent_analysis(intent)
+        else:
+            intent_analysis = STREAMING_INTENT_NOTE
+        with span("build_prompt"):
+            best_article, related_articles, score, prompt = self.build_prompt(
+                query, articles, intent_analysis, self_check=True, stats=stats
+            )
+        chunks = self.llm.stream(prompt, deadline=deadline)
+        return best_article, related_articles, score, chunks
+
+    def _create_knowledge_prompt(self, query, intent_analysis):
+        """일반 지식 기반 프롬프트 생성"""
+        return f"""당신은 AI 뉴스 전문 챗봇입니다.
             
+질문: {query}
+
 질문 분석:
 {intent_analysis}
 
@@ -346,52 +773,22 @@ class ResponseGeneration:
 2. 개념 설명: (주요 개념과 배경 지식)
 3. 한계 설명: (정보의 한계와 주의사항)"""
 
-            response = self.model.generate_content(knowledge_prompt)
-            return None, [], 0.0, response.text, intent_analysis
-
-        best_article = articles[0]
-        if best_article["score"] < 0.3:
-            # 관련성이 낮은 경우
-            hybrid_prompt = self._create_hybrid_prompt(
-                query, intent_analysis, best_article
-            )
-            response = self.model.generate_content(hybrid_prompt)
-            return (
-                best_article,
-                articles[1:9],
-                best_article["score"],
-                response.text,
-                intent_analysis,
-            )
-
-        # 기사 내용이 충분한 경우
-        full_context_prompt = self._create_full_context_prompt(
-            query,
-            intent_analysis,
-            best_article,
-            articles[1:] if len(articles) > 1 else [],
-        )
-        response = self.model.generate_content(full_context_prompt)
-        return (
-            best_article,
-            articles[1:9],
-            best_article["score"],
-            response.text,
-            intent_analysis,
-        )
-
-    def _create_hybrid_prompt(self, query, intent_analysis, best_article):
+    def _create_hybrid_prompt(self, query, intent_analysis, best_article, context):
         """하이브리드 프롬프트 생성"""
         return f"""당신은 AI 뉴스 전문 챗봇입니다.
 
+질문: {query}
+
 질문 분석:
 {intent_analysis}
 
 관련성이 다소 낮은 뉴스 기사가 있습니다:
 제목: {best_article['title']}
-내용: {best_article['content']}
 발행일: {best_article.get('published_date', '날짜 정보 없음')}
 
+기사 발췌:
+{context}
+
 지침:
 1. 기사의 관련 내용을 부분적으로 활용하세요.
 2. AI 모델의 기본 지식을 활용하여 부족한 정보를 보완하세요.
@@ -405,19 +802,23 @@ class ResponseGeneration:
 4. 정보 출처: (각 정보의 출처 명시)"""
 
     def _create_full_context_prompt(
-        self, query, intent_analysis, best_article, related_articles
+        self, query, intent_analysis, best_article, related_articles, context
     ):
         """전체 컨텍스트 프롬프트 생성"""
         return f"""당신은 AI 뉴스 전문 챗봇입니다.
 
+질문: {query}
+
 질문 분석:
 {intent_analysis}
 
 주요 참고 기사:
 제목: {best_article['title']}
-내용: {best_article['content']}
 발행일: {best_article.get('published_date', '날짜 정보 없음')}
 
+질문과 관련된 기사 발췌 (여러 기사에서 선별):
+{context}
+
 추가 참고 기사들:
 {' '.join([f"- {art['title']} ({art.get('published_date', '날짜 정보 없음')})" for art in related_articles[:3]])}
 
@@ -437,13 +838,48 @@ class ResponseGeneration:
 class ResponseReview:
     """답변 검토 및 개선을 담당하는 클래스"""
 
-    def __init__(self, model):
-        self.model = model
+    def __init__(self, llm, policy=None, min_seconds=None):
+        self.llm = llm
+        self.policy = policy or ReviewPolicy()
+        # 요청 예산이 이보다 적게 남으면 검토를 생략하고 초기 답변 사용
+        self.min_seconds = min_seconds or env_seconds("REVIEW_MIN_SECONDS", 5.0)
 
     async def review_and_enhance_response(
-        self, query, initial_response, intent_analysis, best_article, has_articles=True
+        self,
+        query,
+        initial_response,
+        intent_analysis,
+        best_article,
+        has_articles=True,
+        relevance_score=None,
+        stats=None,
+        deadline=None,
     ):
-        """답변 검토 및 개선"""
+        """답변 검토 및 개선
+
+        검토 정책이 검토가 필요 없다고 판단하거나 요청 예산이 부족하면 LLM 호출 없이
+        초기 답변을 그대로 반환하며, 검토 호출이 실패해도 초기 답변을 반환
+        """
+        should_review, reason = self.policy.decide(
+            initial_response,
+            intent_analysis,
+            best_article if has_articles else None,
+            relevance_score,
+        )
+        if (
+            should_review
+            and deadline is not None
+            and deadline.remaining() < self.min_seconds
+        ):
+            should_review, reason = False, "deadline"
+        self.policy.record(should_review, reason)
+        review_span = current_span()
+        review_span.set_attributes(performed=should_review, reason=reason)
+        if stats is not None:
+            stats["review"] = {"performed": should_review, "reason": reason}
+        if not should_review:
+            return initial_response
+
         if has_articles:
             review_prompt = self._create_article_review_prompt(
                 query, initial_response, intent_analysis, best_article
@@ -453,10 +889,19 @@ class ResponseReview:
                 query, initial_response, intent_analysis
             )
 
-        review_response = self.model.generate_content(review_prompt)
-        review_text = review_response.text
-
-        return initial_response if "원본 답변 사용" in review_text else review_text
+        try:
+            review_text = await self.llm.generate(review_prompt, deadline=deadline)
+        except (TimeoutError, CircuitOpenError) as e:
+            print(f"답변 검토 생략: {e}")
+            metrics.record("llm", "fallbacks")
+            review_span.set_attribute("reason", "upstream_error")
+            if stats is not None:
+                stats["review"]["reason"] = "upstream_error"
+            return initial_response
+
+        enhanced = "원본 답변 사용" not in review_text
+        review_span.set_attribute("enhanced", enhanced)
+        return review_text if enhanced else initial_response
 
     def _create_article_review_prompt(
         self, query, initial_response, intent_analysis, best_article
@@ -503,47 +948,474 @@ AI의 답변: {initial_response}
 개선이 필요없는 경우 "원본 답변 사용"이라고만 답변해주세요."""
 
 
+STAGE_LABELS = {
+    "search": "기사 검색",
+    "intent": "의도 분석",
+    "generate": "답변 생성",
+    "rerank": "재순위",
+    "review": "답변 검토",
+    "first_token": "첫 응답",
+    "total": "전체",
+}
+
+
+async def _timed(coro, timings, stage):
+    """코루틴 실행 시간을 ms 단위로 timings[stage]에 기록하고 같은 이름의 스팬으로 추적"""
+    started = time.perf_counter()
+    try:
+        with span(stage):
+            return await coro
+    finally:
+        timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _end_root_span(root_span, timings, started, stats=None, error=None):
+    """요청 전체 소요 시간과 캐시 적중/대체 답변 여부를 루트 스팬에 기록한 뒤 종료"""
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+    if stats is not None:
+        root_span.set_attributes(
+            cache_hit=stats.get("cache_hit"), degraded=stats.get("degraded")
+        )
+    root_span.set_attribute("total_ms", timings["total"])
+    root_span.end(error)
+
+
+async def _timed_stream(chunks, timings, started, root_span, stats=None):
+    """스트리밍 생성의 첫 조각 도착 시간과 전체 소요 시간을 timings에 기록
+
+    스트림이 끝나거나 중간에 닫히면 요청의 루트 스팬도 종료
+    """
+    generate_started = time.perf_counter()
+    # 비동기 제너레이터는 소비하는 쪽 컨텍스트에서 실행되므로 현재 스팬을 바꾸지 않고
+    # 부모를 직접 지정
+    generate_span = start_span("generate", parent=root_span)
+    chunk_count = 0
+    parts = []
+    error = None
+    try:
+        async for chunk in chunks:
+            if "first_token" not in timings:
+                timings["first_token"] = round(
+                    (time.perf_counter() - started) * 1000, 1
+                )
+            chunk_count += 1
+            parts.append(chunk)
+            yield chunk
+    except GeneratorExit:
+        # 사용자가 답변을 끝까지 받지 않고 떠난 경우 (오류 아님)
+        root_span.set_attribute("closed_early", True)
+        raise
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        timings["generate"] = round((time.perf_counter() - generate_started) * 1000, 1)
+        generate_span.set_attributes(
+            chunks=chunk_count,
+            response_tokens=estimate_tokens("".join(parts)),
+            first_token_ms=timings.get("first_token"),
+        )
+        generate_span.end(error)
+        _end_root_span(root_span, timings, started, stats, error)
+
+
+async def _single_chunk(text):
+    """완성된 답변을 조각 하나짜리 스트림으로 변환"""
+    yield text
+
+
+DEGRADED_LABELS = {"cached": "이전 답변", "search_only": "검색 결과"}
+
+UNAVAILABLE_MESSAGE = "현재 답변을 생성할 수 없습니다. 잠시 후 다시 시도해주세요."
+
+
+def format_timings(timings):
+    """단계별 소요 시간을 한 줄 문자열로 변환"""
+    parts = [
+        f"{STAGE_LABELS.get(stage, stage)} {elapsed:.0f}ms"
+        for stage, elapsed in timings.items()
+    ]
+    return "소요 시간: " + ", ".join(parts)
+
+
+def format_stats(stats):
+    """요청 처리 통계(소요 시간, 프롬프트 크기, 캐시 여부)를 한 줄 문자열로 변환"""
+    text = format_timings(stats.get("timings", {}))
+    if "prompt_tokens" in stats:
+        text += f" | 프롬프트 약 {stats['prompt_tokens']}토큰"
+        if "context" in stats:
+            text += (
+                f" (기사 {stats['context']['articles']}건에서 "
+                f"발췌 {stats['context']['passages']}개)"
+            )
+    if stats.get("cache_hit"):
+        text += " | 캐시된 답변"
+    if stats.get("coalesced"):
+        text += " | 동일 질문과 병합"
+    if stats.get("degraded"):
+        text += f" | 대체 답변({DEGRADED_LABELS[stats['degraded']]})"
+    return text
+
+
+def format_resilience_stats(resilience_stats):
+    """상위 서비스별 타임아웃/차단 통계를 한 줄 문자열로 변환"""
+    parts = [
+        f"{name} 타임아웃 {counters['timeouts']}회, 차단 {counters['trips']}회, "
+        f"대체 {counters['fallbacks']}회"
+        for name, counters in resilience_stats.items()
+    ]
+    return " / ".join(parts) or "호출 기록 없음"
+
+
+def format_query_service_stats(service_stats):
+    """질의 서비스의 실행/병합/거절 통계를 한 줄 문자열로 변환"""
+    return (
+        f"실행 {service_stats['executed']}회, 병합 {service_stats['coalesced']}회, "
+        f"거절 {service_stats['rejected']}회 (진행 {service_stats['running']}건, "
+        f"대기 {service_stats['queued']}건)"
+    )
+
+
+def format_health_status(health_status):
+    """연결 상태 점검 결과를 한 줄 문자열로 변환"""
+    if not health_status:
+        return "확인 중..."
+    return ", ".join(
+        (
+            f"{name} 정상({result['latency_ms']:.0f}ms)"
+            if result["ok"]
+            else f"{name} 연결 실패"
+        )
+        for name, result in health_status.items()
+    )
+
+
+def create_database_search():
+    """NEWSBOT_BACKEND 환경 변수에 따라 검색 백엔드 생성
+
+    local이면 ES/MongoDB 없이 픽스처 코퍼스를 메모리에서 검색 (부하 테스트, 오프라인 실행용)
+    """
+    load_dotenv()
+    if os.getenv("NEWSBOT_BACKEND", "elasticsearch").lower() == "local":
+        from local_standins import LocalSearch
+
+        return LocalSearch()
+    return DatabaseSearch()
+
+
 class NewsChatbot:
     """통합 뉴스 챗봇 클래스"""
 
     def __init__(self):
-        self.db_search = DatabaseSearch()
-        self.response_gen = ResponseGeneration()
-        self.response_review = ResponseReview(self.response_gen.model)
+        self.db_search = create_database_search()
+        self.review_policy = ReviewPolicy()
+        self.response_gen = ResponseGeneration(self.review_policy)
+        self.response_review = ResponseReview(self.response_gen.llm, self.review_policy)
+        self.response_cache = ResponseCache()
+        self.query_service = QueryService(self._process_query, self._stream_query)
+        # 연결 확인과 SDK 로딩은 시작을 막지 않도록 start() 후 백그라운드에서 수행
+        self.health = HealthMonitor(self.health_checks(), warm_up=self.warm_up)
+
+    def health_checks(self):
+        """검색 저장소와 LLM 상태 점검 함수"""
+        checks = dict(self.db_search.health_checks())
+        checks["llm"] = self._check_llm
+        return checks
+
+    def _check_llm(self):
+        if self.response_gen.llm.upstream.breaker.state == "open":
+            raise ConnectionError("LLM 호출이 차단된 상태입니다.")
+
+    def warm_up(self):
+        """첫 질문이 느려지지 않도록 LLM SDK를 미리 불러옴 (저장소 연결은 상태 점검에서 생성)"""
+        self.response_gen.provider.warm_up()
+
+    def degraded_response(self, query, articles, stats=None):
+        """LLM을 쓸 수 없을 때의 대체 답변
+
+        같은 질문에 대한 이전 답변이 있으면 그 답변을, 없으면 검색된 기사 목록을 반환
+        """
+        metrics.record("llm", "fallbacks")
+        cached = self.response_cache.latest_response(query)
+        if stats is not None:
+            stats["degraded"] = "cached" if cached else "search_only"
+        if cached:
+            return cached
+        if not articles:
+            return UNAVAILABLE_MESSAGE
+
+        lines = [
+            "답변 생성 서비스가 원활하지 않아 검색된 기사로 대신 안내드립니다.",
+            "",
+        ]
+        for article in articles[:5]:
+            preview = article.get("summary") or re.sub(
+                r"</?strong>", "", article["content_preview"]
+            )
+            lines.append(
+                f"- {article['title']} "
+                f"({article.get('published_date', '날짜 정보 없음')}): {preview}"
+            )
+        return "\n".join(lines)
 
-    async def process_query(self, query):
-        """사용자 쿼리 처리"""
+    def _degraded_result(self, query, articles, stats=None):
+        """대체 답변을 (주요 기사, 관련 기사 목록, 관련도, 답변) 형태로 반환"""
+        articles = self.response_gen.reranker.rerank(query, articles)
+        return (
+            articles[0] if articles else None,
+            articles[1:9],
+            articles[0]["relevance"] if articles else 0.0,
+            self.degraded_response(query, articles, stats),
+        )
+
+    async def process_query(self, query, stats=None):
+        """사용자 쿼리 처리
+
+        질의 서비스를 거쳐 동시 실행 수를 제한하고, 같은 질문이 처리 중이면 그 결과를
+        함께 사용. 대기열이 가득 차면 QueryRejected 발생
+        """
+        return await self.query_service.run(query, stats)
+
+    async def stream_query(self, query, stats=None):
+        """스트리밍용 사용자 쿼리 처리 (질의 서비스를 거쳐 같은 질문의 스트림을 공유)"""
+        return await self.query_service.stream(query, stats)
+
+    async def _process_query(self, query, stats=None):
+        """사용자 쿼리 처리
+
+        stats에 dict를 넘기면 단계별 소요 시간(ms)을 stats["timings"]에 기록.
+        전체 처리 시간은 요청 예산(REQUEST_BUDGET_SECONDS) 안으로 제한하며,
+        답변 생성이 실패하면 이전 답변이나 검색 결과로 대체
+        """
+        timings = {}
+        root_span = tracer.start_trace("process_query", query=query)
+        if stats is not None:
+            stats["timings"] = timings
+            stats["trace_id"] = root_span.trace.trace_id
+        started = time.perf_counter()
+        deadline = Deadline()
+
+        error = None
         try:
-            # 1. 관련 기사 검색
-            articles = await self.db_search.semantic_search(query)
+            with activate(root_span):
+                return await self._run_query(query, stats, timings, deadline)
 
-            # 2. 초기 답변 생성
+        except Exception as e:
+            print(f"쿼리 처리 중 오류 발생: {e}")
+            error = e
+            return None, [], 0.0, "처리 중 오류가 발생했습니다."
+
+        except BaseException as e:
+            error = e
+            raise
+
+        finally:
+            # 오류가 나도 소요 시간과 캐시/대체 답변 여부를 기록한 뒤 한 번만 종료
+            _end_root_span(root_span, timings, started, stats, error)
+
+    async def _run_query(self, query, stats, timings, deadline):
+        """검색/의도 분석, 답변 생성, 검토 단계를 차례로 실행 (단계마다 스팬 기록)"""
+        # 1. 관련 기사 검색과 질문 의도 분석을 동시에 실행
+        search_task = asyncio.create_task(
+            _timed(
+                self.db_search.semantic_search(query, deadline=deadline),
+                timings,
+                "search",
+            )
+        )
+        intent_task = asyncio.create_task(
+            _timed(
+                self.response_gen.analyze_intent(query, stats, deadline),
+                timings,
+                "intent",
+            )
+        )
+        try:
+            articles = await search_task
+
+            # 같은 질문과 같은 검색 결과에 대한 답변이 캐시에 있으면 LLM 호출 생략
+            # SQLite 조회는 공유 이벤트 루프를 막지 않도록 스레드에서 실행
+            with span("cache_lookup") as cache_span:
+                cached = await asyncio.to_thread(
+                    self.response_cache.get, query, articles
+                )
+                cache_span.set_attribute("hit", cached is not None)
+            if cached is not None:
+                intent_task.cancel()
+                await asyncio.gather(intent_task, return_exceptions=True)
+                if stats is not None:
+                    stats["cache_hit"] = True
+                return cached
+
+            intent_analysis = await intent_task
+        except BaseException:
+            # 한 단계가 실패하거나 요청이 취소되면 나머지 단계도 중단
+            for task in (search_task, intent_task):
+                task.cancel()
+            raise
+
+        if stats is not None:
+            stats["cache_hit"] = False
+
+        # 2. 초기 답변 생성
+        try:
             (
                 best_article,
                 related_articles,
                 relevance_score,
                 initial_response,
                 intent_analysis,
-            ) = await self.response_gen.generate_initial_response(query, articles)
+            ) = await _timed(
+                self.response_gen.generate_initial_response(
+                    query, articles, intent_analysis, stats, deadline
+                ),
+                timings,
+                "generate",
+            )
+        except (TimeoutError, CircuitOpenError) as e:
+            print(f"답변 생성 실패, 대체 답변 사용: {e}")
+            return self._degraded_result(query, articles, stats)
 
-            # 3. 답변 검토 및 개선
-            final_response = await self.response_review.review_and_enhance_response(
+        # 3. 답변 검토 및 개선
+        final_response = await _timed(
+            self.response_review.review_and_enhance_response(
                 query,
                 initial_response,
                 intent_analysis,
                 best_article if articles else None,
                 has_articles=bool(articles),
+                relevance_score=relevance_score,
+                stats=stats,
+                deadline=deadline,
+            ),
+            timings,
+            "review",
+        )
+
+        await asyncio.to_thread(
+            self.response_cache.set,
+            query,
+            articles,
+            best_article,
+            related_articles,
+            relevance_score,
+            final_response,
+        )
+        return best_article, related_articles, relevance_score, final_response
+
+    async def _stream_query(self, query, stats=None):
+        """스트리밍용 사용자 쿼리 처리
+
+        기사 검색까지 마친 뒤 (주요 기사, 관련 기사 목록, 관련도, 답변 조각 비동기
+        제너레이터)를 반환하며, 검토 단계는 생략.
+        LLM이 차단된 상태이거나 첫 조각 전에 실패하면 대체 답변을 내보냄
+        """
+        timings = {}
+        root_span = tracer.start_trace("stream_query", query=query)
+        if stats is not None:
+            stats["timings"] = timings
+            stats["trace_id"] = root_span.trace.trace_id
+        started = time.perf_counter()
+        deadline = Deadline()
+
+        # 루트 스팬은 답변 스트림이 끝날 때 _timed_stream에서 종료
+        try:
+            with activate(root_span):
+                best_article, related_articles, relevance_score, chunks = (
+                    await self._prepare_stream(query, stats, timings, deadline)
+                )
+        except BaseException as e:
+            _end_root_span(root_span, timings, started, stats, e)
+            raise
+        return (
+            best_article,
+            related_articles,
+            relevance_score,
+            _timed_stream(chunks, timings, started, root_span, stats),
+        )
+
+    async def _prepare_stream(self, query, stats, timings, deadline):
+        """기사 검색과 캐시 확인 후 (주요 기사, 관련 기사 목록, 관련도, 답변 조각) 반환"""
+        articles = await _timed(
+            self.db_search.semantic_search(query, deadline=deadline),
+            timings,
+            "search",
+        )
+
+        with span("cache_lookup") as cache_span:
+            cached = await asyncio.to_thread(self.response_cache.get, query, articles)
+            cache_span.set_attribute("hit", cached is not None)
+        if stats is not None:
+            stats["cache_hit"] = cached is not None
+        if cached is not None:
+            best_article, related_articles, relevance_score, response = cached
+            return (
+                best_article,
+                related_articles,
+                relevance_score,
+                _single_chunk(response),
             )
 
-            return best_article, related_articles, relevance_score, final_response
+        if self.response_gen.llm.upstream.breaker.state == "open":
+            best_article, related_articles, relevance_score, response = (
+                self._degraded_result(query, articles, stats)
+            )
+            return (
+                best_article,
+                related_articles,
+                relevance_score,
+                _single_chunk(response),
+            )
 
-        except Exception as e:
-            print(f"쿼리 처리 중 오류 발생: {e}")
-            return None, [], 0.0, "처리 중 오류가 발생했습니다."
+        best_article, related_articles, relevance_score, chunks = (
+            self.response_gen.stream_initial_response(query, articles, stats, deadline)
+        )
+        # 스트리밍 답변은 검토 호출 대신 자기 점검 지침을 프롬프트에 포함
+        self.review_policy.record(False, "streaming")
+        if stats is not None:
+            stats["review"] = {"performed": False, "reason": "streaming"}
+        chunks = self._cache_stream(
+            chunks, query, articles, best_article, related_articles, relevance_score
+        )
+        chunks = self._fallback_stream(chunks, query, articles, stats)
+        return best_article, related_articles, relevance_score, chunks
+
+    async def _cache_stream(
+        self, chunks, query, articles, best_article, related_articles, relevance_score
+    ):
+        """스트리밍이 끝까지 완료된 답변만 캐시에 저장"""
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        await asyncio.to_thread(
+            self.response_cache.set,
+            query,
+            articles,
+            best_article,
+            related_articles,
+            relevance_score,
+            "".join(parts),
+        )
+
+    async def _fallback_stream(self, chunks, query, articles, stats):
+        """스트리밍 실패 시 첫 조각 전이면 대체 답변을, 이후면 중단 안내를 내보냄"""
+        started_streaming = False
+        try:
+            async for chunk in chunks:
+                started_streaming = True
+                yield chunk
+        except (TimeoutError, CircuitOpenError) as e:
+            print(f"스트리밍 답변 실패: {e}")
+            if started_streaming:
+                yield "\n\n(답변 생성이 중단되었습니다. 다시 시도해주세요.)"
+            else:
+                yield self.degraded_response(query, articles, stats)
 
     async def run(self):
         """챗봇 실행"""
         print("챗봇을 초기화하는 중...")
+        self.health.start()
 
         try:
             print("\n향상된 AI 뉴스 챗봇이 준비되었습니다!")
@@ -556,17 +1428,33 @@ class NewsChatbot:
                     continue
 
                 if user_input.lower() in ["exit", "quit"]:
+                    review_stats = self.review_policy.stats()
+                    print(
+                        f"답변 검토 통계 ({review_stats['mode']}): "
+                        f"실행 {review_stats['reviewed']}회, "
+                        f"생략 {review_stats['skipped']}회"
+                    )
+                    print(
+                        f"상위 서비스 통계: {format_resilience_stats(metrics.stats())}"
+                    )
+                    print(
+                        "질의 처리 통계: "
+                        f"{format_query_service_stats(self.query_service.stats())}"
+                    )
+                    print(f"연결 상태: {format_health_status(self.health.status())}")
                     print("챗봇을 종료합니다!")
                     break
 
                 print("\n처리 중...", end="\r")
 
                 try:
+                    stats = {}
                     main_article, related_articles, score, response = (
-                        await self.process_query(user_input)
+                        await self.process_query(user_input, stats)
                     )
 
                     print("\n챗봇: ", response)
+                    print(f"\n{format_stats(stats)}")
 
                     if main_article and score > 0.2:
                         self._display_article_info(
@@ -584,7 +1472,7 @@ class NewsChatbot:
         """기사 정보 출력"""
         print(f"\n주요 참고 기사:")
         print(f"제목: {main_article['title']}")
-        print(f"관련도: {score:.2f}")
+        print(f"관련도: {score:.0%}")
         print(f"URL: {main_article['url']}")
         if "categories" in main_article:
             print(f"카테고리: {', '.join(main_article['categories'])}")
@@ -615,6 +1503,8 @@ if __name__ == "__main__":
         # 데이터베이스 검색 객체 생성
         print("Elasticsearch 동기화를 시작합니다...")
         db_search = DatabaseSearch()
+        db_search.ensure_connected()
+        db_search.ensure_indexes()
 
         # MongoDB에서 Elasticsearch로 데이터 동기화
         print("MongoDB의 데이터를 Elasticsearch로 동기화합니다...")
@@ -0,0 +1,207 @@
+import asyncio
+import os
+import threading
+import weakref
+
+from response_cache import normalize_query
+
+
+class QueryRejected(Exception):
+    """대기열이 가득 차 요청을 받지 않은 경우"""
+
+    def __init__(self):
+        super().__init__("요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+
+class _Broadcast:
+    """하나의 답변 스트림을 여러 구독자가 처음부터 함께 읽도록 버퍼링"""
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self._changed = asyncio.Event()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def publish(self, chunk):
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self, error=None):
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def subscribe(self):
+        index = 0
+        while True:
+            if index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            elif self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            else:
+                await self._changed.wait()
+
+
+class _LoopState:
+    """이벤트 루프별 실행 슬롯, 대기 수, 진행 중인 요청"""
+
+    def __init__(self, max_workers):
+        self.slots = asyncio.Semaphore(max_workers)
+        self.waiting = 0
+        self.running = 0
+        self.in_flight = {}
+
+
+class QueryService:
+    """챗봇 질의 실행 서비스
+
+    - 동시에 실행하는 질의 수를 max_workers로 제한하고 나머지는 대기
+    - 대기 중인 질의가 max_queue개를 넘으면 QueryRejected로 즉시 거절
+    - 같은 질문(정규화 기준)이 실행 중이거나 슬롯을 기다리는 중이면 새로 실행하지
+      않고 그 결과나 답변 스트림을 함께 사용
+    """
+
+    def __init__(self, execute, execute_stream, max_workers=None, max_queue=None):
+        self.execute = execute
+        self.execute_stream = execute_stream
+        self.max_workers = max_workers or int(os.getenv("QUERY_MAX_WORKERS", "8"))
+        self.max_queue = max_queue or int(os.getenv("QUERY_MAX_QUEUE", "32"))
+        self._states = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._counters = {"executed": 0, "coalesced": 0, "rejected": 0}
+
+    def _get_state(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = _LoopState(self.max_workers)
+                self._states[loop] = state
+        return state
+
+    def _count(self, event):
+        with self._lock:
+            self._counters[event] += 1
+
+    def _admit(self, state):
+        """대기열에 넣기 (가득 차면 거절). 슬롯은 실행 작업 안에서 _acquire로 확보"""
+        if state.slots.locked() and state.waiting >= self.max_queue:
+            self._count("rejected")
+            raise QueryRejected()
+        state.waiting += 1
+
+    async def _acquire(self, state):
+        """_admit으로 대기열에 들어간 질의의 실행 슬롯 확보"""
+        try:
+            await state.slots.acquire()
+        finally:
+            state.waiting -= 1
+        state.running += 1
+
+    def _release(self, state):
+        state.running -= 1
+        state.slots.release()
+
+    async def run(self, query, stats=None):
+        """질의를 실행하여 (주요 기사, 관련 기사 목록, 관련도, 답변) 반환"""
+        state = self._get_state()
+        key = ("answer", normalize_query(query))
+        flight = state.in_flight.get(key)
+        if flight is None:
+            # 슬롯을 기다리기 전에 등록하여, 대기 중인 같은 질문도 이 실행을 함께 사용
+            self._admit(state)
+            leader_stats = stats if stats is not None else {}
+            task = asyncio.ensure_future(self._execute(state, query, leader_stats))
+            flight = state.in_flight[key] = (task, leader_stats)
+            task.add_done_callback(lambda _: state.in_flight.pop(key, None))
+            self._count("executed")
+        else:
+            self._count("coalesced")
+
+        task, leader_stats = flight
+        # 한 호출자가 취소되어도 함께 기다리는 다른 호출자의 실행은 계속되도록 보호
+        result = await asyncio.shield(task)
+        if stats is not None and stats is not leader_stats:
+            stats.update(leader_stats, coalesced=True)
+        return result
+
+    async def _execute(self, state, query, stats):
+        await self._acquire(state)
+        try:
+            return await self.execute(query, stats)
+        finally:
+            self._release(state)
+
+    async def stream(self, query, stats=None):
+        """질의를 스트리밍 실행하여 (주요 기사, 관련 기사 목록, 관련도, 답변 조각
+        비동기 제너레이터) 반환
+
+        같은 질문을 동시에 스트리밍하는 사용자들은 하나의 생성 결과를 처음부터 함께 받음
+        """
+        state = self._get_state()
+        key = ("stream", normalize_query(query))
+        flight = state.in_flight.get(key)
+        if flight is None:
+            self._admit(state)
+            leader_stats = stats if stats is not None else {}
+            header = asyncio.get_running_loop().create_future()
+            broadcast = _Broadcast()
+            flight = state.in_flight[key] = (header, broadcast, leader_stats)
+            pump = asyncio.ensure_future(
+                self._pump(state, query, leader_stats, header, broadcast)
+            )
+            pump.add_done_callback(lambda _: state.in_flight.pop(key, None))
+            self._count("executed")
+        else:
+            self._count("coalesced")
+
+        header, broadcast, leader_stats = flight
+        best_article, related_articles, relevance_score = await asyncio.shield(header)
+        if stats is not None and stats is not leader_stats:
+            # 검색/의도 분석 소요 시간은 원래 요청의 기록을 함께 표시
+            stats.update(leader_stats, coalesced=True)
+        return best_article, related_articles, relevance_score, broadcast.subscribe()
+
+    async def _pump(self, state, query, stats, header, broadcast):
+        """스트림을 끝까지 읽어 구독자 버퍼에 전달 (구독자가 떠나도 완료까지 진행)"""
+        acquired = False
+        try:
+            await self._acquire(state)
+            acquired = True
+            best_article, related_articles, relevance_score, chunks = (
+                await self.execute_stream(query, stats)
+            )
+            header.set_result((best_article, related_articles, relevance_score))
+            async for chunk in chunks:
+                broadcast.publish(chunk)
+            broadcast.close()
+        except Exception as e:
+            if not header.done():
+                header.set_exception(e)
+            broadcast.close(e)
+        finally:
+            # 취소된 경우에도 기다리는 구독자가 멈춰 있지 않도록 정리
+            if not header.done():
+                header.cancel()
+            if not broadcast.done:
+                broadcast.close(asyncio.CancelledError())
+            if acquired:
+                self._release(state)
+
+    def stats(self):
+        """실행/병합/거절 횟수와 현재 실행 및 대기 중인 질의 수"""
+        with self._lock:
+            states = list(self._states.values())
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "running": sum(state.running for state in states),
+            "queued": sum(state.waiting for state in states),
+        }
@@ -0,0 +1,294 @@
+import argparse
+import fcntl
+import json
+import os
+import random
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# 마지막 성공 후 갱신 주기의 이 배수만큼 지나면 사이드바에 경고
+STALE_INTERVALS = 3
+
+
+def default_status_path():
+    return os.getenv(
+        "REFRESH_STATUS_PATH", os.path.join(".cache", "refresh_status.json")
+    )
+
+
+def load_refresh_status(path=None):
+    """갱신 상태 파일 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path or default_status_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _duration(seconds):
+    if seconds < 60:
+        return "1분 미만"
+    if seconds < 3600:
+        return f"{seconds // 60:.0f}분"
+    return f"{seconds // 3600:.0f}시간"
+
+
+def _ago(seconds):
+    return "방금" if seconds < 60 else f"{_duration(seconds)} 전"
+
+
+def format_refresh_status(status, now=None):
+    """갱신 상태를 한 줄 문자열로 변환"""
+    if not status:
+        return "갱신 기록 없음"
+    now = now or time.time()
+    if status.get("state") == "running":
+        text = f"갱신 중 ({_ago(now - status['last_started_at'])} 시작)"
+    elif status.get("last_success_at"):
+        text = f"마지막 갱신 {_ago(now - status['last_success_at'])}"
+    else:
+        text = "성공한 갱신 없음"
+    last_run = status.get("last_run")
+    if last_run:
+        text += (
+            f" · 새 기사 {last_run['new_articles']}건, " f"색인 {last_run['indexed']}건"
+        )
+    if status.get("state") != "running" and status.get("next_run_at"):
+        remaining = max(0, status["next_run_at"] - now)
+        text += f" · 다음 갱신 약 {remaining // 60:.0f}분 후"
+    return text
+
+
+def refresh_warnings(status, now=None):
+    """최근 실패와 오래된 색인 경고"""
+    if not status:
+        return []
+    now = now or time.time()
+    warnings = []
+    if status.get("last_error"):
+        warnings.append(
+            f"색인 갱신 실패 ({status['consecutive_failures']}회 연속): "
+            f"{status['last_error']}"
+        )
+    last_success = status.get("last_success_at")
+    if last_success and now - last_success > status["interval_s"] * STALE_INTERVALS:
+        warnings.append(
+            f"검색 색인이 {_duration(now - last_success)} 동안 갱신되지 않았습니다."
+        )
+    return warnings
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+@contextmanager
+def run_lock(path):
+    """다른 프로세스가 갱신 중이면 False, 아니면 잠금을 잡고 True를 넘김
+
+    프로세스가 비정상 종료되어도 운영체제가 잠금을 풀어 주는 flock 사용
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RefreshDaemon:
+    """주기적으로 새 기사를 크롤링하고 바뀐 기사만 Elasticsearch에 반영
+
+    - 실행 간격은 interval ± jitter초 (여러 인스턴스가 같은 시각에 몰리지 않도록)
+    - 잠금 파일로 다른 데몬이나 수동 실행과 겹치지 않게 하고, 겹치면 이번 실행은 건너뜀
+    - 크롤링 후 crawled_date가 기준 시각 이후인 기사만 upsert. 기준 시각은 상태 파일에
+      보관하며, 다른 크롤러가 늦게 저장한 기사도 놓치지 않도록 overlap초 앞에서부터 조회
+    - 실행 상태와 결과는 상태 파일(REFRESH_STATUS_PATH)에 기록 (사이드바에서 표시)
+    """
+
+    def __init__(
+        self,
+        interval=None,
+        jitter=None,
+        max_pages=None,
+        overlap=None,
+        status_path=None,
+        lock_path=None,
+    ):
+        self.interval = interval or float(os.getenv("REFRESH_INTERVAL_SECONDS", "600"))
+        self.jitter = (
+            jitter
+            if jitter is not None
+            else float(os.getenv("REFRESH_JITTER_SECONDS", "60"))
+        )
+        self.max_pages = max_pages or int(os.getenv("REFRESH_MAX_PAGES", "5"))
+        self.overlap = (
+            overlap
+            if overlap is not None
+            else float(os.getenv("REFRESH_OVERLAP_SECONDS", "300"))
+        )
+        self.status_path = status_path or default_status_path()
+        self.lock_path = lock_path or os.getenv(
+            "REFRESH_LOCK_PATH", os.path.join(".cache", "refresh.lock")
+        )
+        self.status = load_refresh_status(self.status_path) or {
+            "consecutive_failures": 0
+        }
+        self.status["interval_s"] = self.interval
+        self._stop = threading.Event()
+        self._db_search = None
+
+    @property
+    def db_search(self):
+        if self._db_search is None:
+            from query_action import DatabaseSearch
+
+            self._db_search = DatabaseSearch()
+            self._db_search.ensure_indexes()
+        return self._db_search
+
+    def _write_status(self):
+        try:
+            _write_atomic(
+                self.status_path,
+                json.dumps(self.status, ensure_ascii=False, indent=2),
+            )
+        except OSError as e:
+            print(f"갱신 상태 기록 실패: {e}")
+
+    def _watermark(self):
+        watermark = self.status.get("watermark")
+        return datetime.fromisoformat(watermark) if watermark else None
+
+    def run_once(self):
+        """크롤링과 색인 갱신을 한 번 실행 (잠금을 잡지 못하면 건너뛰고 False 반환)"""
+        from chrawling_mongoDB import crawl
+
+        with run_lock(self.lock_path) as acquired:
+            if not acquired:
+                print("다른 갱신 작업이 실행 중이라 이번 실행을 건너뜁니다.")
+                return False
+
+            started_at = time.time()
+            self.status.update(
+                state="running",
+                pid=os.getpid(),
+                last_started_at=started_at,
+                next_run_at=None,
+            )
+            self._write_status()
+            try:
+                started = time.perf_counter()
+                crawl_summary = crawl(
+                    self.db_search.mongo_collection,
+                    max_pages=self.max_pages,
+                    max_consecutive_no_new=1,
+                )
+                crawl_s = time.perf_counter() - started
+
+                watermark = self._watermark()
+                since = (
+                    watermark - timedelta(seconds=self.overlap) if watermark else None
+                )
+                indexed, index_errors, new_watermark = (
+                    self.db_search.sync_changed_articles(since)
+                )
+                # 새 기사가 없으면 overlap만큼 당겨진 시각이 돌아오므로 기존 값 유지
+                if new_watermark is not None and (
+                    watermark is None or new_watermark > watermark
+                ):
+                    watermark = new_watermark
+
+                counters = crawl_summary["counters"]
+                self.status.update(
+                    last_success_at=time.time(),
+                    last_error=None,
+                    consecutive_failures=0,
+                    watermark=watermark.isoformat() if watermark else None,
+                    last_run={
+                        "new_articles": counters.get("articles_saved", 0),
+                        "updated_articles": counters.get("articles_updated", 0),
+                        "pages": counters.get("pages", 0),
+                        "indexed": indexed,
+                        "index_errors": index_errors,
+                        "crawl_s": round(crawl_s, 2),
+                        "duration_s": round(time.time() - started_at, 2),
+                        "crawler_warnings": crawl_summary["warnings"],
+                    },
+                )
+                print(
+                    f"갱신 완료: 새 기사 {counters.get('articles_saved', 0)}건, "
+                    f"색인 {indexed}건 (실패 {index_errors}건)"
+                )
+            except Exception as e:
+                self.status["last_error"] = f"{type(e).__name__}: {e}"[:200]
+                self.status["consecutive_failures"] += 1
+                print(f"갱신 중 오류 발생: {e}")
+            finally:
+                self.status.update(state="idle", last_finished_at=time.time())
+                self._write_status()
+        return True
+
+    def next_delay(self):
+        return max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def run_forever(self):
+        """stop()이 호출되거나 SIGTERM/SIGINT를 받을 때까지 주기적으로 실행"""
+        # 여러 인스턴스를 동시에 띄워도 첫 실행이 겹치지 않도록 시작도 분산
+        delay = random.uniform(0, self.jitter)
+        while not self._stop.wait(delay):
+            self.run_once()
+            delay = self.next_delay()
+            self.status["next_run_at"] = time.time() + delay
+            self._write_status()
+            print(f"다음 갱신까지 {delay:.0f}초 대기")
+        print("갱신 서비스를 종료합니다.")
+
+    def stop(self, *_):
+        self._stop.set()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="새 기사 크롤링과 Elasticsearch 증분 색인을 주기적으로 실행"
+    )
+    parser.add_argument("--once", action="store_true", help="한 번만 실행하고 종료")
+    parser.add_argument("--interval", type=float, help="실행 간격(초)")
+    parser.add_argument(
+        "--jitter", type=float, help="실행 간격에 더하는 무작위 범위(초)"
+    )
+    parser.add_argument("--max-pages", type=int, help="한 번에 확인할 최대 목록 페이지")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    daemon = RefreshDaemon(
+        interval=args.interval, jitter=args.jitter, max_pages=args.max_pages
+    )
+    if args.once:
+        daemon.run_once()
+        return
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    daemon.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import asyncio
+import os
+import threading
+import time
+
+
+def env_seconds(name, default=None):
+    """초 단위 환경 변수 값 (비어 있거나 0이면 default)"""
+    value = os.getenv(name)
+    return float(value) if value and float(value) > 0 else default
+
+
+class CircuitOpenError(Exception):
+    """상위 서비스가 비정상으로 판단되어 호출을 차단한 경우"""
+
+    def __init__(self, upstream):
+        super().__init__(f"{upstream} 서비스가 일시적으로 차단되었습니다.")
+        self.upstream = upstream
+
+
+class Deadline:
+    """요청 전체 처리 시간 예산
+
+    각 단계는 timeout()으로 남은 예산과 단계별 상한 중 작은 값을 받아 사용
+    """
+
+    def __init__(self, budget_seconds=None):
+        self.budget_seconds = budget_seconds or env_seconds(
+            "REQUEST_BUDGET_SECONDS", 45.0
+        )
+        self.started = time.monotonic()
+
+    def remaining(self):
+        return max(0.0, self.budget_seconds - (time.monotonic() - self.started))
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self, cap=None):
+        """이번 단계에 쓸 수 있는 시간 (예산을 다 썼으면 TimeoutError)"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutError("요청 처리 시간 예산을 모두 사용했습니다.")
+        return min(remaining, cap) if cap else remaining
+
+
+class ResilienceMetrics:
+    """상위 서비스별 호출, 실패, 타임아웃, 차단, 헤지 횟수 집계"""
+
+    EVENTS = (
+        "calls",
+        "failures",
+        "timeouts",
+        "rejected",
+        "trips",
+        "hedges",
+        "hedge_wins",
+        "fallbacks",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def record(self, upstream, event):
+        with self._lock:
+            counters = self._counters.setdefault(
+                upstream, dict.fromkeys(self.EVENTS, 0)
+            )
+            counters[event] += 1
+
+    def stats(self):
+        with self._lock:
+            return {name: dict(counters) for name, counters in self._counters.items()}
+
+
+# 모든 세션이 공유하는 프로세스 단위 지표
+metrics = ResilienceMetrics()
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold에 이르면 reset_timeout 동안 호출을 차단
+
+    차단 시간이 지나면 시험 호출 하나만 허용(half_open)하고, 성공하면 다시 열림
+    """
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or int(
+            os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")
+        )
+        self.reset_timeout = reset_timeout or env_seconds("CIRCUIT_RESET_SECONDS", 30.0)
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self):
+        with self._lock:
+            if (
+                self._state == "open"
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return "half_open"
+            return self._state
+
+    def allow(self):
+        """이번 호출을 보내도 되는지 판단"""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # 차단 시간이 지나면 시험 호출 하나를 보내고, 결과가 없어도
+            # reset_timeout이 다시 지나면 다음 시험 호출을 허용
+            self._state = "half_open"
+            self._opened_at = time.monotonic()
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == "half_open" or (
+                self._state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                metrics.record(self.name, "trips")
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """같은 이름의 상위 서비스는 프로세스 전체에서 하나의 차단기를 공유"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+class Upstream:
+    """상위 서비스 호출에 타임아웃, 헤지 재시도, 차단기를 적용하는 래퍼
+
+    hedge_after초 안에 응답이 없으면 같은 호출을 한 번 더 보내고 먼저 성공한
+    결과를 사용 (멱등 호출에만 사용)
+    """
+
+    def __init__(self, name, timeout, hedge_after=None, breaker=None):
+        self.name = name
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.breaker = breaker or get_breaker(name)
+
+    async def call(self, factory, deadline=None, timeout=None):
+        """factory()가 만드는 코루틴을 보호된 호출로 실행"""
+        if not self.breaker.allow():
+            metrics.record(self.name, "rejected")
+            raise CircuitOpenError(self.name)
+
+        timeout = timeout or self.timeout
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+        metrics.record(self.name, "calls")
+        try:
+            result = await asyncio.wait_for(self._hedged(factory), timeout)
+        except asyncio.TimeoutError:
+            metrics.record(self.name, "timeouts")
+            self.breaker.record_failure()
+            raise TimeoutError(
+                f"{self.name} 호출 시간이 {timeout:.1f}초를 초과했습니다."
+            )
+        except Exception:
+            metrics.record(self.name, "failures")
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def stream(self, chunks):
+        """스트리밍 호출에 차단기를 적용 (조각 간 타임아웃은 호출 측에서 처리)"""
+        if not self.breaker.allow():
+            metrics.record(self.name, "rejected")
+            raise CircuitOpenError(self.name)
+
+        metrics.record(self.name, "calls")
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except TimeoutError:
+            metrics.record(self.name, "timeouts")
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            metrics.record(self.name, "failures")
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+
+    async def _hedged(self, factory):
+        if not self.hedge_after:
+            return await factory()
+
+        first = asyncio.ensure_future(factory())
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=self.hedge_after)
+            if done:
+                return first.result()
+
+            metrics.record(self.name, "hedges")
+            hedge = asyncio.ensure_future(factory())
+            pending = {first, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            metrics.record(self.name, "hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # 먼저 끝난 호출 외의 나머지 호출과, 시간 초과로 취소된 경우 모든 호출을 정리
+            for task in (first, hedge):
+                if task is not None:
+                    task.cancel()
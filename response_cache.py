@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+
+
+def normalize_query(query):
+    """대소문자, 문장부호, 공백 차이를 없앤 정규화 질의"""
+    query = unicodedata.normalize("NFC", query).lower()
+    query = re.sub(r"[^\w\s]", " ", query)
+    return " ".join(query.split())
+
+
+def article_fingerprint(article):
+    """기사가 다시 크롤링되거나 내용이 바뀌면 달라지는 지문"""
+    digest = hashlib.sha1()
+    for field in ("crawled_date", "title", "content"):
+        digest.update(str(article.get(field) or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:16]
+
+
+class ResponseCache:
+    """정규화된 질문과 검색된 기사 ID를 키로 하는 SQLite 답변 캐시
+
+    - 항목은 ttl_seconds가 지나면 만료
+    - 항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+    - 캐시된 답변이 참조한 기사의 지문이 바뀌면 해당 항목을 무효화
+    """
+
+    def __init__(self, path=None, ttl_seconds=None, max_entries=None):
+        self.path = path or os.getenv(
+            "RESPONSE_CACHE_PATH", os.path.join(".cache", "response_cache.sqlite3")
+        )
+        self.ttl_seconds = ttl_seconds or float(
+            os.getenv("RESPONSE_CACHE_TTL_SECONDS", str(24 * 60 * 60))
+        )
+        self.max_entries = max_entries or int(
+            os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000")
+        )
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "invalidated": 0, "evicted": 0}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_responses_last_access
+                    ON responses (last_access);
+                CREATE TABLE IF NOT EXISTS response_articles (
+                    key TEXT NOT NULL,
+                    article_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    PRIMARY KEY (key, article_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_response_articles_article
+                    ON response_articles (article_id);
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        """트랜잭션을 커밋하고 연결을 닫는 SQLite 연결 컨텍스트"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(query, articles):
+        """정규화된 질문과 정렬된 기사 ID로 캐시 키 생성"""
+        article_ids = sorted(str(article["id"]) for article in articles)
+        raw = normalize_query(query) + "|" + ",".join(article_ids)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, query, articles):
+        """캐시된 결과를 (주요 기사, 관련 기사 목록, 관련도, 답변)으로 반환 (없으면 None)"""
+        key = self.make_key(query, articles)
+        now = time.time()
+
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+
+            payload, created_at = row
+            stored = dict(
+                conn.execute(
+                    "SELECT article_id, fingerprint FROM response_articles "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchall()
+            )
+            current = {
+                str(article["id"]): article_fingerprint(article) for article in articles
+            }
+            if now - created_at > self.ttl_seconds or stored != current:
+                self._delete(conn, [key])
+                self._counters["invalidated"] += 1
+                self._counters["misses"] += 1
+                return None
+
+            conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._counters["hits"] += 1
+
+        payload = json.loads(payload)
+        articles_by_id = {str(article["id"]): article for article in articles}
+        best_article = articles_by_id.get(payload["best_article_id"])
+        related_articles = [
+            articles_by_id[article_id]
+            for article_id in payload["related_article_ids"]
+            if article_id in articles_by_id
+        ]
+        return (
+            best_article,
+            related_articles,
+            payload["relevance_score"],
+            payload["response"],
+        )
+
+    def set(
+        self, query, articles, best_article, related_articles, relevance_score, response
+    ):
+        """답변과 참조 기사 지문을 저장하고 용량을 넘으면 오래된 항목 삭제"""
+        key = self.make_key(query, articles)
+        now = time.time()
+        payload = json.dumps(
+            {
+                "best_article_id": str(best_article["id"]) if best_article else None,
+                "related_article_ids": [
+                    str(article["id"]) for article in related_articles
+                ],
+                "relevance_score": relevance_score,
+                "response": response,
+            },
+            ensure_ascii=False,
+        )
+
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, query, payload, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, normalize_query(query), payload, now, now),
+            )
+            conn.execute("DELETE FROM response_articles WHERE key = ?", (key,))
+            conn.executemany(
+                "INSERT INTO response_articles (key, article_id, fingerprint) "
+                "VALUES (?, ?, ?)",
+                [
+                    (key, str(article["id"]), article_fingerprint(article))
+                    for article in articles
+                ],
+            )
+            self._evict(conn)
+
+    def latest_response(self, query):
+        """검색 결과나 만료 여부와 상관없이 같은 질문에 대한 가장 최근 답변 반환
+
+        LLM을 쓸 수 없을 때 대체 답변으로만 사용 (없으면 None)
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM responses WHERE query = ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (normalize_query(query),),
+            ).fetchone()
+        return json.loads(row[0])["response"] if row else None
+
+    def invalidate_articles(self, article_ids):
+        """지정한 기사를 참조하는 캐시 항목 삭제"""
+        article_ids = [str(article_id) for article_id in article_ids]
+        if not article_ids:
+            return 0
+
+        with self._lock, self._connect() as conn:
+            placeholders = ",".join("?" for _ in article_ids)
+            keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT key FROM response_articles "
+                    f"WHERE article_id IN ({placeholders})",
+                    article_ids,
+                )
+            ]
+            self._delete(conn, keys)
+            self._counters["invalidated"] += len(keys)
+            return len(keys)
+
+    def stats(self):
+        """캐시 적중/실패 횟수와 현재 항목 수 반환"""
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {**self._counters, "entries": entries}
+
+    def _evict(self, conn):
+        """최대 항목 수를 넘는 만큼 가장 오래 사용되지 않은 항목 삭제"""
+        count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        keys = [
+            row[0]
+            for row in conn.execute(
+                "SELECT key FROM responses ORDER BY last_access ASC LIMIT ?",
+                (overflow,),
+            )
+        ]
+        self._delete(conn, keys)
+        self._counters["evicted"] += len(keys)
+
+    @staticmethod
+    def _delete(conn, keys):
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in keys])
+        conn.executemany(
+            "DELETE FROM response_articles WHERE key = ?", [(k,) for k in keys]
+        )
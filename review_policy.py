@@ -0,0 +1,115 @@
+import os
+import re
+import threading
+
+from intent_classifier import parse_intent_analysis
+
+REVIEW_MODES = ("always", "never", "adaptive")
+
+# 검토 호출을 생략할 수 있도록 생성 프롬프트에 덧붙이는 자기 점검 지침
+SELF_CHECK_INSTRUCTIONS = """
+
+답변을 마치기 전에 스스로 점검하세요:
+- 질문 의도에 직접 답했는지 확인합니다.
+- 기사에 없는 내용을 기사 내용처럼 쓰지 않았는지 확인합니다.
+- 날짜와 시간 정보가 기사와 일치하는지 확인합니다.
+- 위에 제시한 답변 형식의 항목을 모두 채웠는지 확인합니다."""
+
+# 프롬프트 종류별로 답변에 반드시 있어야 하는 항목
+REQUIRED_SECTIONS = {
+    "full_context": ("핵심 답변", "뉴스 근거"),
+    "hybrid": ("직접 답변", "정보 출처"),
+    "knowledge": ("핵심 답변", "한계 설명"),
+}
+
+# 추가 검토가 도움이 되는 질문 유형
+COMPLEX_INTENTS = ("비교 분석", "의견 요청")
+
+DATE_PATTERN = re.compile(r"\d{4}년|\d{1,2}월|\d{4}[.-]\d{1,2}|\d{1,2}일")
+
+
+class ReviewPolicy:
+    """답변 검토(두 번째 LLM 호출) 실행 여부를 결정하는 정책
+
+    - always: 항상 검토
+    - never: 검토하지 않고 생성 프롬프트의 자기 점검 지침에 맡김
+    - adaptive: 값싼 로컬 휴리스틱으로 검토가 필요한 요청만 검토
+    """
+
+    def __init__(self, mode=None, min_relevance=0.3, min_length=150):
+        self.mode = (mode or os.getenv("REVIEW_MODE", "adaptive")).lower()
+        if self.mode not in REVIEW_MODES:
+            raise ValueError(
+                f"지원하지 않는 검토 모드입니다: {self.mode} ({', '.join(REVIEW_MODES)})"
+            )
+        self.min_relevance = min_relevance
+        self.min_length = min_length
+        self._lock = threading.Lock()
+        self._counters = {"reviewed": 0, "skipped": 0}
+        self._reasons = {}
+
+    @property
+    def folds_self_check(self):
+        """검토를 생략할 수 있는 모드면 생성 프롬프트에 자기 점검 지침을 포함"""
+        return self.mode != "always"
+
+    def decide(self, response, intent_analysis, best_article, relevance_score):
+        """검토 여부와 그 사유를 (bool, 사유) 형태로 반환"""
+        if self.mode == "always":
+            return True, "mode_always"
+        if self.mode == "never":
+            return False, "mode_never"
+
+        if len(response.strip()) < self.min_length:
+            return True, "too_short"
+
+        if best_article is None:
+            prompt_type = "knowledge"
+        elif relevance_score is not None and relevance_score < self.min_relevance:
+            prompt_type = "hybrid"
+        else:
+            prompt_type = "full_context"
+        if not all(section in response for section in REQUIRED_SECTIONS[prompt_type]):
+            return True, "missing_sections"
+
+        question_type = parse_intent_analysis(intent_analysis)["question_type"]
+        if question_type in COMPLEX_INTENTS:
+            return True, "complex_intent"
+        if question_type == "날짜 확인" and not DATE_PATTERN.search(response):
+            return True, "missing_date"
+
+        if prompt_type == "hybrid":
+            return True, "low_relevance"
+        if best_article is not None and not self._mentions_article(
+            response, best_article
+        ):
+            return True, "ungrounded"
+
+        return False, "heuristics_passed"
+
+    def record(self, reviewed, reason):
+        """검토 실행/생략 횟수와 사유별 횟수 기록"""
+        with self._lock:
+            self._counters["reviewed" if reviewed else "skipped"] += 1
+            self._reasons[reason] = self._reasons.get(reason, 0) + 1
+
+    def stats(self):
+        """현재까지의 검토 통계 반환"""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                **self._counters,
+                "reasons": dict(self._reasons),
+            }
+
+    @staticmethod
+    def _mentions_article(response, article):
+        """답변이 주요 기사 제목의 핵심 단어를 하나라도 언급하는지 확인"""
+        title_words = [
+            word
+            for word in re.split(r"[\s,·…]+", article.get("title", ""))
+            if len(word) >= 2
+        ]
+        if not title_words:
+            return True
+        return any(word[:2] in response for word in title_words)
@@ -0,0 +1,334 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from latency_stats import percentile
+from query_action import DatabaseSearch
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark")
+RESULT_SCHEMA_VERSION = 1
+
+
+def load_corpus(path):
+    """JSONL 형식의 픽스처 코퍼스 로드"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def load_query_set(path):
+    """버전이 지정된 질의 세트 로드"""
+    with open(path, encoding="utf-8") as f:
+        query_set = json.load(f)
+    if "version" not in query_set or "queries" not in query_set:
+        raise ValueError(f"질의 세트 형식이 올바르지 않습니다: {path}")
+    return query_set
+
+
+def get_git_commit():
+    """현재 git 커밋 해시 (없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def seed_index(db_search, corpus):
+    """벤치마크 인덱스를 새로 만들고 픽스처 코퍼스로 채움"""
+    db_search.create_es_index()
+    success_count, errors = db_search.index_documents(corpus, refresh=True)
+    if errors:
+        print(f"색인 실패 문서: {len(errors)}개")
+    print(f"픽스처 문서 {success_count}개를 '{db_search.index_name}'에 색인했습니다.")
+
+
+def evaluate_relevance(db_search, queries, k):
+    """질의별 recall@k와 MRR 계산
+
+    검색에 실패한 질의는 recall 0으로 세지 않고 errors에 따로 집계
+    """
+    per_query = []
+    errors = []
+    loop = asyncio.new_event_loop()
+    try:
+        for item in queries:
+            try:
+                results = loop.run_until_complete(
+                    db_search.semantic_search(item["query"], size=k, raise_errors=True)
+                )
+            except Exception as e:
+                errors.append(
+                    {"id": item["id"], "query": item["query"], "error": str(e)}
+                )
+                continue
+            urls = [result["url"] for result in results[:k]]
+            expected = set(item["expected_urls"])
+
+            hits = len(expected.intersection(urls))
+            recall = hits / len(expected) if expected else 0.0
+            reciprocal_rank = 0.0
+            for rank, url in enumerate(urls, start=1):
+                if url in expected:
+                    reciprocal_rank = 1.0 / rank
+                    break
+
+            per_query.append(
+                {
+                    "id": item["id"],
+                    "query": item["query"],
+                    "recall": recall,
+                    "reciprocal_rank": reciprocal_rank,
+                    "returned_urls": urls,
+                }
+            )
+    finally:
+        loop.close()
+
+    count = len(per_query) or 1
+    return {
+        "k": k,
+        f"recall_at_{k}": sum(q["recall"] for q in per_query) / count,
+        "mrr": sum(q["reciprocal_rank"] for q in per_query) / count,
+        "errors": len(errors),
+        "per_query": per_query,
+        "failed_queries": errors,
+    }
+
+
+def measure_latency(db_search, queries, concurrency, iterations, k):
+    """지정한 동시성으로 질의를 반복 실행하여 지연 시간과 QPS 측정
+
+    실패한 요청은 errors로만 세고 지연 시간 백분위수와 QPS에서는 제외
+    """
+    workload = [item["query"] for item in queries] * iterations
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    next_index = [0]
+
+    def worker():
+        # 스레드마다 이벤트 루프를 하나만 만들어 루프 생성 비용이 측정에 섞이지 않도록 함
+        loop = asyncio.new_event_loop()
+        local_latencies = []
+        local_errors = 0
+        try:
+            while True:
+                with lock:
+                    if next_index[0] >= len(workload):
+                        break
+                    query = workload[next_index[0]]
+                    next_index[0] += 1
+
+                started = time.perf_counter()
+                try:
+                    loop.run_until_complete(
+                        db_search.semantic_search(query, size=k, raise_errors=True)
+                    )
+                except Exception:
+                    local_errors += 1
+                    continue
+                local_latencies.append((time.perf_counter() - started) * 1000)
+        finally:
+            loop.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "duration_s": round(elapsed, 4),
+        "qps": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(max(latencies), 3) if latencies else 0.0,
+    }
+
+
+def compare_results(current, baseline, max_latency_regression, max_quality_drop):
+    """기준 결과와 비교하여 차이를 출력하고 회귀 여부를 반환"""
+    regressions = []
+    k = current["relevance"]["k"]
+    recall_key = f"recall_at_{k}"
+
+    print("\n=== 기준 결과와 비교 ===")
+    if baseline.get("query_set") != current.get("query_set"):
+        print("주의: 질의 세트 버전이 달라 직접 비교가 정확하지 않을 수 있습니다.")
+
+    if current["relevance"].get("errors"):
+        regressions.append(f"검색 실패 질의 {current['relevance']['errors']}개")
+
+    for key in (recall_key, "mrr"):
+        before = baseline["relevance"].get(key)
+        after = current["relevance"][key]
+        if before is None:
+            continue
+        print(f"{key}: {before:.4f} -> {after:.4f} ({after - before:+.4f})")
+        if before - after > max_quality_drop:
+            regressions.append(f"{key} 하락 ({before:.4f} -> {after:.4f})")
+
+    baseline_latency = {row["concurrency"]: row for row in baseline.get("latency", [])}
+    for row in current["latency"]:
+        if row.get("errors"):
+            regressions.append(
+                f"동시성 {row['concurrency']} 검색 실패 {row['errors']}건"
+            )
+        before = baseline_latency.get(row["concurrency"])
+        if not before:
+            continue
+        for key in ("p50_ms", "p95_ms", "p99_ms", "qps"):
+            change = (row[key] - before[key]) / before[key] if before[key] else 0.0
+            print(
+                f"동시성 {row['concurrency']} {key}: "
+                f"{before[key]} -> {row[key]} ({change:+.1%})"
+            )
+        if before["p95_ms"] and (
+            (row["p95_ms"] - before["p95_ms"]) / before["p95_ms"]
+            > max_latency_regression
+        ):
+            regressions.append(
+                f"동시성 {row['concurrency']} p95 지연 증가 "
+                f"({before['p95_ms']}ms -> {row['p95_ms']}ms)"
+            )
+
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="검색 품질 및 지연 시간 벤치마크")
+    parser.add_argument(
+        "--corpus", default=os.path.join(BENCHMARK_DIR, "corpus_v1.jsonl")
+    )
+    parser.add_argument(
+        "--queries", default=os.path.join(BENCHMARK_DIR, "queries_v1.json")
+    )
+    parser.add_argument("--es-url", default="http://localhost:9200")
+    parser.add_argument("--index", default="news_articles_benchmark")
+    parser.add_argument("-k", type=int, default=5, help="recall@k 계산 기준")
+    parser.add_argument(
+        "--concurrency",
+        default="1,4,8",
+        help="쉼표로 구분한 동시성 수준 목록",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=5, help="동시성 수준별 질의 세트 반복 횟수"
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="워밍업 반복 횟수")
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="이미 색인된 인덱스를 그대로 사용"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument(
+        "--max-latency-regression",
+        type=float,
+        default=0.2,
+        help="허용할 p95 지연 증가율 (기본 20%%)",
+    )
+    parser.add_argument(
+        "--max-quality-drop",
+        type=float,
+        default=0.0,
+        help="허용할 recall/MRR 하락 폭",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    query_set = load_query_set(args.queries)
+    queries = query_set["queries"]
+    concurrency_levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+
+    db_search = DatabaseSearch(
+        index_name=args.index, es_url=args.es_url, use_mongodb=False
+    )
+    db_search.ensure_connected()
+    if not args.skip_seed:
+        seed_index(db_search, load_corpus(args.corpus))
+
+    print(f"질의 세트 {query_set['name']} v{query_set['version']} ({len(queries)}개)")
+    relevance = evaluate_relevance(db_search, queries, args.k)
+    print(
+        f"recall@{args.k}: {relevance[f'recall_at_{args.k}']:.4f}, "
+        f"MRR: {relevance['mrr']:.4f}, 실패 {relevance['errors']}개"
+    )
+
+    if args.warmup:
+        measure_latency(db_search, queries, 1, args.warmup, args.k)
+
+    latency = []
+    for concurrency in concurrency_levels:
+        row = measure_latency(db_search, queries, concurrency, args.iterations, args.k)
+        latency.append(row)
+        print(
+            f"동시성 {concurrency}: {row['qps']} QPS, "
+            f"p50 {row['p50_ms']}ms, p95 {row['p95_ms']}ms, p99 {row['p99_ms']}ms, "
+            f"실패 {row['errors']}건"
+        )
+
+    results = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "query_set": {"name": query_set["name"], "version": query_set["version"]},
+        "timestamp": datetime.now().isoformat(),
+        "git_commit": get_git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {
+            "es_url": args.es_url,
+            "index": args.index,
+            "k": args.k,
+            "iterations": args.iterations,
+            "concurrency": concurrency_levels,
+            "corpus": os.path.basename(args.corpus),
+        },
+        "relevance": relevance,
+        "latency": latency,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+    else:
+        print(json.dumps({k: v for k, v in results.items() if k != "relevance"}))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(
+            results, baseline, args.max_latency_regression, args.max_quality_drop
+        )
+        if regressions:
+            print("\n성능 회귀가 감지되었습니다:")
+            for regression in regressions:
+                print(f"- {regression}")
+            raise SystemExit(1)
+        print("\n성능 회귀가 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from article_enrichment import (
+    ENRICHMENT_VERSION,
+    UNCALIBRATED_VERSION,
+    ArticleEnricher,
+)
+
+CONTENT = (
+    "삼성전자가 새 AI 반도체를 공개했다. 이 AI 반도체는 데이터센터용이다. "
+    "회사는 내년부터 AI 반도체 양산을 시작한다고 밝혔다."
+)
+
+
+def test_enrich_without_stats_is_marked_uncalibrated():
+    enrichment = ArticleEnricher().enrich("AI 반도체 공개", CONTENT)
+    assert enrichment["enrichment_version"] == UNCALIBRATED_VERSION
+    assert enrichment["summary"]
+
+
+def test_enrich_with_stats_uses_current_version():
+    enricher = ArticleEnricher()
+    enricher.add_document(CONTENT)
+    enricher.add_document("정부가 새 예산안을 발표했다.")
+    enrichment = enricher.enrich("AI 반도체 공개", CONTENT)
+    assert enrichment["enrichment_version"] == ENRICHMENT_VERSION
+    assert any("반도체" in phrase for phrase in enrichment["keyphrases"])
+
+
+def test_saved_stats_are_loaded(tmp_path, monkeypatch):
+    path = tmp_path / "stats.json"
+    monkeypatch.setenv("ENRICHMENT_STATS_PATH", str(path))
+    assert ArticleEnricher.load().documents == 0
+
+    enricher = ArticleEnricher()
+    for _ in range(3):
+        enricher.add_document(CONTENT)
+    enricher.save()
+
+    loaded = ArticleEnricher.load()
+    assert loaded.documents == 3
+    assert loaded.document_frequency["반도체"] == 3
+
+
+def test_crawler_reloads_stats_each_run(tmp_path, monkeypatch):
+    from chrawling_mongoDB import ArticleCrawler
+
+    monkeypatch.setenv("ENRICHMENT_STATS_PATH", str(tmp_path / "stats.json"))
+    monkeypatch.setenv("CRAWLER_METRICS_PATH", str(tmp_path / "metrics.json"))
+    assert ArticleCrawler(None).enricher.documents == 0
+
+    enricher = ArticleEnricher()
+    enricher.add_document(CONTENT)
+    enricher.save()
+    assert ArticleCrawler(None).enricher.documents == 1
@@ -0,0 +1,91 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from async_runtime import BackgroundEventLoop
+
+
+@pytest.fixture
+def runtime():
+    runtime = BackgroundEventLoop(name="test-event-loop")
+    yield runtime
+    runtime.stop()
+
+
+def test_run_returns_result_from_loop_thread(runtime):
+    async def current_thread_name():
+        return threading.current_thread().name
+
+    assert runtime.run(current_thread_name()) == "test-event-loop"
+
+
+def test_run_cancels_coroutine_on_timeout(runtime):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        runtime.run(slow(), timeout=0.05)
+    assert cancelled.wait(1)
+
+
+def test_iterate_yields_items_in_order(runtime):
+    async def numbers():
+        for number in range(3):
+            await asyncio.sleep(0)
+            yield number
+
+    assert list(runtime.iterate(numbers())) == [0, 1, 2]
+
+
+def test_iterate_propagates_exceptions(runtime):
+    async def failing():
+        yield "first"
+        raise RuntimeError("boom")
+
+    items = runtime.iterate(failing())
+    assert next(items) == "first"
+    with pytest.raises(RuntimeError, match="boom"):
+        next(items)
+
+
+def test_closing_iteration_closes_async_generator(runtime):
+    closed = threading.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield "chunk"
+        finally:
+            closed.set()
+
+    items = runtime.iterate(endless())
+    assert next(items) == "chunk"
+    items.close()
+    assert closed.wait(1)
+
+
+def test_iteration_timeout_cancels_pending_item(runtime):
+    cancelled = threading.Event()
+
+    async def stalled():
+        yield "first"
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        yield "never"
+
+    items = runtime.iterate(stalled(), timeout=0.05)
+    assert next(items) == "first"
+    with pytest.raises(concurrent.futures.TimeoutError):
+        next(items)
+    assert cancelled.wait(1)
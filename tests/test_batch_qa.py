@@ -0,0 +1,92 @@
+import asyncio
+import io
+import json
+
+from batch_qa import load_completed, read_questions, run_batch, summarize
+
+
+class FakeChatbot:
+    """질문이 "실패"일 때만 예외를 내고 나머지는 캐시 적중으로 답하는 가짜 챗봇"""
+
+    async def process_query(self, query, stats):
+        if query == "실패":
+            raise RuntimeError("boom")
+        stats["cache_hit"] = True
+        article = {"title": query, "url": f"https://example.com/{query}"}
+        return article, [], 0.9, "답변 " * 100
+
+
+def test_run_batch_writes_full_records_and_keeps_summary_fields():
+    questions = [
+        {"id": str(number), "query": query, "metadata": {}}
+        for number, query in enumerate(["AI", "실패", "반도체"], 1)
+    ]
+    output = io.StringIO()
+    results = asyncio.run(run_batch(FakeChatbot(), questions, output, 2))
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert sorted(record["id"] for record in records) == ["1", "2", "3"]
+    assert all("answer" in record for record in records if record["ok"])
+
+    assert all(
+        set(result) == {"ok", "total_ms", "cache_hit", "degraded"} for result in results
+    )
+    summary = summarize(results, 1.0)
+    assert (summary["questions"], summary["ok"], summary["failed"]) == (3, 2, 1)
+    assert summary["cache_hits"] == 2
+
+
+def test_read_questions_from_jsonl(tmp_path):
+    path = tmp_path / "questions.jsonl"
+    path.write_text(
+        '{"id": "q1", "query": " AI 반도체? ", "category": "tech"}\n'
+        "\n"
+        '{"question": "환율 전망", "lang": ""}\n'
+        '{"id": "q3", "note": "질문 없음"}\n',
+        encoding="utf-8",
+    )
+    assert list(read_questions(str(path))) == [
+        {"id": "q1", "query": "AI 반도체?", "metadata": {"category": "tech"}},
+        {"id": "2", "query": "환율 전망", "metadata": {}},
+    ]
+
+
+def test_read_questions_from_csv(tmp_path):
+    path = tmp_path / "questions.csv"
+    path.write_text("id,question,category\n,AI 반도체,tech\nq2,,\n", encoding="utf-8")
+    assert list(read_questions(str(path))) == [
+        {"id": "1", "query": "AI 반도체", "metadata": {"category": "tech"}}
+    ]
+
+
+def test_load_completed_skips_failures_and_truncated_lines(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text(
+        '{"id": "1", "ok": true}\n'
+        '{"id": "2", "ok": false, "error": "boom"}\n'
+        '{"id": "3", "ok": true}\n'
+        '{"id": "4", "o',
+        encoding="utf-8",
+    )
+    assert load_completed(str(path)) == {"1", "3"}
+    assert load_completed(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_resumed_run_appends_only_unfinished_questions(tmp_path):
+    path = tmp_path / "results.jsonl"
+    questions = [
+        {"id": str(number), "query": query, "metadata": {}}
+        for number, query in enumerate(["AI", "실패", "반도체"], 1)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        asyncio.run(run_batch(FakeChatbot(), questions, f, 1))
+    completed = load_completed(str(path))
+    assert completed == {"1", "3"}
+
+    remaining = [item for item in questions if item["id"] not in completed]
+    with open(path, "a", encoding="utf-8") as f:
+        results = asyncio.run(run_batch(FakeChatbot(), remaining, f, 1))
+    assert len(results) == 1
+    with open(path, encoding="utf-8") as f:
+        ids = [json.loads(line)["id"] for line in f]
+    assert ids == ["1", "2", "3", "2"]
@@ -0,0 +1,67 @@
+from chat_session import ChatSession
+
+
+def session_with_messages(count, window=4, max_messages=100):
+    session = ChatSession(max_messages=max_messages, window=window)
+    for number in range(count):
+        session.add_user_message(f"질문 {number}")
+    return session
+
+
+def contents(messages):
+    return [message["content"] for message in messages]
+
+
+def test_recent_messages_show_only_the_window():
+    session = session_with_messages(10)
+    assert contents(session.recent_messages()) == [f"질문 {n}" for n in range(6, 10)]
+    assert session.hidden_count == 6
+
+
+def test_older_messages_page_from_newest():
+    session = session_with_messages(10)
+    assert session.page_count() == 2
+    assert contents(session.older_messages(1)) == [f"질문 {n}" for n in range(2, 6)]
+    # 마지막 페이지는 남은 메시지만 담음
+    assert contents(session.older_messages(2)) == ["질문 0", "질문 1"]
+    assert session.older_messages(3) == []
+
+
+def test_pages_cover_every_hidden_message_once():
+    session = session_with_messages(23, window=5)
+    pages = [
+        session.older_messages(page, page_size=3)
+        for page in range(1, session.page_count(page_size=3) + 1)
+    ]
+    shown = [message for page in reversed(pages) for message in page]
+    assert contents(shown) == [f"질문 {n}" for n in range(18)]
+
+
+def test_short_history_has_no_pages():
+    session = session_with_messages(3)
+    assert session.hidden_count == 0
+    assert session.page_count() == 0
+    assert session.older_messages(1) == []
+
+
+def test_history_is_bounded_to_max_messages():
+    session = session_with_messages(12, window=4, max_messages=8)
+    assert len(session.messages) == 8
+    assert contents(session.older_messages(1)) == [f"질문 {n}" for n in range(4, 8)]
+    assert session.page_count() == 1
+
+
+def test_assistant_articles_keep_preview_fields_only():
+    session = ChatSession(max_messages=10, window=4)
+    article = {"id": "a1", "title": "AI 반도체", "content": "본문 " * 1000}
+    session.add_assistant_message("답변", [article])
+    assert session.messages[-1]["articles"] == [{"id": "a1", "title": "AI 반도체"}]
+    assert session.recent_articles[-1] == {"id": "a1", "title": "AI 반도체"}
+
+
+def test_recent_queries_are_unique_and_newest_first():
+    session = ChatSession(max_messages=10, window=4)
+    for query in ("a", "b", "a", "c"):
+        session.add_user_message(query)
+    assert session.recent_queries() == ["c", "a", "b"]
+    assert session.query_count == 4
@@ -0,0 +1,80 @@
+import pytest
+import requests
+
+import chrawling_mongoDB
+from article_enrichment import ArticleEnricher
+from chrawling_mongoDB import ArticleCrawler
+from crawler_metrics import CrawlerMetrics
+
+LIST_HTML = """
+<div class="view-cont"><a href="/news/articleView.html?idxno=1">
+<h4 class="titles">첫 번째 기사</h4></a></div>
+<div class="view-cont"><a href="/news/articleView.html?idxno=2">
+<h4 class="titles">두 번째 기사</h4></a></div>
+"""
+
+ARTICLE_HTML = """
+<article itemprop="articleBody"><p>AI 반도체 기사 본문입니다.</p></article>
+"""
+
+
+class FakeResponse:
+    def __init__(self, text, status=200):
+        self.text = text
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status} Error")
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = []
+
+    def find_one(self, query, projection=None, sort=None):
+        for document in self.documents:
+            if all(document.get(key) == value for key, value in query.items()):
+                return document
+        return None
+
+    def insert_one(self, document):
+        self.documents.append(document)
+
+    def update_one(self, query, update):
+        self.find_one(query).update(update["$set"])
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    monkeypatch.setattr(chrawling_mongoDB.time, "sleep", lambda seconds: None)
+    metrics = CrawlerMetrics(
+        str(tmp_path / "metrics.json"), str(tmp_path / "metrics.prom")
+    )
+    return ArticleCrawler(FakeCollection(), metrics, ArticleEnricher())
+
+
+def test_failed_article_is_counted_and_rest_of_page_is_saved(crawler, monkeypatch):
+    def get(url, headers=None):
+        if "articleList" in url:
+            return FakeResponse(LIST_HTML)
+        if "idxno=1" in url:
+            return FakeResponse("", status=500)
+        return FakeResponse(ARTICLE_HTML)
+
+    monkeypatch.setattr(chrawling_mongoDB.requests, "get", get)
+    assert crawler.crawl_page(1) is True
+    assert crawler.metrics.counters["article_errors"] == 1
+    assert crawler.metrics.counters["articles_saved"] == 1
+    assert crawler.metrics.errors["fetch_article"] == 1
+    assert [doc["title"] for doc in crawler.collection.documents] == ["두 번째 기사"]
+
+
+def test_failed_list_page_is_counted(crawler, monkeypatch):
+    def get(url, headers=None):
+        raise requests.exceptions.ConnectionError("connection refused")
+
+    monkeypatch.setattr(chrawling_mongoDB.requests, "get", get)
+    assert crawler.crawl_page(1) is False
+    assert crawler.metrics.counters["page_errors"] == 1
+    assert crawler.metrics.counters["pages"] == 0
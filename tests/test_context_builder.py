@@ -0,0 +1,100 @@
+from context_builder import ContextBuilder, estimate_tokens, split_passages
+
+FILLER = [
+    "정부가 새 예산안을 국회에 제출했다.",
+    "지역 축제에 많은 관광객이 몰렸다.",
+    "주말 날씨는 대체로 맑을 전망이다.",
+    "프로야구 시즌이 다음 달 개막한다.",
+]
+
+
+def article(title, sentences, summary=None):
+    doc = {
+        "title": title,
+        "published_date": "2024-12-20",
+        "content": " ".join(sentences),
+    }
+    if summary:
+        doc["summary"] = summary
+    return doc
+
+
+def passages_of(text):
+    return [line[2:] for line in text.splitlines() if line.startswith("- ")]
+
+
+def test_split_passages_respects_sentence_boundaries():
+    text = " ".join(FILLER)
+    passages = split_passages(text, max_chars=40)
+    assert " ".join(passages) == text
+    assert all(len(passage) <= 40 for passage in passages)
+
+
+def test_selects_passages_matching_the_question():
+    # 머리글과 패시지 하나만 들어가는 예산
+    builder = ContextBuilder(token_budget=30, passage_chars=40)
+    articles = [
+        article("경제 소식", FILLER[:2] + ["삼성전자가 AI 반도체 양산을 시작했다."])
+    ]
+    context = builder.build("AI 반도체 양산", articles)
+    assert passages_of(context["text"]) == ["삼성전자가 AI 반도체 양산을 시작했다."]
+
+
+def test_stays_within_token_budget():
+    articles = [
+        article(f"기사 {n}", [f"AI 반도체 소식 {n}-{i}입니다." for i in range(10)])
+        for n in range(5)
+    ]
+    for budget in (40, 120, 400):
+        builder = ContextBuilder(token_budget=budget, passage_chars=40)
+        context = builder.build("AI 반도체", articles)
+        used = sum(
+            estimate_tokens(section.split("\n")[0])
+            + sum(estimate_tokens(f"- {p}") for p in passages_of(section))
+            for section in context["text"].split("\n\n")
+        )
+        assert 0 < used <= budget
+        assert context["tokens"] == estimate_tokens(context["text"])
+
+
+def test_limits_passages_per_article_and_keeps_original_order():
+    sentences = [f"AI 반도체 소식 {i}번째입니다." for i in range(8)]
+    builder = ContextBuilder(
+        token_budget=1000, passage_chars=30, max_passages_per_article=3
+    )
+    context = builder.build("AI 반도체", [article("반도체", sentences)])
+    selected = passages_of(context["text"])
+    assert context["passages"] == len(selected) == 3
+    assert selected == sorted(selected, key=sentences.index)
+
+
+def test_summarized_articles_use_summary_and_one_matching_passage():
+    articles = [
+        article(
+            "요약 있는 기사",
+            FILLER + ["삼성전자가 AI 반도체를 공개했다."],
+            summary="삼성전자가 새 반도체를 발표했다.",
+        ),
+        article(
+            "요약 있는 다른 기사",
+            ["SK하이닉스도 AI 반도체 투자를 늘린다."] + FILLER,
+            summary="SK하이닉스가 투자 계획을 밝혔다.",
+        ),
+    ]
+    context = ContextBuilder(token_budget=1000, passage_chars=40).build(
+        "AI 반도체", articles
+    )
+    assert context["articles"] == 2
+    assert context["passages"] == 1
+    assert "요약: 삼성전자가 새 반도체를 발표했다." in context["text"]
+    assert "요약: SK하이닉스가 투자 계획을 밝혔다." in context["text"]
+    assert not any(filler in context["text"] for filler in FILLER)
+
+
+def test_no_articles_builds_empty_context():
+    assert ContextBuilder().build("AI 반도체", []) == {
+        "text": "",
+        "tokens": 0,
+        "passages": 0,
+        "articles": 0,
+    }
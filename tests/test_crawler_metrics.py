@@ -0,0 +1,99 @@
+import json
+import re
+
+import pytest
+
+from crawler_metrics import CrawlerMetrics
+
+SAMPLE = re.compile(r'^(\w+)(?:\{((?:\w+="[^"]*",?)*)\})? (\S+)$')
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    return CrawlerMetrics(
+        str(tmp_path / "metrics.json"), str(tmp_path / "metrics.prom")
+    )
+
+
+def parse_samples(text):
+    """Prometheus 텍스트에서 (이름, 레이블 dict, 값) 목록과 TYPE 선언을 추출"""
+    samples, types = [], {}
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            types[name] = kind
+            continue
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, f"형식이 올바르지 않은 줄: {line}"
+        name, labels, value = match.groups()
+        labels = dict(re.findall(r'(\w+)="([^"]*)"', labels or ""))
+        samples.append((name, labels, float(value)))
+    return samples, types
+
+
+def test_prometheus_histogram_buckets_are_cumulative(metrics):
+    for seconds in (0.003, 0.02, 0.2, 3.0, 30.0):
+        metrics.histograms["fetch_article"].observe(seconds)
+
+    samples, types = parse_samples(metrics.to_prometheus())
+    assert types["newsbot_crawler_stage_duration_seconds"] == "histogram"
+    buckets = [
+        (labels["le"], value)
+        for name, labels, value in samples
+        if name == "newsbot_crawler_stage_duration_seconds_bucket"
+        and labels["stage"] == "fetch_article"
+    ]
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    assert buckets[-1] == ("+Inf", 5)
+    assert dict(buckets)["0.005"] == 1 and dict(buckets)["5.0"] == 4
+
+    values = {
+        name: value
+        for name, labels, value in samples
+        if labels.get("stage") == "fetch_article" and "le" not in labels
+    }
+    assert values["newsbot_crawler_stage_duration_seconds_count"] == 5
+    assert values["newsbot_crawler_stage_duration_seconds_sum"] == pytest.approx(33.223)
+
+
+def test_prometheus_counters_include_errors_and_events(metrics):
+    with pytest.raises(ValueError):
+        with metrics.time("parse_list"):
+            raise ValueError("bad html")
+    metrics.inc("pages", 3)
+    metrics.inc("article_errors")
+
+    text = metrics.to_prometheus()
+    assert text.endswith("\n")
+    samples, types = parse_samples(text)
+    assert types["newsbot_crawler_stage_errors_total"] == "counter"
+    assert types["newsbot_crawler_events_total"] == "counter"
+    assert ("newsbot_crawler_stage_errors_total", {"stage": "parse_list"}, 1) in samples
+    assert ("newsbot_crawler_events_total", {"event": "pages"}, 3) in samples
+    assert ("newsbot_crawler_events_total", {"event": "article_errors"}, 1) in samples
+    # 선언된 지표 이름(히스토그램은 접미사 제외)으로만 값을 내보냄
+    for name, _, _ in samples:
+        assert re.sub(r"_(bucket|sum|count)$", "", name) in types
+
+
+def test_write_records_summary_files(metrics):
+    metrics.histograms["fetch_list"].observe(0.1)
+    metrics.inc("pages")
+    summary = metrics.write()
+
+    with open(metrics.json_path, encoding="utf-8") as f:
+        assert json.load(f)["counters"]["pages"] == 1
+    with open(metrics.prometheus_path, encoding="utf-8") as f:
+        assert f.read() == metrics.to_prometheus(summary)
+
+
+def test_slowdown_against_previous_run_is_warned(metrics):
+    metrics.histograms["fetch_list"].observe(0.1)
+    metrics.write()
+
+    later = CrawlerMetrics(metrics.json_path, metrics.prometheus_path)
+    later.histograms["fetch_list"].observe(0.5)
+    assert any("fetch_list" in warning for warning in later.summary()["warnings"])
@@ -0,0 +1,19 @@
+import statistics
+
+from latency_stats import percentile
+
+
+def test_percentile_interpolates_linearly():
+    values = [5, 1, 9, 3, 7]
+    assert percentile(values, 50) == 5
+    assert percentile(values, 0) == 1
+    assert percentile(values, 100) == 9
+    assert (
+        percentile(values, 95)
+        == statistics.quantiles(values, n=100, method="inclusive")[94]
+    )
+
+
+def test_percentile_of_small_inputs():
+    assert percentile([], 95) == 0.0
+    assert percentile([42.0], 95) == 42.0
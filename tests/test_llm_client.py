@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+import pytest
+
+from llm_client import AsyncLLMClient
+
+
+class BlockingProvider:
+    """release가 설정될 때까지 스레드를 막는 백엔드"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def generate(self, prompt):
+        self.release.wait(5)
+        return f"답변:{prompt}"
+
+    def stream(self, prompt):
+        yield "첫 조각"
+        self.release.wait(5)
+        yield "둘째 조각"
+
+
+async def wait_until(condition, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("조건을 만족하지 않았습니다.")
+
+
+def test_timed_out_call_holds_slot_until_thread_finishes():
+    provider = BlockingProvider()
+    client = AsyncLLMClient(provider, max_concurrency=1, timeout=0.05)
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await client.generate("a")
+        semaphore = client._get_semaphore()
+        # 스레드가 아직 실행 중이므로 슬롯을 반납하지 않음
+        assert semaphore.locked()
+        provider.release.set()
+        await wait_until(lambda: not semaphore.locked())
+        assert await client.generate("b", timeout=1) == "답변:b"
+
+    asyncio.run(main())
+
+
+def test_closed_stream_holds_slot_until_producer_finishes():
+    provider = BlockingProvider()
+    client = AsyncLLMClient(provider, max_concurrency=1, timeout=1)
+
+    async def main():
+        chunks = client.stream("a")
+        assert await chunks.__anext__() == "첫 조각"
+        await chunks.aclose()
+        semaphore = client._get_semaphore()
+        assert semaphore.locked()
+        provider.release.set()
+        await wait_until(lambda: not semaphore.locked())
+
+    asyncio.run(main())
+
+
+def test_executor_is_sized_apart_from_concurrency(monkeypatch):
+    monkeypatch.delenv("LLM_EXECUTOR_WORKERS", raising=False)
+    monkeypatch.delenv("LLM_HEDGE_AFTER_SECONDS", raising=False)
+    assert AsyncLLMClient(None, max_concurrency=4).executor_workers == 8
+
+    monkeypatch.setenv("LLM_HEDGE_AFTER_SECONDS", "2")
+    assert AsyncLLMClient(None, max_concurrency=4).executor_workers == 12
+
+    monkeypatch.setenv("LLM_EXECUTOR_WORKERS", "5")
+    assert AsyncLLMClient(None, max_concurrency=4).executor_workers == 5
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mongo_indexes import now_kst, to_datetime
+
+
+def test_naive_values_are_kept_as_korean_time():
+    assert to_datetime("2025-03-01T09:30:00") == datetime(2025, 3, 1, 9, 30)
+    assert to_datetime(datetime(2025, 3, 1, 9, 30)) == datetime(2025, 3, 1, 9, 30)
+
+
+def test_aware_values_are_converted_to_naive_korean_time():
+    expected = datetime(2025, 3, 1, 18, 30)
+    assert to_datetime("2025-03-01T09:30:00Z") == expected
+    assert to_datetime("2025-03-01T09:30:00+00:00") == expected
+    assert to_datetime("2025-03-01T18:30:00+09:00") == expected
+    aware = datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc)
+    assert to_datetime(aware) == expected
+    assert to_datetime(aware).tzinfo is None
+
+
+def test_empty_and_invalid_values():
+    assert to_datetime(None) is None
+    assert to_datetime("  ") is None
+    with pytest.raises(ValueError):
+        to_datetime("어제")
+
+
+def test_now_kst_is_naive_korean_time():
+    expected = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=9)
+    now = now_kst()
+    assert now.tzinfo is None
+    assert abs(now - expected) < timedelta(seconds=5)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from tracing import tracer
+
+
+@pytest.fixture
+def chatbot(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+    monkeypatch.setenv("NEWSBOT_BACKEND", "local")
+    monkeypatch.setenv("FAKE_LLM_LATENCY_SECONDS", "0")
+    monkeypatch.setenv("FAKE_LLM_CHARS_PER_SECOND", "1000000")
+    monkeypatch.setenv("LOCAL_SEARCH_LATENCY_SECONDS", "0")
+    monkeypatch.setenv("RESPONSE_CACHE_PATH", str(tmp_path / "response_cache.sqlite3"))
+    monkeypatch.setattr(tracer, "path", str(tmp_path / "traces.jsonl"))
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    from query_action import NewsChatbot
+
+    return NewsChatbot()
+
+
+def exported_root_spans():
+    """파일로 내보낸 루트 스팬 목록 (스팬이 끝난 시점의 속성 그대로)"""
+    with open(tracer.path, encoding="utf-8") as f:
+        spans = [json.loads(line) for line in f]
+    return [span for span in spans if span["parentSpanId"] is None]
+
+
+def last_root_span():
+    return exported_root_spans()[-1]
+
+
+def test_process_query_records_root_span(chatbot):
+    stats = {}
+    article, _, _, response = asyncio.run(chatbot.process_query("AI 반도체", stats))
+    assert article is not None and response
+
+    root = last_root_span()
+    assert root["traceId"] == stats["trace_id"]
+    assert root["status"]["code"] == "OK"
+    assert root["attributes"]["cache_hit"] is False
+    assert root["attributes"]["total_ms"] == stats["timings"]["total"]
+
+
+def test_failed_query_records_attributes_and_error(chatbot, monkeypatch):
+    async def fail(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(chatbot, "_run_query", fail)
+    stats = {}
+    _, _, _, response = asyncio.run(chatbot.process_query("AI 반도체", stats))
+    assert response == "처리 중 오류가 발생했습니다."
+
+    # 루트 스팬은 한 번만 종료되어 트레이스도 한 번만 기록
+    (root,) = exported_root_spans()
+    assert root["status"] == {"code": "ERROR", "message": "RuntimeError: boom"}
+    assert root["attributes"]["total_ms"] == stats["timings"]["total"]
+    assert "cache_hit" in root["attributes"]
+
+
+def test_stream_query_ends_root_span_after_stream(chatbot):
+    async def main():
+        stats = {}
+        _, _, _, chunks = await chatbot.stream_query("AI 반도체", stats)
+        # 답변 스트림을 다 받기 전에는 루트 스팬이 끝나지 않아 아직 내보내지 않음
+        assert not os.path.exists(tracer.path)
+        return stats, "".join([chunk async for chunk in chunks])
+
+    stats, response = asyncio.run(main())
+    assert response
+    root = last_root_span()
+    assert root["traceId"] == stats["trace_id"]
+    assert root["attributes"]["total_ms"] == stats["timings"]["total"]
+    assert "generate" in stats["timings"]
+
+
+def test_failed_stream_setup_records_attributes_and_error(chatbot, monkeypatch):
+    async def fail(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(chatbot, "_prepare_stream", fail)
+    stats = {}
+    with pytest.raises(RuntimeError):
+        asyncio.run(chatbot._stream_query("AI 반도체", stats))
+
+    (root,) = exported_root_spans()
+    assert root["status"]["code"] == "ERROR"
+    assert root["attributes"]["total_ms"] == stats["timings"]["total"]
+
+
+def test_generated_prompt_includes_question(chatbot, monkeypatch):
+    provider = chatbot.response_gen.provider
+    prompts = []
+    generate = provider.generate
+
+    def recording_generate(prompt):
+        prompts.append(prompt)
+        return generate(prompt)
+
+    monkeypatch.setattr(provider, "generate", recording_generate)
+    asyncio.run(chatbot.process_query("AI 반도체 투자 현황", {}))
+    assert prompts and "질문: AI 반도체 투자 현황" in prompts[0]
+
+
+@pytest.mark.parametrize("min_relevance", [0.0, 1.1])
+def test_prompts_include_question_for_every_template(chatbot, min_relevance):
+    response_gen = chatbot.response_gen
+    response_gen.min_relevance = min_relevance
+    articles = asyncio.run(chatbot.db_search.semantic_search("AI 반도체"))
+    assert articles
+
+    query = "AI 반도체 투자 현황"
+    for found in (articles, []):
+        *_, prompt = response_gen.build_prompt(query, found, "질문 유형: 사실 확인")
+        assert f"질문: {query}" in prompt
+
+
+def test_es_documents_carry_korean_time_offset():
+    from query_action import DatabaseSearch
+
+    doc = DatabaseSearch._build_es_document(
+        {
+            "title": "AI 반도체",
+            "published_date": datetime(2024, 12, 20, 23, 30),
+            "crawled_date": "2024-12-21T00:10:00",
+        }
+    )
+    assert doc["published_date"].isoformat() == "2024-12-20T23:30:00+09:00"
+    assert doc["crawled_date"].isoformat() == "2024-12-21T00:10:00+09:00"
+
+
+def test_corpus_analytics_buckets_days_in_korean_time():
+    from query_action import DatabaseSearch
+
+    class FakeES:
+        def search(self, index, body):
+            self.body = body
+            return {
+                "hits": {"total": {"value": 3}},
+                "aggregations": {
+                    "categories": {"buckets": [{"key": "AI", "doc_count": 3}]},
+                    "published_per_day": {
+                        "buckets": [
+                            {"key_as_string": "2024-12-20", "doc_count": 1},
+                            {"key_as_string": "2024-12-21", "doc_count": 2},
+                        ]
+                    },
+                    "word_count": {"count": 3, "min": 10, "max": 30, "avg": 20},
+                },
+            }
+
+    search = DatabaseSearch(use_mongodb=False)
+    search._es = FakeES()
+    analytics = search.get_corpus_analytics()
+    histogram = search._es.body["aggs"]["published_per_day"]["date_histogram"]
+    assert histogram["time_zone"] == "+09:00"
+    assert analytics["latest_published_date"] == "2024-12-21"
+    assert analytics["published_per_day"] == {"2024-12-20": 1, "2024-12-21": 2}
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from query_service import QueryRejected, QueryService
+
+
+def make_service(delay=0.05, max_workers=1, max_queue=8):
+    calls = []
+
+    async def execute(query, stats):
+        calls.append(query)
+        stats["timings"] = {"search": 1.0}
+        await asyncio.sleep(delay)
+        return f"answer:{query}"
+
+    async def execute_stream(query, stats):
+        calls.append(query)
+        await asyncio.sleep(delay)
+
+        async def chunks():
+            for part in ("가", "나", "다"):
+                await asyncio.sleep(0.01)
+                yield part
+
+        return {"title": query}, [], 0.9, chunks()
+
+    service = QueryService(execute, execute_stream, max_workers, max_queue)
+    return service, calls
+
+
+def test_identical_queries_share_one_execution():
+    service, calls = make_service()
+
+    async def main():
+        return await asyncio.gather(*(service.run("AI 반도체") for _ in range(3)))
+
+    assert asyncio.run(main()) == ["answer:AI 반도체"] * 3
+    assert calls == ["AI 반도체"]
+    assert service.stats()["executed"] == 1
+    assert service.stats()["coalesced"] == 2
+
+
+def test_queued_duplicates_coalesce_while_leader_waits_for_slot():
+    service, calls = make_service(max_workers=1)
+
+    async def main():
+        return await asyncio.gather(
+            service.run("a"), *(service.run("b") for _ in range(3))
+        )
+
+    assert asyncio.run(main()) == ["answer:a"] + ["answer:b"] * 3
+    assert calls == ["a", "b"]
+    stats = service.stats()
+    assert (stats["executed"], stats["coalesced"]) == (2, 2)
+    assert (stats["running"], stats["queued"]) == (0, 0)
+
+
+def test_normalized_queries_are_coalesced():
+    service, calls = make_service()
+
+    async def main():
+        await asyncio.gather(service.run("AI 반도체?"), service.run("ai  반도체"))
+
+    asyncio.run(main())
+    assert len(calls) == 1
+
+
+def test_follower_receives_leader_stats():
+    service, _ = make_service()
+    leader_stats, follower_stats = {}, {}
+
+    async def main():
+        await asyncio.gather(
+            service.run("q", leader_stats), service.run("q", follower_stats)
+        )
+
+    asyncio.run(main())
+    assert follower_stats["timings"] == leader_stats["timings"]
+    assert follower_stats["coalesced"] is True
+    assert "coalesced" not in leader_stats
+
+
+def test_rejects_when_queue_is_full():
+    service, _ = make_service(max_workers=1, max_queue=1)
+
+    async def main():
+        running = asyncio.ensure_future(service.run("a"))
+        queued = asyncio.ensure_future(service.run("b"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(QueryRejected):
+            await service.run("c")
+        # 대기 중인 질문과 같은 질문은 거절하지 않고 함께 기다림
+        assert await service.run("b") == "answer:b"
+        await asyncio.gather(running, queued)
+
+    asyncio.run(main())
+    assert service.stats()["rejected"] == 1
+
+
+def test_cancelled_follower_does_not_cancel_leader():
+    service, calls = make_service()
+
+    async def main():
+        leader = asyncio.ensure_future(service.run("q"))
+        follower = asyncio.ensure_future(service.run("q"))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader
+
+    assert asyncio.run(main()) == "answer:q"
+    assert calls == ["q"]
+
+
+def test_stream_subscribers_share_chunks():
+    service, calls = make_service(max_workers=1)
+
+    async def consume(query):
+        article, _, relevance, chunks = await service.stream(query)
+        return article["title"], relevance, [chunk async for chunk in chunks]
+
+    async def main():
+        return await asyncio.gather(consume("a"), consume("b"), consume("b"))
+
+    results = asyncio.run(main())
+    assert results[1] == results[2] == ("b", 0.9, ["가", "나", "다"])
+    assert calls == ["a", "b"]
+    assert service.stats()["coalesced"] == 1
+
+
+def test_failed_execution_releases_slot():
+    async def execute(query, stats):
+        raise RuntimeError("boom")
+
+    service = QueryService(execute, None, max_workers=1, max_queue=1)
+
+    async def main():
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await service.run("q")
+
+    asyncio.run(main())
+    assert service.stats()["running"] == 0
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import chrawling_mongoDB
+from query_action import DatabaseSearch
+from refresh_daemon import RefreshDaemon, load_refresh_status, run_lock
+
+T0 = datetime(2024, 12, 20, 9, 0)
+CRAWL_SUMMARY = {"counters": {"articles_saved": 1, "pages": 1}, "warnings": []}
+
+
+class FakeSearch:
+    """sync_changed_articles 호출 인자를 기록하고 정해진 결과를 돌려주는 가짜 검색"""
+
+    mongo_collection = None
+
+    def __init__(self):
+        self.calls = []
+        self.results = []
+
+    def sync_changed_articles(self, since=None):
+        self.calls.append(since)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        chrawling_mongoDB, "crawl", lambda *args, **kwargs: CRAWL_SUMMARY
+    )
+    daemon = RefreshDaemon(
+        interval=600,
+        jitter=0,
+        overlap=300,
+        status_path=str(tmp_path / "status.json"),
+        lock_path=str(tmp_path / "refresh.lock"),
+    )
+    daemon._db_search = FakeSearch()
+    return daemon
+
+
+def test_watermark_advances_with_overlap(daemon):
+    search = daemon._db_search
+    search.results = [(3, 0, T0), (1, 0, T0 + timedelta(minutes=10))]
+
+    assert daemon.run_once() is True
+    assert search.calls == [None]
+    assert daemon.status["watermark"] == T0.isoformat()
+
+    daemon.run_once()
+    assert search.calls[1] == T0 - timedelta(seconds=300)
+    assert daemon.status["watermark"] == (T0 + timedelta(minutes=10)).isoformat()
+    assert daemon.status["last_run"]["indexed"] == 1
+
+
+def test_watermark_does_not_move_back_without_new_articles(daemon):
+    search = daemon._db_search
+    # 새 기사가 없거나 색인에 실패하면 overlap만큼 당겨진 since가 그대로 돌아옴
+    search.results = [(1, 0, T0), (0, 0, T0 - timedelta(seconds=300))]
+    daemon.run_once()
+    daemon.run_once()
+    assert daemon.status["watermark"] == T0.isoformat()
+
+
+def test_failed_sync_keeps_watermark_and_counts_failures(daemon):
+    search = daemon._db_search
+    search.results = [(1, 0, T0), ConnectionError("es down"), ConnectionError("es")]
+    daemon.run_once()
+    daemon.run_once()
+    daemon.run_once()
+
+    status = load_refresh_status(daemon.status_path)
+    assert status["watermark"] == T0.isoformat()
+    assert status["consecutive_failures"] == 2
+    assert status["last_error"] == "ConnectionError: es"
+    assert status["state"] == "idle"
+
+
+def test_watermark_survives_restart(daemon):
+    daemon._db_search.results = [(1, 0, T0)]
+    daemon.run_once()
+
+    restarted = RefreshDaemon(
+        status_path=daemon.status_path, lock_path=daemon.lock_path, overlap=60
+    )
+    restarted._db_search = FakeSearch()
+    restarted._db_search.results = [(0, 0, T0 - timedelta(seconds=60))]
+    restarted.run_once()
+    assert restarted._db_search.calls == [T0 - timedelta(seconds=60)]
+
+
+def test_run_is_skipped_while_lock_is_held(daemon):
+    with run_lock(daemon.lock_path) as acquired:
+        assert acquired
+        assert daemon.run_once() is False
+    assert daemon._db_search.calls == []
+
+
+class FakeCursor(list):
+    def sort(self, field, direction):
+        return sorted(self, key=lambda doc: doc[field])
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query):
+        self.queries.append(query)
+        since = query.get("crawled_date", {}).get("$gte")
+        return FakeCursor(
+            doc for doc in self.docs if since is None or doc["crawled_date"] >= since
+        )
+
+
+class FakeIndices:
+    def refresh(self, index):
+        pass
+
+
+class FakeES:
+    indices = FakeIndices()
+
+
+class SyncSearch(DatabaseSearch):
+    """Mongo 조회와 색인만 가짜로 바꾼 DatabaseSearch"""
+
+    # 지연 생성 속성 대신 가짜 클라이언트를 쓰도록 덮어씀
+    mongo_collection = None
+    es = None
+
+    def __init__(self, docs, failed_ids=()):
+        super().__init__(use_mongodb=False)
+        self.mongo_collection = FakeCollection(docs)
+        self.es = FakeES()
+        self.failed_ids = set(failed_ids)
+
+    def create_es_index(self, recreate=True):
+        pass
+
+    def index_documents(self, docs, refresh=True):
+        errors = [doc["_id"] for doc in docs if doc["_id"] in self.failed_ids]
+        return len(docs) - len(errors), errors
+
+
+def test_sync_returns_latest_crawled_date_as_watermark():
+    docs = [
+        {"_id": "b", "crawled_date": T0 + timedelta(minutes=5)},
+        {"_id": "a", "crawled_date": T0},
+    ]
+    search = SyncSearch(docs)
+    assert search.sync_changed_articles(T0 - timedelta(minutes=1), batch_size=1) == (
+        2,
+        0,
+        T0 + timedelta(minutes=5),
+    )
+    assert search.mongo_collection.queries == [
+        {"crawled_date": {"$gte": T0 - timedelta(minutes=1)}}
+    ]
+
+
+def test_sync_failure_keeps_previous_watermark():
+    docs = [{"_id": "a", "crawled_date": T0}, {"_id": "b", "crawled_date": T0}]
+    since = T0 - timedelta(minutes=1)
+    assert SyncSearch(docs, failed_ids={"b"}).sync_changed_articles(since) == (
+        1,
+        1,
+        since,
+    )
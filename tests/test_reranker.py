@@ -0,0 +1,65 @@
+from reranker import Reranker
+
+QUERY = "AI 반도체 시장 전망은?"
+
+
+def article(title, content, score=1.0):
+    return {"title": title, "content": content, "score": score}
+
+
+def test_relevance_is_normalized_to_unit_range():
+    articles = [
+        article("AI 반도체 시장 전망", "AI 반도체 시장 전망이 밝다. " * 30, 12.0),
+        article("반도체 업계 소식", "반도체 업황이 회복세다.", 8.0),
+        article("지역 축제 개막", "주말 축제에 관광객이 몰렸다.", 5.0),
+    ]
+    ranked = Reranker()._rank(QUERY, articles)
+    assert all(0.0 <= item["relevance"] <= 1.0 for item in ranked)
+    assert ranked[0]["relevance"] > 0.5
+
+
+def test_orders_by_question_terms_over_es_score():
+    articles = [
+        article("지역 축제 개막", "주말 축제에 관광객이 몰렸다.", 20.0),
+        article("반도체 업계 소식", "반도체 업황이 회복세다.", 10.0),
+        article("AI 반도체 시장 전망", "AI 반도체 시장이 커진다는 전망이다.", 1.0),
+    ]
+    ranked = Reranker()._rank(QUERY, articles)
+    assert [item["title"] for item in ranked] == [
+        "AI 반도체 시장 전망",
+        "반도체 업계 소식",
+        "지역 축제 개막",
+    ]
+    # 질의어가 전혀 없는 기사는 ES 점수와 상관없이 0
+    assert ranked[-1]["relevance"] == 0.0
+
+
+def test_es_score_breaks_ties_and_order_is_stable():
+    content = "AI 반도체 시장 전망을 다룬 기사다."
+    articles = [
+        article("첫 번째", content, 1.0),
+        article("두 번째", content, 3.0),
+        article("세 번째", content, 3.0),
+    ]
+    ranked = Reranker()._rank(QUERY, articles)
+    assert [item["title"] for item in ranked] == ["두 번째", "세 번째", "첫 번째"]
+    assert ranked[0]["relevance"] == ranked[1]["relevance"] > ranked[2]["relevance"]
+
+
+def test_without_question_terms_every_article_scores_zero():
+    articles = [
+        article("AI 반도체", "AI 반도체 기사", 2.0),
+        article("축제", "축제", 1.0),
+    ]
+    ranked = Reranker()._rank("?", articles)
+    assert [item["relevance"] for item in ranked] == [0.0, 0.0]
+    assert [item["title"] for item in ranked] == ["AI 반도체", "축제"]
+
+
+def test_rerank_returns_copies_and_records_timing():
+    articles = [article("AI 반도체 시장", "AI 반도체 시장 전망")]
+    stats = {}
+    ranked = Reranker().rerank(QUERY, articles, stats)
+    assert "relevance" in ranked[0] and "relevance" not in articles[0]
+    assert "rerank" in stats["timings"]
+    assert Reranker().rerank(QUERY, []) == []
@@ -0,0 +1,107 @@
+import asyncio
+import types
+
+import pytest
+
+import resilience
+from resilience import CircuitBreaker, CircuitOpenError, Deadline, Upstream
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """resilience 모듈이 보는 time.monotonic을 직접 움직이는 가짜 시계"""
+    now = types.SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        resilience, "time", types.SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=10)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow()
+    # 성공하면 연속 실패 수를 다시 셈
+    breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_allows_one_trial_after_reset_timeout(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.value += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # 시험 호출이 실패하면 다시 차단
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.value += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+
+def test_breaker_retries_trial_when_result_never_arrives(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    clock.value += 10
+    assert breaker.allow()
+    clock.value += 10
+    assert breaker.allow()
+
+
+def test_deadline_caps_stage_timeouts(clock):
+    deadline = Deadline(budget_seconds=5)
+    assert deadline.timeout(2) == 2
+    assert deadline.timeout() == 5
+    clock.value += 4
+    assert deadline.timeout(2) == 1
+    assert not deadline.expired
+    clock.value += 1
+    assert deadline.expired
+    with pytest.raises(TimeoutError):
+        deadline.timeout(2)
+
+
+def make_upstream(hedge_after=None, failure_threshold=2):
+    breaker = CircuitBreaker("test", failure_threshold, reset_timeout=60)
+    return Upstream("test", timeout=0.2, hedge_after=hedge_after, breaker=breaker)
+
+
+def test_upstream_timeout_counts_as_failure():
+    upstream = make_upstream(failure_threshold=2)
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                await upstream.call(slow, timeout=0.01)
+        with pytest.raises(CircuitOpenError):
+            await upstream.call(slow)
+
+    asyncio.run(main())
+
+
+def test_upstream_hedge_returns_first_success():
+    upstream = make_upstream(hedge_after=0.02)
+    calls = []
+
+    async def factory():
+        attempt = len(calls)
+        calls.append(attempt)
+        # 첫 호출만 느리게 응답
+        await asyncio.sleep(0.5 if attempt == 0 else 0)
+        return attempt
+
+    assert asyncio.run(upstream.call(factory)) == 1
+    assert len(calls) == 2
+    assert upstream.breaker.state == "closed"
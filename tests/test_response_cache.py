@@ -0,0 +1,97 @@
+import types
+
+import pytest
+
+import response_cache
+from response_cache import ResponseCache, normalize_query
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """response_cache 모듈이 보는 time.time을 직접 움직이는 가짜 시계"""
+    now = types.SimpleNamespace(value=1_700_000_000.0)
+    monkeypatch.setattr(
+        response_cache, "time", types.SimpleNamespace(time=lambda: now.value)
+    )
+    return now
+
+
+def article(article_id, title="제목"):
+    return {
+        "id": article_id,
+        "title": title,
+        "content": "본문",
+        "crawled_date": "2025-03-01",
+    }
+
+
+def make_cache(tmp_path, **kwargs):
+    return ResponseCache(path=str(tmp_path / "cache.sqlite3"), **kwargs)
+
+
+def store(cache, query, articles, response="답변"):
+    cache.set(query, articles, articles[0], articles[1:], 0.8, response)
+
+
+def test_normalize_query():
+    assert normalize_query("  AI  반도체? ") == normalize_query("ai 반도체")
+
+
+def test_hit_returns_articles_from_current_search(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    articles = [article(1), article(2)]
+    store(cache, "AI 반도체?", articles)
+
+    best, related, score, response = cache.get("ai 반도체", list(reversed(articles)))
+    assert (best["id"], [a["id"] for a in related], score, response) == (
+        1,
+        [2],
+        0.8,
+        "답변",
+    )
+    assert cache.stats()["hits"] == 1
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path, ttl_seconds=60)
+    articles = [article(1)]
+    store(cache, "질문", articles)
+    clock.value += 60
+    assert cache.get("질문", articles) is not None
+    clock.value += 1
+    assert cache.get("질문", articles) is None
+    assert cache.stats()["entries"] == 0
+    # 만료된 답변도 대체 답변용으로는 남지 않음 (항목이 삭제됨)
+    assert cache.latest_response("질문") is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    for query in ("a", "b"):
+        store(cache, query, [article(query)])
+        clock.value += 1
+    # a를 사용하면 가장 오래 사용되지 않은 항목은 b가 됨
+    assert cache.get("a", [article("a")]) is not None
+    clock.value += 1
+    store(cache, "c", [article("c")])
+
+    assert cache.get("b", [article("b")]) is None
+    assert cache.get("a", [article("a")]) is not None
+    assert cache.get("c", [article("c")]) is not None
+    assert cache.stats()["evicted"] == 1
+
+
+def test_changed_article_invalidates_entry(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    store(cache, "질문", [article(1)])
+    assert cache.get("질문", [article(1, title="수정된 제목")]) is None
+    assert cache.stats()["invalidated"] == 1
+
+
+def test_invalidate_articles(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    store(cache, "질문1", [article(1), article(2)])
+    store(cache, "질문2", [article(3)])
+    assert cache.invalidate_articles([2]) == 1
+    assert cache.get("질문1", [article(1), article(2)]) is None
+    assert cache.get("질문2", [article(3)]) is not None
@@ -0,0 +1,116 @@
+import pytest
+
+from review_policy import ReviewPolicy
+
+ARTICLE = {"title": "삼성전자, 차세대 AI 반도체 공개"}
+FACT_INTENT = "1. 질문 유형: 사실 확인\n2. 핵심 키워드: 삼성전자, 반도체"
+GROUNDED = (
+    "1. 핵심 답변: 삼성전자가 2024년 12월 차세대 AI 반도체를 공개했습니다.\n"
+    "2. 뉴스 근거: 기사에 따르면 데이터센터용 제품으로 내년부터 양산합니다.\n"
+    "3. 맥락 설명: 고대역폭 메모리 수요가 늘면서 반도체 업계의 경쟁이 "
+    "치열해지고 있으며, 이번 발표는 그 흐름에 대응하기 위한 것입니다."
+)
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [("always", (True, "mode_always")), ("never", (False, "mode_never"))],
+)
+def test_fixed_modes_ignore_the_response(mode, expected):
+    policy = ReviewPolicy(mode)
+    assert policy.decide("", FACT_INTENT, None, 0.0) == expected
+    assert policy.decide(GROUNDED, FACT_INTENT, ARTICLE, 0.9) == expected
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ReviewPolicy("sometimes")
+
+
+def test_adaptive_skips_grounded_complete_answer():
+    policy = ReviewPolicy("adaptive")
+    assert policy.decide(GROUNDED, FACT_INTENT, ARTICLE, 0.9) == (
+        False,
+        "heuristics_passed",
+    )
+
+
+@pytest.mark.parametrize(
+    "response, intent, article, relevance, reason",
+    [
+        ("짧은 답변", FACT_INTENT, ARTICLE, 0.9, "too_short"),
+        (
+            GROUNDED.replace("뉴스 근거", "근거"),
+            FACT_INTENT,
+            ARTICLE,
+            0.9,
+            "missing_sections",
+        ),
+        (GROUNDED, "1. 질문 유형: 비교 분석", ARTICLE, 0.9, "complex_intent"),
+        (
+            GROUNDED.replace("2024년 12월 ", ""),
+            "1. 질문 유형: 날짜 확인",
+            ARTICLE,
+            0.9,
+            "missing_date",
+        ),
+        (
+            GROUNDED + "\n직접 답변 정보 출처",
+            FACT_INTENT,
+            ARTICLE,
+            0.1,
+            "low_relevance",
+        ),
+        (
+            GROUNDED,
+            FACT_INTENT,
+            {"title": "카카오 클라우드 요금 개편"},
+            0.9,
+            "ungrounded",
+        ),
+    ],
+)
+def test_adaptive_reviews_when_a_heuristic_fails(
+    response, intent, article, relevance, reason
+):
+    policy = ReviewPolicy("adaptive")
+    assert policy.decide(response, intent, article, relevance) == (True, reason)
+
+
+def test_adaptive_relevance_threshold_selects_required_sections():
+    policy = ReviewPolicy("adaptive", min_relevance=0.5)
+    # 관련도가 기준 미만이면 하이브리드 형식의 항목을 요구
+    assert policy.decide(GROUNDED, FACT_INTENT, ARTICLE, 0.4) == (
+        True,
+        "missing_sections",
+    )
+    assert policy.decide(GROUNDED, FACT_INTENT, ARTICLE, 0.5) == (
+        False,
+        "heuristics_passed",
+    )
+
+
+def test_knowledge_answer_requires_limit_section():
+    policy = ReviewPolicy("adaptive")
+    knowledge = GROUNDED.replace("뉴스 근거", "한계 설명")
+    assert policy.decide(knowledge, FACT_INTENT, None, 0.0) == (
+        False,
+        "heuristics_passed",
+    )
+    assert policy.decide(GROUNDED, FACT_INTENT, None, 0.0) == (
+        True,
+        "missing_sections",
+    )
+
+
+def test_record_counts_decisions_by_reason():
+    policy = ReviewPolicy("adaptive")
+    policy.record(True, "too_short")
+    policy.record(True, "too_short")
+    policy.record(False, "heuristics_passed")
+    assert policy.stats() == {
+        "mode": "adaptive",
+        "reviewed": 2,
+        "skipped": 1,
+        "reasons": {"too_short": 2, "heuristics_passed": 1},
+    }
@@ -0,0 +1,41 @@
+from search_benchmark import compare_results, evaluate_relevance, measure_latency
+
+QUERIES = [
+    {"id": "q1", "query": "AI 반도체", "expected_urls": ["u1"]},
+    {"id": "q2", "query": "오류", "expected_urls": ["u2"]},
+]
+
+
+class FlakySearch:
+    """질의가 "오류"일 때만 검색 예외를 내는 가짜 검색"""
+
+    async def semantic_search(self, query, size=7, deadline=None, raise_errors=False):
+        if query == "오류":
+            if raise_errors:
+                raise ConnectionError("search unavailable")
+            return []
+        return [{"url": "u1"}]
+
+
+def test_failed_queries_are_reported_apart_from_relevance():
+    relevance = evaluate_relevance(FlakySearch(), QUERIES, k=5)
+    assert relevance["errors"] == 1
+    assert relevance["failed_queries"][0]["id"] == "q2"
+    assert relevance["recall_at_5"] == 1.0
+    assert [q["id"] for q in relevance["per_query"]] == ["q1"]
+
+
+def test_failed_requests_are_excluded_from_latency():
+    row = measure_latency(FlakySearch(), QUERIES, concurrency=2, iterations=3, k=5)
+    assert row["requests"] == 3
+    assert row["errors"] == 3
+
+
+def test_errors_are_regressions():
+    current = {
+        "relevance": evaluate_relevance(FlakySearch(), QUERIES, k=5),
+        "latency": [measure_latency(FlakySearch(), QUERIES, 1, 1, 5)],
+    }
+    baseline = {"relevance": {}, "latency": []}
+    regressions = compare_results(current, baseline, 0.2, 0.0)
+    assert len(regressions) == 2
@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+
+from latency_stats import percentile
+
+
+def load_spans(path, since_minutes=None):
+    """JSONL 트레이스 파일에서 스팬 로드 (since_minutes분 이내에 시작한 스팬만)"""
+    min_start = (
+        time.time_ns() - int(since_minutes * 60 * 1e9) if since_minutes else None
+    )
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            span = json.loads(line)
+            if min_start is None or span["startTimeUnixNano"] >= min_start:
+                spans.append(span)
+    return spans
+
+
+def group_traces(spans):
+    """traceId별 스팬 목록"""
+    traces = defaultdict(list)
+    for span in spans:
+        traces[span["traceId"]].append(span)
+    return dict(traces)
+
+
+def distribution(values):
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50), 1),
+        "p95_ms": round(percentile(values, 95), 1),
+        "p99_ms": round(percentile(values, 99), 1),
+        "max_ms": round(max(values, default=0.0), 1),
+    }
+
+
+def summarize(traces, slowest=5):
+    """요청 종류(루트 스팬 이름)별 전체 지연과 단계별 지연 분포
+
+    단계의 share는 그 단계 소요 시간 합이 전체 요청 시간 합에서 차지하는 비율
+    (검색과 의도 분석처럼 병렬 단계가 있으면 합이 1을 넘을 수 있음)
+    """
+    by_root = defaultdict(list)
+    for trace_id, spans in traces.items():
+        roots = [span for span in spans if not span["parentSpanId"]]
+        if roots:
+            by_root[roots[0]["name"]].append((roots[0], spans))
+
+    report = {}
+    for root_name, items in by_root.items():
+        totals = [root["durationMs"] for root, _ in items]
+        stage_durations = defaultdict(list)
+        for root, spans in items:
+            for span in spans:
+                if span is not root:
+                    stage_durations[span["name"]].append(span["durationMs"])
+
+        total_sum = sum(totals) or 1.0
+        stages = {
+            name: {
+                **distribution(durations),
+                "share": round(sum(durations) / total_sum, 3),
+            }
+            for name, durations in sorted(
+                stage_durations.items(), key=lambda item: -sum(item[1])
+            )
+        }
+        cache_hits = [
+            root["attributes"].get("cache_hit")
+            for root, _ in items
+            if root["attributes"].get("cache_hit") is not None
+        ]
+        slowest_items = sorted(items, key=lambda item: -item[0]["durationMs"])[:slowest]
+        report[root_name] = {
+            "total": distribution(totals),
+            "cache_hit_rate": (
+                round(sum(cache_hits) / len(cache_hits), 3) if cache_hits else None
+            ),
+            "errors": sum(
+                1
+                for _, spans in items
+                if any(span["status"]["code"] == "ERROR" for span in spans)
+            ),
+            "stages": stages,
+            "slowest": [
+                {
+                    "trace_id": root["traceId"],
+                    "total_ms": root["durationMs"],
+                    "query": root["attributes"].get("query"),
+                    "stages": {
+                        span["name"]: span["durationMs"]
+                        for span in spans
+                        if span["parentSpanId"] == root["spanId"]
+                    },
+                }
+                for root, spans in slowest_items
+            ],
+        }
+    return report
+
+
+def print_report(report):
+    for root_name, summary in report.items():
+        total = summary["total"]
+        print(
+            f"[{root_name}] {total['count']}건, p50 {total['p50_ms']}ms, "
+            f"p95 {total['p95_ms']}ms, p99 {total['p99_ms']}ms, "
+            f"최대 {total['max_ms']}ms (오류 {summary['errors']}건)"
+        )
+        if summary["cache_hit_rate"] is not None:
+            print(f"  캐시 적중률: {summary['cache_hit_rate']:.1%}")
+        print(
+            f"  {'단계':<20} {'건수':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'비중':>7}"
+        )
+        for name, stage in summary["stages"].items():
+            print(
+                f"  {name:<20} {stage['count']:>6} {stage['p50_ms']:>9} "
+                f"{stage['p95_ms']:>9} {stage['p99_ms']:>9} {stage['share']:>7.1%}"
+            )
+        print("  가장 느린 요청:")
+        for item in summary["slowest"]:
+            stages = ", ".join(
+                f"{name} {elapsed:.0f}ms" for name, elapsed in item["stages"].items()
+            )
+            print(f"  - {item['total_ms']:.0f}ms {item['query']!r}: {stages}")
+
+
+def _otlp_value(value):
+    """속성 값을 OTLP JSON의 AnyValue 형식으로 변환"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans, service_name="newsbot"):
+    """스팬 목록을 OTLP/JSON(ExportTraceServiceRequest) 형식으로 변환
+
+    OpenTelemetry Collector의 otlpjsonfile 수신기나 OTLP/HTTP 엔드포인트로 보낼 수 있음
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "newsbot.tracing"},
+                        "spans": [
+                            {
+                                "traceId": span["traceId"],
+                                "spanId": span["spanId"],
+                                "parentSpanId": span["parentSpanId"] or "",
+                                "name": span["name"],
+                                "kind": 1,
+                                "startTimeUnixNano": str(span["startTimeUnixNano"]),
+                                "endTimeUnixNano": str(span["endTimeUnixNano"]),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in span["attributes"].items()
+                                    if value is not None
+                                ],
+                                "status": {
+                                    "code": (
+                                        2 if span["status"]["code"] == "ERROR" else 1
+                                    ),
+                                    "message": span["status"]["message"] or "",
+                                },
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="챗봇 요청 트레이스 분석")
+    parser.add_argument(
+        "--path",
+        default=os.getenv("TRACE_EXPORT_PATH", os.path.join(".cache", "traces.jsonl")),
+        help="트레이스 JSONL 경로",
+    )
+    parser.add_argument("--since-minutes", type=float, help="최근 N분 트레이스만 사용")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    summary_parser = subparsers.add_parser("summary", help="단계별 지연 분포 요약")
+    summary_parser.add_argument("--slowest", type=int, default=5)
+    summary_parser.add_argument("--output", help="결과 JSON 저장 경로")
+
+    otlp_parser = subparsers.add_parser("otlp", help="OTLP/JSON 형식으로 변환")
+    otlp_parser.add_argument("--output", required=True, help="OTLP JSON 저장 경로")
+    otlp_parser.add_argument("--service-name", default="newsbot")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    spans = load_spans(args.path, args.since_minutes)
+    if not spans:
+        print(f"트레이스가 없습니다: {args.path}")
+        return
+
+    if args.command == "summary":
+        report = summarize(group_traces(spans), args.slowest)
+        print_report(report)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(to_otlp(spans, args.service_name), f, ensure_ascii=False)
+        print(f"스팬 {len(spans)}개를 {args.output}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# 현재 실행 중인 스팬 (asyncio 작업은 생성 시점의 값을 물려받으므로 병렬 단계도 같은 부모를 가짐)
+_current_span = contextvars.ContextVar("newsbot_current_span", default=None)
+
+
+class Span:
+    """요청 처리 한 구간의 시작/종료 시각과 속성
+
+    필드 이름은 OpenTelemetry 스팬 형식(traceId, spanId, 시각은 Unix 나노초)을 따름
+    """
+
+    def __init__(self, name, trace, parent=None, attributes=None):
+        self.name = name
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.status = "ok"
+        self.error = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self):
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return round((end_ns - self.start_ns) / 1e6, 1)
+
+    def end(self, error=None):
+        """스팬 종료 (두 번째 호출부터는 무시). 루트 스팬이 끝나면 트레이스를 내보냄"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status = "error"
+            self.error = f"{type(error).__name__}: {error}"[:200]
+        self.trace.on_span_end(self)
+
+    def to_dict(self):
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": self.duration_ms,
+            "attributes": self.attributes,
+            "status": {"code": self.status.upper(), "message": self.error},
+        }
+
+
+class _NoopSpan:
+    """트레이스 밖에서 호출된 코드가 스팬 API를 그대로 쓸 수 있도록 하는 빈 스팬"""
+
+    span_id = None
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, **attributes):
+        pass
+
+    def end(self, error=None):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """요청 하나의 스팬 모음"""
+
+    def __init__(self, tracer, sampled):
+        self.tracer = tracer
+        self.sampled = sampled
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.root = None
+
+    def on_span_end(self, span):
+        self.spans.append(span)
+        if span is self.root:
+            self.tracer.finish(self)
+
+    def to_dicts(self):
+        """시작 시각 순 스팬 목록 (아직 끝나지 않은 스팬은 제외)"""
+        return [span.to_dict() for span in sorted(self.spans, key=lambda s: s.start_ns)]
+
+
+class Tracer:
+    """트레이스 생성과 내보내기
+
+    - 끝난 트레이스는 최근 max_recent개를 메모리에 보관 (디버그 화면용)
+    - 샘플링된 트레이스는 스팬 한 개를 한 줄로 하는 JSONL 파일(TRACE_EXPORT_PATH)에 추가.
+      TRACE_SAMPLE_RATE가 0이면 파일에 쓰지 않음
+    - 파일이 max_bytes를 넘으면 .1로 옮기고 새 파일에 기록
+    """
+
+    def __init__(self, path=None, sample_rate=None, max_bytes=None, max_recent=50):
+        self.path = path or os.getenv(
+            "TRACE_EXPORT_PATH", os.path.join(".cache", "traces.jsonl")
+        )
+        self.sample_rate = (
+            sample_rate
+            if sample_rate is not None
+            else float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+        )
+        self.max_bytes = max_bytes or int(
+            os.getenv("TRACE_MAX_BYTES", str(50 * 1024 * 1024))
+        )
+        self.recent = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+    def start_trace(self, name, **attributes):
+        """새 트레이스의 루트 스팬 시작 (끝낼 때 span.end() 호출)"""
+        trace = Trace(self, sampled=random.random() < self.sample_rate)
+        trace.root = Span(name, trace, attributes=attributes)
+        return trace.root
+
+    def finish(self, trace):
+        spans = trace.to_dicts()
+        with self._lock:
+            self.recent.append(spans)
+        if trace.sampled:
+            self._export(spans)
+
+    def find(self, trace_id):
+        """최근 트레이스 중 trace_id의 스팬 목록 (없거나 아직 끝나지 않았으면 None)"""
+        with self._lock:
+            for spans in reversed(self.recent):
+                if spans and spans[0]["traceId"] == trace_id:
+                    return spans
+        return None
+
+    def _export(self, spans):
+        lines = "".join(json.dumps(span, ensure_ascii=False) + "\n" for span in spans)
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                if (
+                    os.path.exists(self.path)
+                    and os.path.getsize(self.path) > self.max_bytes
+                ):
+                    os.replace(self.path, self.path + ".1")
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except OSError as e:
+            print(f"트레이스 기록 실패: {e}")
+
+
+def span_rows(spans):
+    """스팬 목록을 부모 다음에 자식이 오는 표 행으로 변환
+
+    이름은 깊이만큼 들여쓰고, 시작 시각은 트레이스 시작부터의 ms로 표시
+    """
+    by_id = {item["spanId"]: item for item in spans}
+    children = {}
+    for item in spans:
+        parent_id = item["parentSpanId"] if item["parentSpanId"] in by_id else None
+        children.setdefault(parent_id, []).append(item)
+    if not spans:
+        return []
+    origin = min(item["startTimeUnixNano"] for item in spans)
+
+    rows = []
+
+    def visit(item, depth):
+        rows.append(
+            {
+                "단계": "  " * depth + item["name"],
+                "시작(ms)": round((item["startTimeUnixNano"] - origin) / 1e6, 1),
+                "소요(ms)": item["durationMs"],
+                "상태": item["status"]["code"],
+                "속성": ", ".join(
+                    f"{key}={value}"
+                    for key, value in item["attributes"].items()
+                    if key != "query"
+                ),
+            }
+        )
+        for child in sorted(
+            children.get(item["spanId"], []), key=lambda s: s["startTimeUnixNano"]
+        ):
+            visit(child, depth + 1)
+
+    for root in sorted(children.get(None, []), key=lambda s: s["startTimeUnixNano"]):
+        visit(root, 0)
+    return rows
+
+
+def current_span():
+    """현재 스팬 (트레이스 밖이면 빈 스팬)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def start_span(name, parent=None, **attributes):
+    """parent(기본값은 현재 스팬)의 자식 스팬 시작. 트레이스 밖이면 빈 스팬 반환"""
+    parent = parent or _current_span.get()
+    if parent is None or isinstance(parent, _NoopSpan):
+        return NOOP_SPAN
+    return Span(name, parent.trace, parent, attributes)
+
+
+@contextmanager
+def activate(span):
+    """with 블록 안에서 span을 현재 스팬으로 사용 (종료는 호출한 쪽에서 처리)"""
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name, **attributes):
+    """자식 스팬을 열고 with 블록이 끝나면 종료 (예외/취소 시 오류로 기록)"""
+    child = start_span(name, **attributes)
+    if child is NOOP_SPAN:
+        yield child
+        return
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.end(error=e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+tracer = Tracer()